@@ -0,0 +1,162 @@
+"""ISO 6346 validator benchmark: IDs per second, vectorised and per string.
+
+Generates a synthetic gate feed (modules/iso6346) with a share of corrupted
+IDs: a wrong check digit, a letter in the serial, a missing character, or
+separators. Then it times:
+
+- vectorised: iso6346.validate() over the whole batch, the median over
+  --repeat runs
+- loop: a plain Python check digit per string on a sample, for scale
+- stream: iso6346.validate_stream() over the feed written as CSV, which
+  includes parsing and building the result tables
+
+The error code counts are recorded too. They are deterministic for a seed,
+so any change is reported as a regression, as is a throughput drop beyond
+--threshold:
+
+    python benchmarks/bench_iso6346.py -n 2000000 -o before.json
+    python benchmarks/bench_iso6346.py -n 2000000 -o after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules import iso6346  # noqa: E402
+
+OWNERS = ['MAEU', 'MSCU', 'CMAU', 'HLCU', 'TEMU', 'OOLU', 'EGHU', 'CSNU']
+
+
+def feed(n, corrupt, seed):
+    # n IDs with correct check digits, then a share `corrupt` damaged
+    rng = np.random.default_rng(seed)
+    owners = np.array(OWNERS)[rng.integers(len(OWNERS), size=n)]
+    serials = np.char.zfill(rng.integers(1_000_000, size=n).astype(str), 6)
+    prefix = np.char.add(owners, serials)
+    ids = np.char.add(prefix, iso6346.check_digit(prefix).astype(str)).astype(object)
+    damaged = np.flatnonzero(rng.random(n) < corrupt)
+    kinds = rng.integers(4, size=len(damaged))
+    for i, kind in zip(damaged, kinds):
+        s = ids[i]
+        if kind == 0:
+            ids[i] = s[:10] + str((int(s[10]) + 1) % 10)
+        elif kind == 1:
+            ids[i] = s[:6] + 'O' + s[7:]
+        elif kind == 2:
+            ids[i] = s[:10]
+        else:
+            ids[i] = f'{s[:4]} {s[4:10]}-{s[10]}'.lower()
+    return ids.astype(str)
+
+
+def loop_check(ids):
+    # The per-string version, as a gate system would write it
+    values = {c: v for c, v in zip('ABCDEFGHIJKLMNOPQRSTUVWXYZ', [10] + list(range(12, 22)) + list(range(23, 33))
+                                   + list(range(34, 39)))}
+    values.update({str(d): d for d in range(10)})
+    ok = 0
+    for raw in ids:
+        s = raw.replace(' ', '').replace('-', '').upper()
+        if len(s) != 11 or not s[10].isdigit():
+            continue
+        try:
+            total = sum(values[c] << i for i, c in enumerate(s[:10]))
+        except KeyError:
+            continue
+        ok += total % 11 % 10 == int(s[10])
+    return ok
+
+
+def timed(f, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = f()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--ids', type=int, default=1_000_000, help='IDs in the feed')
+    parser.add_argument('--corrupt', type=float, default=0.05, help='share of damaged IDs')
+    parser.add_argument('--loop-sample', type=int, default=200_000, help='IDs timed with the per-string loop')
+    parser.add_argument('--chunk-rows', type=int, default=250_000)
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per vectorised timing')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default='bench_iso6346.json', help='where to write the JSON results')
+    parser.add_argument('--compare', help='previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative throughput drop reported as a regression (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    ids = feed(args.ids, args.corrupt, args.seed)
+    print(f"{len(ids):,} IDs generated in {time.perf_counter() - start:.2f} s\n")
+
+    (codes, _), vector_s = timed(lambda: iso6346.validate(ids), args.repeat)
+    sample = ids[:args.loop_sample]
+    _, loop_s = timed(lambda: loop_check(sample), 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'feed.csv'
+        pd.DataFrame({'Container': ids}).to_csv(path, index=False)
+        _, stream_s = timed(lambda: sum(len(f) for f in iso6346.validate_stream(path, 'Container', args.chunk_rows)),
+                            args.repeat)
+
+    rates = {
+        'vectorised': int(len(ids) / vector_s),
+        'loop': int(len(sample) / loop_s),
+        'stream': int(len(ids) / stream_s),
+    }
+    counts = {iso6346.ERRORS[code]: int(count) for code, count in enumerate(np.bincount(codes, minlength=len(iso6346.ERRORS)))}
+    for name, rate in rates.items():
+        print(f"{name:12s} {rate:14,d} IDs/s")
+    print(f"\nvectorised is {rates['vectorised'] / rates['loop']:.0f}x the loop")
+    for error, count in counts.items():
+        print(f"  {error:30s} {count:10,d}")
+
+    Path(args.output).write_text(json.dumps({
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'ids': args.ids,
+        'corrupt': args.corrupt,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'ids_per_s': rates,
+        'codes': counts,
+    }, indent=2) + '\n', encoding='utf-8')
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        regressed = False
+        for name, new in rates.items():
+            old = baseline['ids_per_s'].get(name)
+            if not old:
+                continue
+            change = (new - old) / old
+            slower = -change > args.threshold
+            regressed |= slower
+            print(f"{name:12s} {old:14,d} -> {new:14,d} IDs/s {change:+7.0%}{' !' if slower else ''}")
+        if baseline.get('ids') == args.ids and baseline.get('seed') == args.seed and baseline['codes'] != counts:
+            print("error code counts changed")
+            regressed = True
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
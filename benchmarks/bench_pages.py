@@ -0,0 +1,153 @@
+"""Headless render benchmark for every page's show().
+
+Each page is driven through Streamlit's AppTest harness, with no browser or
+server involved. Two runs are recorded per page:
+
+- cold: process-wide caches cleared and the page module re-imported
+- warm: median of --repeat reruns with caches populated
+
+Third-party imports and the AppTest runtime are warmed up first, so cold numbers cover the page itself and not interpreter
+startup.
+
+For each page the benchmark also records peak Python memory during a cold
+run (tracemalloc) and the number of Plotly figures and dataframe elements
+rendered. Results are written as JSON so runs can be compared:
+
+    python benchmarks/bench_pages.py -o before.json
+    python benchmarks/bench_pages.py -o after.json --compare before.json
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def page_modules():
+    return sorted(
+        path.stem for path in (ROOT / 'modules').glob('*.py')
+        if '\ndef show(' in path.read_text(encoding='utf-8')
+    )
+
+
+def _page_script(module_name):
+    import importlib
+
+    importlib.import_module(f'modules.{module_name}').show()
+
+
+def _warm_up_script():
+    import pandas as pd
+    import plotly.graph_objects as go
+    import streamlit as st
+
+    st.dataframe(pd.DataFrame({'a': [1]}))
+    st.plotly_chart(go.Figure(go.Bar(x=[1], y=[1])))
+
+
+def _reset(module_name):
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    sys.modules.pop(f'modules.{module_name}', None)
+
+
+def _run(app):
+    start = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    return elapsed
+
+
+def bench_page(module_name, repeat, timeout):
+    app = AppTest.from_function(_page_script, args=(module_name,), default_timeout=timeout)
+
+    _reset(module_name)
+    tracemalloc.start()
+    _run(app)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    _reset(module_name)
+    cold = _run(app)
+    warm = [_run(app) for _ in range(repeat)]
+
+    return {
+        'cold_ms': round(cold * 1e3, 2),
+        'warm_ms': round(statistics.median(warm) * 1e3, 2),
+        'warm_min_ms': round(min(warm) * 1e3, 2),
+        'peak_mem_kib': round(peak / 1024, 1),
+        'figures': len(app.get('plotly_chart')),
+        'dataframes': len(app.dataframe),
+    }
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+    print(f"\n{'page':24s} {'metric':8s} {'before':>10s} {'after':>10s} {'change':>8s}")
+    for page, result in current['pages'].items():
+        before = baseline['pages'].get(page)
+        if before is None:
+            continue
+        for metric in ('cold_ms', 'warm_ms', 'peak_mem_kib'):
+            old, new = before[metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            flag = ' !' if change > threshold else ''
+            print(f"{page:24s} {metric[:-3] if metric.endswith('_ms') else 'mem':8s} {old:10.1f} {new:10.1f} {change:+7.0%}{flag}")
+            if change > threshold:
+                regressions.append((page, metric, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', default='bench_pages.json', help='where to write the JSON results')
+    parser.add_argument('-n', '--repeat', type=int, default=10, help='warm reruns per page')
+    parser.add_argument('-p', '--page', action='append', help='only benchmark this module (repeatable)')
+    parser.add_argument('--timeout', type=float, default=60, help='per-run AppTest timeout in seconds')
+    parser.add_argument('--compare', help='previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown reported as a regression (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    results = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'repeat': args.repeat,
+        'pages': {},
+    }
+    # Page deprecation warnings are logged on every run; keep the table readable
+    logging.disable(logging.WARNING)
+    AppTest.from_function(_warm_up_script).run()
+    print(f"{'page':24s} {'cold ms':>9s} {'warm ms':>9s} {'peak KiB':>10s} {'figs':>5s} {'dfs':>4s}")
+    for module_name in args.page or page_modules():
+        result = bench_page(module_name, args.repeat, args.timeout)
+        results['pages'][module_name] = result
+        print(f"{module_name:24s} {result['cold_ms']:9.1f} {result['warm_ms']:9.1f} "
+              f"{result['peak_mem_kib']:10.1f} {result['figures']:5d} {result['dataframes']:4d}")
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Cold-start benchmark and import-time profile for the app.
+
+Each sample runs in a fresh interpreter, as a newly started worker would.
+Three timings are recorded per sample:
+
+- shell: importing streamlit and the modules the app script imports
+- first_run: the first run of the app script (landing page), including any
+  imports deferred until a page needs them
+- process: wall time of the whole subprocess, interpreter start included
+
+The median over --repeat samples is written as JSON and can be compared
+against an earlier run, as with bench_pages.py:
+
+    python benchmarks/bench_startup.py -o before.json
+    python benchmarks/bench_startup.py -o after.json --compare before.json
+
+--importtime prints a ``python -X importtime`` breakdown of the same
+imports instead, totalled by top-level package, plus the slowest modules:
+
+    python benchmarks/bench_startup.py --importtime
+"""
+import argparse
+import ast
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'maritime_101.py'
+
+
+def app_imports():
+    # Top-level imports of the app script, e.g. ['streamlit', 'modules.search']
+    names = []
+    for node in ast.parse(APP.read_text(encoding='utf-8')).body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names += [f'{node.module}.{alias.name}' if node.module == 'modules' else node.module
+                      for alias in node.names]
+    return names
+
+
+def first_page():
+    for node in ast.parse(APP.read_text(encoding='utf-8')).body:
+        if isinstance(node, ast.Assign) and [ast.unparse(t) for t in node.targets] == ['PAGES']:
+            return f'modules.{next(iter(ast.literal_eval(node.value).values()))}'
+    raise LookupError(f'No PAGES registry in {APP}')
+
+
+def _child(imports, page_only):
+    # Runs in the fresh interpreter; prints its timings as JSON
+    import importlib
+
+    sys.path.insert(0, str(ROOT))
+    start = time.perf_counter()
+    for name in imports:
+        importlib.import_module(name)
+    shell = time.perf_counter() - start
+    if page_only:
+        # For -X importtime: the landing page's imports, without the AppTest harness
+        importlib.import_module(first_page())
+        return
+
+    logging.disable(logging.WARNING)
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP), default_timeout=120)
+    start = time.perf_counter()
+    app.run()
+    first_run = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    print(json.dumps({'shell_ms': shell * 1e3, 'first_run_ms': first_run * 1e3}))
+
+
+def _spawn(*flags, page_only=False):
+    command = [sys.executable, *flags, __file__, *(['--page-only'] if page_only else []), '--child', *app_imports()]
+    start = time.perf_counter()
+    done = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True)
+    return done, time.perf_counter() - start
+
+
+def sample():
+    done, elapsed = _spawn()
+    result = json.loads(done.stdout.strip().splitlines()[-1])
+    result['process_ms'] = elapsed * 1e3
+    return result
+
+
+def importtime(top):
+    done, _ = _spawn('-X', 'importtime', page_only=True)
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    rows = []
+    for line in done.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    packages = defaultdict(int)
+    for name, self_us, _ in rows:
+        packages[name.strip().split('.')[0]] += self_us
+    total = sum(packages.values())
+    print(f"{'package':28s} {'self ms':>9s} {'share':>6s}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:28s} {self_us / 1e3:9.1f} {self_us / total:6.0%}")
+    print(f"{'total':28s} {total / 1e3:9.1f}")
+
+    print(f"\n{'module':50s} {'cumulative ms':>14s}")
+    for name, _, cumulative_us in sorted(rows, key=lambda row: -row[2])[:top]:
+        print(f"{name[:50]:50s} {cumulative_us / 1e3:14.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', default='bench_startup.json', help='where to write the JSON results')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='fresh-interpreter samples')
+    parser.add_argument('--compare', help='previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown reported as a regression (default 0.2 = 20%%)')
+    parser.add_argument('--importtime', action='store_true', help='print an import-time breakdown and exit')
+    parser.add_argument('--top', type=int, default=20, help='rows shown by --importtime')
+    parser.add_argument('--child', nargs='*', help=argparse.SUPPRESS)
+    parser.add_argument('--page-only', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        _child(args.child, args.page_only)
+        return 0
+    if args.importtime:
+        importtime(args.top)
+        return 0
+
+    samples = [sample() for _ in range(args.repeat)]
+    metrics = {key: round(statistics.median(s[key] for s in samples), 1) for key in samples[0]}
+    results = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'startup': metrics,
+    }
+    for key, value in metrics.items():
+        print(f"{key[:-3]:12s} {value:9.1f} ms")
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))['startup']
+        regressed = False
+        for key, new in metrics.items():
+            old = baseline.get(key)
+            if old:
+                change = (new - old) / old
+                regressed |= change > args.threshold
+                print(f"{key[:-3]:12s} {old:9.1f} -> {new:9.1f} ms {change:+7.0%}{' !' if change > args.threshold else ''}")
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
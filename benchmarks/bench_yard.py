@@ -0,0 +1,103 @@
+"""Yard re-handle simulator benchmark: throughput and re-handles per policy.
+
+Replays one synthetic workload (modules/yard_sim.workload) through each
+stacking policy and records:
+
+- moves: arrivals, pickups and re-handles (lift and set down)
+- moves_per_min: replay throughput, the median over --repeat runs
+- rehandle_pct: re-handles per 100 pickups
+- peak_fill_pct and overflow: how full the block got
+
+Results are written as JSON and can be compared against an earlier run. A
+throughput drop beyond --threshold, or any change in re-handle counts
+(the replay is deterministic for a seed), is reported as a regression:
+
+    python benchmarks/bench_yard.py -n 200000 -o before.json
+    python benchmarks/bench_yard.py -n 200000 -o after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules import yard_sim  # noqa: E402
+
+
+def bench_policy(containers, policy, block_shape, repeat, seed):
+    runs = [yard_sim.simulate(containers, policy, yard_sim.Block(*block_shape), seed) for _ in range(repeat)]
+    result = dict(runs[0])
+    result['moves_per_min'] = int(statistics.median(r['moves_per_min'] for r in runs))
+    result['seconds'] = round(statistics.median(r['seconds'] for r in runs), 3)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--containers', type=int, default=100_000, help='containers in the workload')
+    parser.add_argument('-p', '--policies', default=','.join(yard_sim.POLICIES),
+                        help='comma-separated policies to run')
+    parser.add_argument('--block', default='40x6x5', help='bays x rows x tiers (default 40x6x5)')
+    parser.add_argument('--occupancy', type=float, default=0.6, help='mean block fill the workload aims for')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='replays per policy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default='bench_yard.json', help='where to write the JSON results')
+    parser.add_argument('--compare', help='previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative throughput drop reported as a regression (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    block_shape = tuple(int(x) for x in args.block.lower().split('x'))
+    start = time.perf_counter()
+    containers = yard_sim.workload(args.containers, yard_sim.Block(*block_shape), args.occupancy, seed=args.seed)
+    print(f"{len(containers)} containers generated in {time.perf_counter() - start:.2f} s\n")
+
+    print(f"{'policy':12s} {'moves':>9s} {'moves/min':>12s} {'rehandle%':>10s} {'peak fill%':>11s} {'overflow':>9s}")
+    results = {}
+    for policy in args.policies.split(','):
+        result = bench_policy(containers, policy, block_shape, args.repeat, args.seed)
+        results[policy] = result
+        print(f"{policy:12s} {result['moves']:9d} {result['moves_per_min']:12,d} {result['rehandle_pct']:10.1f} "
+              f"{result['peak_fill_pct']:11.1f} {result['overflow']:9d}")
+
+    Path(args.output).write_text(json.dumps({
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'containers': args.containers,
+        'block': args.block,
+        'occupancy': args.occupancy,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'policies': results,
+    }, indent=2) + '\n', encoding='utf-8')
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))['policies']
+        regressed = False
+        for policy, new in results.items():
+            old = baseline.get(policy)
+            if not old:
+                continue
+            change = (new['moves_per_min'] - old['moves_per_min']) / old['moves_per_min']
+            slower = -change > args.threshold
+            changed = new['rehandles'] != old['rehandles']
+            regressed |= slower or changed
+            note = ' !' if slower else ''
+            if changed:
+                note += f"  rehandles {old['rehandles']} -> {new['rehandles']}"
+            print(f"{policy:12s} {old['moves_per_min']:12,d} -> {new['moves_per_min']:12,d} moves/min "
+                  f"{change:+7.0%}{note}")
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""Local load test: concurrent reader sessions against one app process.
+
+Starts the app with ``streamlit run`` on a free local port, then opens N
+simulated reader sessions against it. Each session is a websocket client
+that speaks the same protobuf protocol as the browser. It opens the app,
+then keeps switching the sidebar radio to a random other page, with an
+exponentially distributed think time between page views. A page view is
+timed from sending the rerun request to the server's script-finished
+message, so it covers script execution, serialization and transport.
+
+The session count is stepped up (--sessions 1,2,4,...). Each step records:
+
+- p50/p95/p99 page-view latency and throughput
+- server CPU use (100% = one core) and RSS at the end of the step
+- failed page views (script exceptions or timeouts)
+
+Every page is visited once before the first step, so steps measure a warm
+server. A step "collapses" when its p95 exceeds --collapse times the
+single-session p95, or any page view fails. The run stops at the first
+collapsed step unless --keep-going is passed:
+
+    python benchmarks/load_test.py --sessions 1,2,4,8,16,32 --duration 30 --think 2
+
+The clients share this process and its event loop, so their own CPU use is
+reported as well. If it nears 100% of a core, the harness rather than the
+server is the bottleneck. Server CPU and RSS are read from /proc (Linux).
+Needs the ``websockets`` package, which the app itself does not use
+(``pip install websockets``).
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import websockets
+except ImportError:
+    sys.exit("benchmarks/load_test.py needs the websockets package: pip install websockets")
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'maritime_101.py'
+NAV_LABEL = 'Select Section:'
+
+
+class Server:
+    def __init__(self, port=None):
+        self.port = port or _free_port()
+        self.process = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', str(APP),
+             '--server.headless', 'true', '--server.port', str(self.port),
+             '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(f'http://127.0.0.1:{self.port}/_stcore/health', timeout=1).read()
+                return self
+            except OSError:
+                if self.process.poll() is not None:
+                    break
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError('streamlit server did not come up')
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.wait(10)
+
+    @property
+    def url(self):
+        return f'ws://127.0.0.1:{self.port}/_stcore/stream'
+
+    def cpu_seconds(self):
+        try:
+            with open(f'/proc/{self.process.pid}/stat', encoding='ascii') as f:
+                # utime and stime follow the parenthesised command name
+                fields = f.read().rsplit(')', 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+        except OSError:
+            return None
+
+    def rss_mib(self):
+        try:
+            with open(f'/proc/{self.process.pid}/status', encoding='ascii') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def percentile(values, q):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+class Session:
+    # One reader: a websocket connection and the widget ids the app sent it
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.page_hash = ''
+        self.radio = None
+        self.latencies = []
+        self.errors = []
+
+    async def view(self, ws, page=None):
+        message = BackMsg()
+        message.rerun_script.query_string = ''
+        message.rerun_script.page_script_hash = self.page_hash
+        if page is not None:
+            message.rerun_script.widget_states.widgets.append(WidgetState(id=self.radio.id, string_value=page))
+
+        start = time.perf_counter()
+        await ws.send(message.SerializeToString())
+        try:
+            error = await asyncio.wait_for(self._receive(ws), self.timeout)
+        except asyncio.TimeoutError:
+            error = f'timed out after {self.timeout:g} s'
+        if error:
+            self.errors.append(error)
+        else:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def _receive(self, ws):
+        error = None
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await ws.recv())
+            kind = forward.WhichOneof('type')
+            if kind == 'new_session':
+                self.page_hash = forward.new_session.page_script_hash
+            elif kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+                element = forward.delta.new_element
+                if element.WhichOneof('type') == 'radio' and element.radio.label == NAV_LABEL:
+                    self.radio = element.radio
+                elif element.WhichOneof('type') == 'exception':
+                    error = f'{element.exception.type}: {element.exception.message}'
+            elif kind == 'script_finished':
+                return error
+
+    async def run(self, deadline, think, rng, tour=False):
+        async with websockets.connect(self.url, subprotocols=['streamlit'], max_size=None) as ws:
+            await self.view(ws)
+            if self.radio is None:
+                return
+            pages = list(self.radio.options)
+            if tour:
+                for page in pages:
+                    await self.view(ws, page)
+                return
+            current = pages[0]
+            while True:
+                pause = rng.expovariate(1 / think) if think else 0
+                if time.monotonic() + pause >= deadline:
+                    return
+                await asyncio.sleep(pause)
+                current = rng.choice([p for p in pages if p != current])
+                await self.view(ws, current)
+
+
+async def _run_sessions(server, count, duration, think, seed, timeout):
+    deadline = time.monotonic() + duration
+    sessions = [Session(server.url, timeout) for _ in range(count)]
+
+    async def start(i, session):
+        # Stagger arrivals across the first think period
+        await asyncio.sleep(random.Random(seed + i).uniform(0, think))
+        await session.run(deadline, think, random.Random(seed * 1000 + i))
+
+    await asyncio.gather(*(start(i, s) for i, s in enumerate(sessions)))
+    return sessions
+
+
+def run_step(server, count, duration, think, seed, timeout):
+    server_cpu = server.cpu_seconds()
+    client_cpu = resource.getrusage(resource.RUSAGE_SELF)
+    wall = time.perf_counter()
+    sessions = asyncio.run(_run_sessions(server, count, duration, think, seed, timeout))
+    wall = time.perf_counter() - wall
+    client_usage = resource.getrusage(resource.RUSAGE_SELF)
+    client_cpu = (client_usage.ru_utime + client_usage.ru_stime) - (client_cpu.ru_utime + client_cpu.ru_stime)
+
+    ms = [t * 1e3 for s in sessions for t in s.latencies]
+    errors = [e for s in sessions for e in s.errors]
+    after = server.cpu_seconds()
+    return {
+        'sessions': count,
+        'views': len(ms),
+        'errors': len(errors),
+        'throughput_per_s': round(len(ms) / wall, 2),
+        'p50_ms': round(percentile(ms, 50), 1),
+        'p95_ms': round(percentile(ms, 95), 1),
+        'p99_ms': round(percentile(ms, 99), 1),
+        'mean_ms': round(statistics.fmean(ms), 1) if ms else float('nan'),
+        'server_cpu_pct': round(100 * (after - server_cpu) / wall, 1) if after is not None else None,
+        'client_cpu_pct': round(100 * client_cpu / wall, 1),
+        'server_rss_mib': server.rss_mib(),
+        'first_error': errors[0] if errors else None,
+    }
+
+
+def _fmt(value, width, spec='.1f'):
+    return f'{value:{width}{spec}}' if value is not None else f'{"-":>{width}s}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--sessions', default='1,2,4,8,16',
+                        help='comma-separated concurrent session counts to step through')
+    parser.add_argument('-d', '--duration', type=float, default=20, help='seconds per step')
+    parser.add_argument('-t', '--think', type=float, default=1.0, help='mean think time between page views, seconds')
+    parser.add_argument('--collapse', type=float, default=5.0,
+                        help='p95 growth over the single-session p95 that counts as collapse (default 5x)')
+    parser.add_argument('--keep-going', action='store_true', help='run every step even after a collapse')
+    parser.add_argument('--timeout', type=float, default=30, help='per-page-view timeout in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--port', type=int, help='server port (default: any free port)')
+    parser.add_argument('-o', '--output', default='bench_load.json', help='where to write the JSON results')
+    args = parser.parse_args(argv)
+
+    steps = sorted({int(n) for n in args.sessions.split(',')})
+    results, collapsed, baseline = [], None, None
+    with Server(args.port) as server:
+        rss_start = server.rss_mib()
+        # Warm the server: every page once, not recorded
+        asyncio.run(Session(server.url, args.timeout * 4).run(0, 0, None, tour=True))
+        rss_warm = server.rss_mib()
+        if steps[0] != 1:
+            # The single-session baseline that collapse is measured against
+            baseline = run_step(server, 1, args.duration, args.think, args.seed, args.timeout)
+
+        print(f"{'sessions':>8s} {'views':>6s} {'err':>4s} {'views/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} "
+              f"{'p99 ms':>8s} {'srv cpu%':>8s} {'cli cpu%':>8s} {'rss MiB':>8s}")
+        for count in steps:
+            step = run_step(server, count, args.duration, args.think, args.seed, args.timeout)
+            baseline = baseline or step
+            step['collapsed'] = bool(step['errors']) or step['p95_ms'] > args.collapse * baseline['p95_ms']
+            results.append(step)
+            print(f"{count:8d} {step['views']:6d} {step['errors']:4d} {step['throughput_per_s']:8.2f} "
+                  f"{step['p50_ms']:8.1f} {step['p95_ms']:8.1f} {step['p99_ms']:8.1f} "
+                  f"{_fmt(step['server_cpu_pct'], 8)} {step['client_cpu_pct']:8.1f} {_fmt(step['server_rss_mib'], 8)}"
+                  f"{'  collapsed' if step['collapsed'] else ''}")
+            if step['collapsed'] and collapsed is None:
+                collapsed = count
+                if step['first_error']:
+                    print(f"         first error: {step['first_error']}")
+                if not args.keep_going:
+                    break
+        rss_end = server.rss_mib()
+
+    sustained = max((s['sessions'] for s in results if not s['collapsed']), default=0)
+    if rss_start is not None:
+        print(f"\nserver RSS {rss_start:.1f} MiB at start, {rss_warm:.1f} warm, {rss_end:.1f} at end")
+    if collapsed is None:
+        print(f"no collapse up to {steps[-1]} sessions")
+    else:
+        print(f"latency collapses at {collapsed} sessions; last sustained step: {sustained}")
+
+    Path(args.output).write_text(json.dumps({
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'duration_s': args.duration,
+        'think_s': args.think,
+        'collapse_factor': args.collapse,
+        'baseline_p95_ms': baseline['p95_ms'],
+        'server_rss_mib': {'start': rss_start, 'warm': rss_warm, 'end': rss_end},
+        'collapsed_at': collapsed,
+        'sustained_sessions': sustained,
+        'steps': results,
+    }, indent=2) + '\n', encoding='utf-8')
+    print(f"wrote {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
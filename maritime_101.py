@@ -1,5 +1,9 @@
+import importlib
+
 import streamlit as st
 
+from modules import instrument, search, sections
+
 st.set_page_config(
     page_title="Maritime 101 - Knowledge Base",
     page_icon="🚢",
@@ -67,26 +71,58 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Page registry: sidebar label -> module in modules/. A page's module is only
+# imported the first time someone opens it, and is then kept for the lifetime
+# of the server process.
+PAGES = {
+    "🏠 Maritime Industry Foundation": "foundation",
+    "📦 Containers & Containerisation": "containers",
+    "🚢 Container Vessels & Evolution": "vessels",
+    "🌍 Global Shipping & Alliances": "global_shipping",
+    "🏛️ Maritime Singapore Ecosystem": "singapore_ecosystem",
+    "⚓ Port Strategy & Competition": "port_competition",
+    "🎯 Operations Management Fundamentals": "operations_management",
+    "🔄 Terminal Operations & Planning": "terminal_operations",
+    "🤖 Equipment, Automation & CITOS": "equipment_technology",
+    "🌱 Green Maritime & Future Trends": "green_innovation",
+    "🏗️ Tuas Mega Port Case Study": "tuas_development",
+}
+
+
+@st.cache_resource(show_spinner=False)
+def load_page(module_name):
+    return importlib.import_module(f"modules.{module_name}")
+
+
+def go_to(label, anchor):
+    st.session_state.page = label
+    st.session_state.search_anchor = anchor
+    # Open the section if it is a lazy one, so its content is there to scroll to
+    st.session_state[sections.expander_key(f"modules.{PAGES[label]}", anchor)] = True
+
+
 # Sidebar Navigation
 st.sidebar.markdown("## 🧭 Navigation")
 st.sidebar.markdown("---")
 
-page = st.sidebar.radio(
-    "Select Section:",
-    [
-        "🏠 Maritime Industry Foundation",
-        "📦 Containers & Containerisation",
-        "🚢 Container Vessels & Evolution",
-        "🌍 Global Shipping & Alliances",
-        "🏛️ Maritime Singapore Ecosystem",
-        "⚓ Port Strategy & Competition",
-        "🎯 Operations Management Fundamentals",
-        "🔄 Terminal Operations & Planning",
-        "🤖 Equipment, Automation & CITOS",
-        "🌱 Green Maritime & Future Trends",
-        "🏗️ Tuas Mega Port Case Study"
-    ]
-)
+query = st.sidebar.text_input("🔎 Search", placeholder="e.g. VERMAS, BOA, Tuas")
+if query:
+    labels = {module: label for label, module in PAGES.items()}
+    hits = search.load(PAGES.values()).search(query, limit=8)
+    if not hits:
+        st.sidebar.caption("No matches")
+    for i, hit in enumerate(hits):
+        st.sidebar.button(
+            f"{labels[hit['page']]} › {hit['section']}",
+            key=f"search_hit_{i}",
+            help=hit['snippet'],
+            on_click=go_to,
+            args=(labels[hit['page']], hit['anchor']),
+            width="stretch",
+        )
+    st.sidebar.markdown("---")
+
+page = st.sidebar.radio("Select Section:", list(PAGES), key="page")
 
 st.sidebar.markdown("---")
 st.sidebar.info("""
@@ -110,40 +146,17 @@ st.sidebar.metric("Largest Vessels", "25,000 TEU")
 st.sidebar.metric("Alliance Control", ">80%")
 st.sidebar.metric("Tuas Target", "65M TEU")
 
-# Route to pages
-if page == "🏠 Maritime Industry Foundation":
-    from modules import foundation
-    foundation.show()
-elif page == "📦 Containers & Containerisation":
-    from modules import containers
-    containers.show()
-elif page == "🚢 Container Vessels & Evolution":
-    from modules import vessels
-    vessels.show()
-elif page == "🌍 Global Shipping & Alliances":
-    from modules import global_shipping
-    global_shipping.show()
-elif page == "🏛️ Maritime Singapore Ecosystem":
-    from modules import singapore_ecosystem
-    singapore_ecosystem.show()
-elif page == "⚓ Port Strategy & Competition":
-    from modules import port_competition
-    port_competition.show()
-elif page == "🎯 Operations Management Fundamentals":
-    from modules import operations_management
-    operations_management.show()
-elif page == "🔄 Terminal Operations & Planning":
-    from modules import terminal_operations
-    terminal_operations.show()
-elif page == "🤖 Equipment, Automation & CITOS":
-    from modules import equipment_technology
-    equipment_technology.show()
-elif page == "🌱 Green Maritime & Future Trends":
-    from modules import green_innovation
-    green_innovation.show()
-elif page == "🏗️ Tuas Mega Port Case Study":
-    from modules import tuas_development
-    tuas_development.show()
+# Route to page
+with instrument.page(PAGES[page]):
+    load_page(PAGES[page]).show()
+
+# Scroll to the section picked from the search results
+anchor = st.session_state.pop("search_anchor", None)
+if anchor:
+    st.html(
+        f"<script>setTimeout(() => document.getElementById('{anchor}')?.scrollIntoView(), 300)</script>",
+        unsafe_allow_javascript=True,
+    )
 
 # Footer
 st.markdown("---")
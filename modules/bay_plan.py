@@ -0,0 +1,185 @@
+"""Vessel bay plans held as (bay x row x tier) arrays.
+
+A ``BayPlan`` is a set of equal-shaped NumPy arrays indexed
+``[bay, row, tier]``. Bays are 20-foot bays from bow to stern, rows run
+from port to starboard, and tiers go from the bottom of the hold to the
+top of the deck stack:
+
+- ``slots``: the slots that exist, following the hull shape
+- ``pod``: the discharge port of the box in each slot, as an index into
+  ``ports`` (-1 when empty)
+- ``weight``: its gross weight in tonnes (NaN when empty)
+
+A 24,000 TEU vessel is 58 bays (numbered 01 to 115) x 24 rows x 22 tiers,
+about 30,000 cells. The whole plan is a few hundred kilobytes. Generating, counting and colouring a plan are array
+operations over it, with no per-slot Python objects:
+
+    plan = bay_plan.generate(bay_plan.vessel_slots(), ['Rotterdam', 'Hamburg', 'Felixstowe'])
+    plan.teu, plan.teu_by_port()
+    bay_plan.bay_figure(plan, bay=30, color_by='pod')
+
+Generated plans are stowed the way the Vessel Stowage Planning section
+describes. Later discharge ports go lower in each stack, and within a port
+heavier boxes go lower.
+
+Bay, row and tier labels follow the usual bay plan numbering. Bays are odd
+numbers from the bow. Rows are numbered out from the centreline, odd to
+starboard and even to port. Tiers are even numbers, from 02 in the hold
+and from 82 on deck.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+from modules import slot_address
+
+PORT_COLORS = ['#10B981', '#F59E0B', '#EF4444', '#3B82F6', '#8B5CF6', '#EC4899', '#06B6D4', '#6B7280']
+WEIGHT_SCALE = [[0, '#DBEAFE'], [0.5, '#3B82F6'], [1, '#1E3A8A']]
+
+
+class BayPlan:
+    def __init__(self, slots, ports, pod=None, weight=None, hold_tiers=0):
+        self.slots = np.asarray(slots, dtype=bool)
+        self.ports = list(ports)
+        self.pod = np.full(self.slots.shape, -1, dtype=np.int8) if pod is None else pod
+        self.weight = np.full(self.slots.shape, np.nan, dtype=np.float32) if weight is None else weight
+        self.hold_tiers = hold_tiers
+
+    @property
+    def shape(self):
+        return self.slots.shape
+
+    @property
+    def occupied(self):
+        return self.pod >= 0
+
+    @property
+    def capacity(self):
+        return int(self.slots.sum())
+
+    @property
+    def teu(self):
+        return int(self.occupied.sum())
+
+    def teu_by_port(self):
+        counts = np.bincount(self.pod[self.occupied], minlength=len(self.ports))
+        return dict(zip(self.ports, counts.tolist()))
+
+    def stack_weight(self):
+        # (bay x row) tonnes per stack
+        return np.nansum(self.weight, axis=2)
+
+    def bay_labels(self):
+        return np.char.zfill((2 * np.arange(self.shape[0]) + 1).astype(str), 2)
+
+    def row_labels(self):
+        # Port side (left, as seen from astern) to starboard: ... 04 02 (00) 01 03 ...
+        offset = np.arange(self.shape[1]) - (self.shape[1] - 1) / 2
+        k = np.ceil(np.abs(offset))
+        number = np.where(offset < 0, 2 * k, np.where(offset > 0, 2 * k - 1, 0))
+        return np.char.zfill(number.astype(int).astype(str), 2)
+
+    def tier_labels(self):
+        return np.char.zfill(self._tier_numbers().astype(str), 2)
+
+    def _tier_numbers(self):
+        tiers = np.arange(self.shape[2])
+        deck = tiers >= self.hold_tiers
+        return np.where(deck, 82 + 2 * (tiers - self.hold_tiers), 2 + 2 * tiers)
+
+    def addresses(self):
+        # Packed slot address of every cell (see modules/slot_address)
+        bays = 2 * np.arange(self.shape[0]) + 1
+        rows = self.row_labels().astype(int)
+        return slot_address.encode(bays[:, None, None], rows[None, :, None], self._tier_numbers()[None, None, :])
+
+
+def vessel_slots(bays=58, rows=24, hold_tiers=11, deck_tiers=11):
+    # Slot mask of a mega-vessel hull. The beam narrows towards bow and
+    # stern, and the hold gets shallower there. The defaults give about
+    # 24,000 TEU.
+    x = np.linspace(0, 1, bays)[:, None, None]               # bow (0) to stern (1)
+    row = np.arange(rows)[None, :, None]
+    tier = np.arange(hold_tiers + deck_tiers)[None, None, :]
+
+    # Fraction of the full beam available at each bay, 1 amidships
+    beam = np.clip(1 - np.maximum(0.35 - x, 0) * 2.2 - np.maximum(x - 0.85, 0) * 2.5, 0.25, 1)
+    half_width = beam * rows / 2
+    within_beam = np.abs(row + 0.5 - rows / 2) <= half_width
+
+    # Hold floor rises towards the ends; deck stacks are lower in the bow
+    floor = np.round(np.maximum(0.3 - x, 0) * 20 + np.maximum(x - 0.9, 0) * 40)
+    deck_top = hold_tiers + deck_tiers - np.round(np.maximum(0.2 - x, 0) * 25)
+    return within_beam & (tier >= floor) & (tier < deck_top)
+
+
+def generate(slots, ports, fill=0.9, shares=None, mean_weight=14.0, seed=0, hold_tiers=11):
+    # A stowed plan: each stack is filled from the bottom to a random height
+    # around `fill`, with the last discharge port lowest and heavier boxes
+    # lower within a port. ports are in discharge order.
+    slots = np.asarray(slots, dtype=bool)
+    rng = np.random.default_rng(seed)
+    shares = np.full(len(ports), 1 / len(ports)) if shares is None else np.asarray(shares, float) / np.sum(shares)
+
+    # Position of each slot within its stack, counted from the bottom
+    rank = np.cumsum(slots, axis=2) - 1
+    height = slots.sum(axis=2, keepdims=True)
+    filled = np.round(height * np.clip(rng.normal(fill, 0.08, size=height.shape), 0, 1)) if fill < 1 else height
+    occupied = slots & (rank < filled)
+
+    # Bottom share of each stack goes to the last port, and so on upwards
+    cumulative = np.cumsum(shares[::-1])
+    position = (rank + 0.5) / np.maximum(filled, 1)
+    pod = (len(ports) - 1 - np.searchsorted(cumulative, position, side='right').clip(0, len(ports) - 1))
+    pod = np.where(occupied, pod, -1).astype(np.int8)
+
+    # Heavy at the bottom within each port: sort each stack's boxes by
+    # (port, weight) descending and write them back into its occupied slots
+    weight = rng.gamma(4, mean_weight / 4, size=slots.shape).clip(2.5, 32)
+    key = np.where(occupied, pod.astype(float) * 100 + weight, -1.0)
+    key = -np.sort(-key, axis=2)
+    order = np.argsort(~occupied, axis=2, kind='stable')
+    stowed = np.full(slots.shape, -1.0)
+    np.put_along_axis(stowed, order, key, axis=2)
+    pod = np.where(occupied, stowed // 100, -1).astype(np.int8)
+    weight = np.where(occupied, stowed - pod * 100.0, np.nan).astype(np.float32)
+    return BayPlan(slots, ports, pod, weight, hold_tiers)
+
+
+def bay_figure(plan, bay, color_by='pod'):
+    # Cross-section of one bay as seen from astern: rows across, tiers up
+    rows, tiers = plan.row_labels(), plan.tier_labels()
+    exists = plan.slots[bay].T                               # (tier, row)
+    pod = plan.pod[bay].T
+    weight = plan.weight[bay].T
+    names = np.array(['Empty'] + plan.ports, dtype=object)[pod + 1]
+    names = np.where(exists, names, '')
+    hover = np.char.add(np.char.add(names.astype(str), '<br>'),
+                        np.where(pod >= 0, np.char.mod('%.1f t', np.nan_to_num(weight)), ''))
+
+    if color_by == 'pod':
+        n = len(plan.ports)
+        # Empty slots are -1 (light grey); missing slots are NaN (not drawn)
+        z = np.where(exists, pod, np.nan).astype(float)
+        steps = ['#F3F4F6'] + PORT_COLORS[:n]
+        colorscale = [[edge, color] for i, color in enumerate(steps) for edge in (i / len(steps), (i + 1) / len(steps))]
+        extra = dict(zmin=-1.5, zmax=n - 0.5, colorscale=colorscale, showscale=False)
+    else:
+        z = np.where(exists, np.where(pod >= 0, weight, 0), np.nan).astype(float)
+        extra = dict(zmin=0, zmax=32, colorscale=WEIGHT_SCALE, colorbar=dict(title='Tonnes'))
+
+    fig = go.Figure(go.Heatmap(
+        z=z, x=rows, y=tiers, customdata=hover, xgap=2, ygap=2,
+        hovertemplate='Row %{x}, Tier %{y}<br>%{customdata}<extra></extra>', **extra,
+    ))
+    if color_by == 'pod':
+        # Legend entries for the discharge ports
+        for i, port in enumerate(plan.ports):
+            fig.add_trace(go.Scatter(x=[None], y=[None], mode='markers', name=port,
+                                     marker=dict(size=12, symbol='square', color=PORT_COLORS[i % len(PORT_COLORS)])))
+    fig.update_layout(
+        xaxis=dict(type='category', title='Row (Port ← → Starboard)'),
+        yaxis=dict(type='category', title='Tier (Bottom → Top)'),
+        plot_bgcolor='white',
+        legend=dict(orientation='h', y=-0.2),
+    )
+    return fig
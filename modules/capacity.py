@@ -0,0 +1,307 @@
+"""Terminal capacity from its seven components, over whole parameter grids.
+
+Each row of the capacity_components table becomes a formula giving annual
+quay throughput in TEU. Throughput that only passes part of the terminal is
+scaled up to quay TEU: the gate sees only the landside share, and every
+box takes several yard crane moves. The terminal's capacity is the
+smallest component, and that component is the bottleneck.
+
+Every parameter can be a scalar or an array, and the formulas are NumPy
+expressions that broadcast. ``sweep()`` puts each swept parameter on its
+own axis, so a grid of six parameters with ten values each is one
+evaluation over a million points:
+
+    base = capacity.evaluate()                        # the BASE terminal
+    base.capacity, base.bottleneck_name               # 10.2M TEU, 'Berth Capacity'
+
+    grid = capacity.sweep(turnaround_h=np.arange(16, 33), utilisation=np.linspace(0.5, 0.85, 8))
+    grid.capacity.shape                               # (17, 8)
+    grid.bottleneck                                   # component index per point
+
+    capacity.tornado()                                # capacity at each parameter's low and high
+
+Charts: ``tornado_figure()`` and ``heatmap_figure()``. From the command line,
+as a timing check:
+
+    python -m modules.capacity demo
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+HOURS_PER_YEAR = 24 * 365
+
+COMPONENTS = ['Berth Capacity', 'Quay Crane Capacity', 'Yard Storage Capacity', 'Yard Crane Capacity',
+              'Horizontal Transport', 'Gate Capacity', 'Marine Channel']
+
+# The worked example on the Terminal Operations page: 10 berths, 70%
+# utilisation, 24 hour turnaround, 4,000 TEU per call. The other components
+# are sized so that the berths bind, as they often do.
+BASE = dict(
+    berths=10,
+    utilisation=0.70,
+    turnaround_h=24.0,
+    teu_per_call=4000.0,
+    cranes=40,
+    crane_gmph=30.0,
+    crane_availability=0.75,       # share of the year cranes are working
+    teu_per_move=1.5,              # 20 and 40 foot mix
+    ground_slots=36000,
+    stack_height=5,
+    yard_fill=0.70,                # usable share of the stacked slots
+    dwell_days=4.0,
+    yard_cranes=140,
+    yard_crane_mph=20.0,
+    yard_moves_per_box=2.5,        # in, out and re-handles
+    fleet=320,
+    cycles_per_hour=4.0,
+    boxes_per_cycle=1.0,
+    gate_lanes=16,
+    gate_tph=30.0,                 # transactions per lane-hour
+    landside_share=0.5,            # the rest is transhipment, which never crosses the gate
+    channel_mph=1.5,               # vessel movements per hour
+    tidal_window=0.85,             # share of the year the channel is open to the largest ships
+)
+
+LABELS = dict(
+    berths="Berths",
+    utilisation="Berth utilisation",
+    turnaround_h="Vessel turnaround (h)",
+    teu_per_call="TEU per call",
+    cranes="Quay cranes",
+    crane_gmph="Crane moves per hour",
+    crane_availability="Crane availability",
+    teu_per_move="TEU per move",
+    ground_slots="Ground slots",
+    stack_height="Stacking height",
+    yard_fill="Yard fill",
+    dwell_days="Dwell time (days)",
+    yard_cranes="Yard cranes",
+    yard_crane_mph="Yard crane moves per hour",
+    yard_moves_per_box="Yard moves per box",
+    fleet="Prime movers / AGVs",
+    cycles_per_hour="Transport cycles per hour",
+    boxes_per_cycle="Boxes per cycle",
+    gate_lanes="Gate lanes",
+    gate_tph="Gate transactions per hour",
+    landside_share="Landside share",
+    channel_mph="Channel movements per hour",
+    tidal_window="Tidal window",
+)
+
+# Plausible low and high values for the tornado chart
+RANGES = dict(
+    berths=(8, 12),
+    utilisation=(0.6, 0.8),
+    turnaround_h=(30.0, 20.0),
+    teu_per_call=(3000.0, 5000.0),
+    cranes=(32, 48),
+    crane_gmph=(25.0, 35.0),
+    ground_slots=(30000, 42000),
+    stack_height=(4, 6),
+    dwell_days=(5.0, 3.0),
+    yard_cranes=(110, 170),
+    fleet=(260, 380),
+    gate_lanes=(12, 20),
+    landside_share=(0.7, 0.3),
+    tidal_window=(0.7, 1.0),
+)
+
+
+class CapacityError(ValueError):
+    pass
+
+
+def berth(p):
+    return p['berths'] * HOURS_PER_YEAR * p['utilisation'] / p['turnaround_h'] * p['teu_per_call']
+
+
+def quay_cranes(p):
+    return p['cranes'] * p['crane_gmph'] * HOURS_PER_YEAR * p['crane_availability'] * p['teu_per_move']
+
+
+def yard_storage(p):
+    # Static TEU capacity turned over every dwell period
+    return p['ground_slots'] * p['stack_height'] * p['yard_fill'] * 365 / p['dwell_days']
+
+
+def yard_cranes(p):
+    return (p['yard_cranes'] * p['yard_crane_mph'] * HOURS_PER_YEAR * p['crane_availability']
+            * p['teu_per_move'] / p['yard_moves_per_box'])
+
+
+def transport(p):
+    return (p['fleet'] * p['cycles_per_hour'] * HOURS_PER_YEAR * p['crane_availability']
+            * p['boxes_per_cycle'] * p['teu_per_move'])
+
+
+def gate(p):
+    return p['gate_lanes'] * p['gate_tph'] * HOURS_PER_YEAR * p['teu_per_move'] / p['landside_share']
+
+
+def channel(p):
+    # Every call is two movements, in and out
+    return p['channel_mph'] * HOURS_PER_YEAR * p['tidal_window'] / 2 * p['teu_per_call']
+
+
+FORMULAS = [berth, quay_cranes, yard_storage, yard_cranes, transport, gate, channel]
+
+
+class Result:
+    # components: (7, *shape) annual TEU. Axes follow the swept parameters.
+
+    def __init__(self, components, axes=None):
+        self.components = components
+        self.axes = axes or {}
+
+    @property
+    def capacity(self):
+        return self.components.min(axis=0)
+
+    @property
+    def bottleneck(self):
+        return self.components.argmin(axis=0)
+
+    @property
+    def bottleneck_name(self):
+        return np.asarray(COMPONENTS)[self.bottleneck]
+
+    def shares(self):
+        # Share of the grid points limited by each component
+        counts = np.bincount(self.bottleneck.ravel(), minlength=len(COMPONENTS))
+        return pd.Series(counts / counts.sum(), index=COMPONENTS)
+
+    def table(self):
+        # A column per component and one row per grid point (one row for a
+        # scalar result)
+        values = self.components.reshape(len(COMPONENTS), -1).T
+        df = pd.DataFrame(values, columns=COMPONENTS)
+        if self.axes:
+            grid = np.meshgrid(*self.axes.values(), indexing='ij')
+            df = pd.concat([pd.DataFrame({name: g.ravel() for name, g in zip(self.axes, grid)}), df], axis=1)
+        return df.assign(Capacity=self.capacity.ravel(), Bottleneck=self.bottleneck_name.ravel())
+
+
+def evaluate(**params):
+    unknown = set(params) - set(BASE)
+    if unknown:
+        raise CapacityError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    p = {**BASE, **params}
+    values = [np.asarray(formula(p), dtype=np.float32) for formula in FORMULAS]
+    return Result(np.stack(np.broadcast_arrays(*values)))
+
+
+def sweep(**axes):
+    # Each parameter on its own axis, in the order given
+    shaped = {}
+    for i, (name, values) in enumerate(axes.items()):
+        shape = [1] * len(axes)
+        shape[i] = -1
+        shaped[name] = np.reshape(np.asarray(values, dtype=np.float32), shape)
+    result = evaluate(**shaped)
+    result.axes = {name: np.asarray(values) for name, values in axes.items()}
+    return result
+
+
+def tornado(ranges=None, **base):
+    # Capacity with one parameter at a time moved to its low and high value.
+    # All parameters are evaluated together: row i holds parameter i's pair.
+    ranges = ranges or RANGES
+    names = list(ranges)
+    p = {**BASE, **base}
+    params = {}
+    for i, name in enumerate(names):
+        values = np.full((len(names), 2), p[name], dtype=np.float32)
+        values[i] = ranges[name]
+        params[name] = values
+    result = evaluate(**{**base, **params})
+    reference = float(evaluate(**base).capacity)
+    df = pd.DataFrame({
+        'Parameter': [LABELS[name] for name in names],
+        'Low': [ranges[name][0] for name in names],
+        'High': [ranges[name][1] for name in names],
+        'Capacity at Low': result.capacity[:, 0],
+        'Capacity at High': result.capacity[:, 1],
+    })
+    df['Swing'] = (df['Capacity at High'] - df['Capacity at Low']).abs()
+    df.attrs['base'] = reference
+    return df.sort_values('Swing').reset_index(drop=True)
+
+
+def tornado_figure(df):
+    base = df.attrs['base']
+    fig = go.Figure()
+    for column, color in (('Capacity at Low', '#F59E0B'), ('Capacity at High', '#3B82F6')):
+        bound = column.split()[-1]
+        fig.add_trace(go.Bar(
+            y=df['Parameter'], x=(df[column] - base) / 1e6, base=base / 1e6, orientation='h',
+            name=f'{bound} value', marker_color=color, customdata=np.c_[df[bound], df[column] / 1e6],
+            hovertemplate='%{y}: %{customdata[0]:,}<br>Capacity: %{customdata[1]:.2f}M TEU<extra></extra>',
+        ))
+    fig.add_vline(x=base / 1e6, line_color='#1F2937', line_width=1)
+    fig.update_layout(
+        barmode='overlay',
+        xaxis_title="Annual capacity (million TEU)",
+        plot_bgcolor='white',
+        xaxis_gridcolor='#E5E7EB',
+        legend=dict(orientation='h', y=-0.2),
+    )
+    return fig
+
+
+def heatmap_figure(result):
+    # A two-parameter sweep, sweep(y=..., x=...): arrays are indexed
+    # [y, x], which is the row order Plotly expects for z
+    (x_name, x), (y_name, y) = list(result.axes.items())[::-1]
+    fig = go.Figure(go.Heatmap(
+        z=result.capacity / 1e6, x=x, y=y, customdata=result.bottleneck_name,
+        colorscale='Blues', colorbar=dict(title='M TEU'),
+        hovertemplate=f'{LABELS[x_name]}: %{{x}}<br>{LABELS[y_name]}: %{{y}}<br>'
+                      'Capacity: %{z:.2f}M TEU<br>Bottleneck: %{customdata}<extra></extra>',
+    ))
+    # Outline where the bottleneck changes
+    fig.add_trace(go.Contour(
+        z=result.bottleneck, x=x, y=y, showscale=False, hoverinfo='skip',
+        contours=dict(coloring='none', showlabels=False), line=dict(color='white', width=2, dash='dot'),
+    ))
+    fig.update_layout(
+        xaxis_title=LABELS[x_name],
+        yaxis_title=LABELS[y_name],
+        plot_bgcolor='white',
+    )
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.capacity', description='Terminal capacity sweeps.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    demo = sub.add_parser('demo', help='sweep a million-point grid and time it')
+    demo.add_argument('-k', '--values', type=int, default=10, help='values per swept parameter')
+    args = parser.parse_args(argv)
+
+    k = args.values
+    axes = dict(
+        utilisation=np.linspace(0.5, 0.85, k),
+        turnaround_h=np.linspace(16, 36, k),
+        crane_gmph=np.linspace(22, 40, k),
+        dwell_days=np.linspace(2, 7, k),
+        yard_cranes=np.linspace(100, 200, k),
+        gate_lanes=np.linspace(10, 24, k),
+    )
+    start = time.perf_counter()
+    result = sweep(**axes)
+    capacity = result.capacity
+    shares = result.shares()
+    elapsed = time.perf_counter() - start
+    print(f"{capacity.size:,} scenarios in {elapsed:.2f} s, "
+          f"capacity {capacity.min() / 1e6:.1f}-{capacity.max() / 1e6:.1f}M TEU")
+    print((shares[shares > 0] * 100).round(1).to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
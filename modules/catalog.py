@@ -0,0 +1,127 @@
+"""Versioned on-disk catalog of the tables shown on each page.
+
+Every dataset is an uncompressed Arrow IPC (Feather v2) file under data/,
+listed in data/catalog.json with its row count and a SHA-256 of the file.
+Pages ask for a dataset by name, e.g. ``catalog.load('vessels/cost_comparison')``.
+
+Files are memory-mapped and wrapped in Arrow-backed pandas columns, so the
+data is never copied onto the Python heap. Every session shares one
+DataFrame per dataset, and worker processes on the same host share the same
+page-cache pages. The manifest is re-read when its mtime changes, which lets
+the data be refreshed without a deploy:
+
+    python -m modules.catalog list
+    python -m modules.catalog export terminal_operations/berth_plan plan.csv
+    python -m modules.catalog import terminal_operations/berth_plan plan.csv
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+from modules import deferred
+
+# Not needed until a table is loaded, which keeps them off the startup path
+pd = deferred.module('pandas')
+pa = deferred.module('pyarrow')
+feather = deferred.module('pyarrow.feather')
+
+DATA_DIR = Path(os.environ.get('MARITIME_DATA_DIR', Path(__file__).resolve().parent.parent / 'data'))
+MANIFEST = DATA_DIR / 'catalog.json'
+
+
+@st.cache_resource(show_spinner=False)
+def _read_manifest(path, mtime_ns):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def manifest():
+    return _read_manifest(str(MANIFEST), MANIFEST.stat().st_mtime_ns)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _load(path, digest):
+    table = feather.read_table(path, memory_map=True)
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    # The content hash doubles as the version page_cache keys figures on
+    df.attrs['version'] = digest
+    return df
+
+
+def load(name):
+    datasets = manifest()['datasets']
+    if name not in datasets:
+        raise KeyError(f"Unknown dataset '{name}' (not in {MANIFEST})")
+    entry = datasets[name]
+    return _load(str(DATA_DIR / entry['file']), entry['sha256'])
+
+
+def names():
+    return sorted(manifest()['datasets'])
+
+
+def write(name, df):
+    # Mixed-type columns (e.g. numbers alongside 'N/A') are stored as text,
+    # which is also how st.dataframe would have displayed them.
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype == object:
+            try:
+                pa.array(df[column])
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[column] = df[column].astype(str)
+
+    relative = f'{name}.arrow'
+    path = DATA_DIR / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.arrow.tmp')
+    feather.write_feather(df, tmp, compression='uncompressed')
+    digest = hashlib.sha256(tmp.read_bytes()).hexdigest()
+    os.replace(tmp, path)
+
+    current = json.loads(MANIFEST.read_text(encoding='utf-8')) if MANIFEST.exists() else {'version': 0, 'datasets': {}}
+    current['version'] += 1
+    current['datasets'][name] = {
+        'file': relative,
+        'rows': len(df),
+        'columns': [str(c) for c in df.columns],
+        'sha256': digest,
+    }
+    current['datasets'] = dict(sorted(current['datasets'].items()))
+    tmp = MANIFEST.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(current, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    os.replace(tmp, MANIFEST)
+    return digest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.catalog', description='Inspect or update the data catalog.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='list datasets')
+    export = sub.add_parser('export', help='write a dataset as CSV')
+    export.add_argument('name')
+    export.add_argument('csv', nargs='?', help='output file (default: stdout)')
+    imp = sub.add_parser('import', help='replace a dataset from a CSV file')
+    imp.add_argument('name')
+    imp.add_argument('csv')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        data = manifest()
+        print(f"catalog version {data['version']}")
+        for name, entry in data['datasets'].items():
+            print(f"{name:55s} {entry['rows']:>4} rows  {entry['sha256'][:12]}")
+    elif args.command == 'export':
+        load(args.name).to_csv(args.csv or sys.stdout, index=False)
+    elif args.command == 'import':
+        digest = write(args.name, pd.read_csv(args.csv))
+        print(f"{args.name} -> {digest[:12]}")
+
+
+if __name__ == '__main__':
+    main()
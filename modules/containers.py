@@ -2,6 +2,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 
+from modules import catalog, instrument, iso6346, page_cache, repositioning, size_type, slot_address, teu
+
 def show():
     st.markdown('<p class="main-header">📦 Containers & Containerisation</p>', unsafe_allow_html=True)
     
@@ -17,7 +19,7 @@ def show():
     # SECTION 1: ISO Container Standards
     # ============================================================================
     
-    st.markdown('<p class="section-header">ISO Container Standards: The Foundation of Interoperability</p>', unsafe_allow_html=True)
+    instrument.section_header('ISO Container Standards: The Foundation of Interoperability')
     
     st.markdown("""
     The genius of containerisation lies in **standardisation**. ISO (International Organisation for 
@@ -35,24 +37,7 @@ def show():
     st.markdown('<p class="subsection-header">Standard Container Dimensions</p>', unsafe_allow_html=True)
     
     # Container specifications
-    container_specs = pd.DataFrame({
-        'Container Type': [
-            '20ft Standard',
-            '40ft Standard',
-            '40ft High Cube',
-            '45ft High Cube'
-        ],
-        'External Length': ['6.1m (20ft)', '12.2m (40ft)', '12.2m (40ft)', '13.7m (45ft)'],
-        'External Width': ['2.4m (8ft)', '2.4m (8ft)', '2.4m (8ft)', '2.4m (8ft)'],
-        'External Height': ['2.6m (8ft 6in)', '2.6m (8ft 6in)', '2.9m (9ft 6in)', '2.9m (9ft 6in)'],
-        'Internal Length': ['5.9m', '12.0m', '12.0m', '13.6m'],
-        'Internal Width': ['2.35m', '2.35m', '2.35m', '2.35m'],
-        'Internal Height': ['2.39m', '2.39m', '2.69m', '2.69m'],
-        'Tare Weight': ['2,300 kg', '3,750 kg', '3,940 kg', '4,800 kg'],
-        'Max Gross Weight': ['30,480 kg', '30,480 kg', '30,480 kg', '30,480 kg'],
-        'Max Payload': ['28,180 kg', '26,730 kg', '26,540 kg', '25,680 kg'],
-        'Cubic Capacity': ['33 m³', '67 m³', '76 m³', '86 m³']
-    })
+    container_specs = catalog.load('containers/container_specs')
     
     st.dataframe(container_specs, use_container_width=True, hide_index=True)
     
@@ -101,7 +86,7 @@ def show():
     # SECTION 2: TEU Measurement System
     # ============================================================================
     
-    st.markdown('<p class="section-header">The TEU: Universal Container Measurement</p>', unsafe_allow_html=True)
+    instrument.section_header('The TEU: Universal Container Measurement')
     
     st.markdown("""
     **TEU = Twenty-foot Equivalent Unit**
@@ -155,12 +140,7 @@ def show():
         """)
     
     # TEU comparison visualisation
-    teu_examples = pd.DataFrame({
-        'Container Mix': ['All 20ft', 'All 40ft', 'Mixed (50/50)', 'Typical Mix (20% 20ft, 80% 40ft)'],
-        'Number of Containers': [10000, 5000, 6667, 5625],
-        'Total TEU': [10000, 10000, 10000, 10000],
-        'Average TEU per Container': [1.0, 2.0, 1.5, 1.78]
-    })
+    teu_examples = catalog.load('containers/teu_examples')
     
     st.dataframe(teu_examples, use_container_width=True, hide_index=True)
     
@@ -169,11 +149,13 @@ def show():
     with 40ft High Cube being the most common variant due to volume efficiency for low-density cargo.
     """)
     
+    teu_calculator()
+    
     # ============================================================================
     # SECTION 3: Container Types
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Types: Specialised for Different Cargo</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Types: Specialised for Different Cargo')
     
     st.markdown("""
     While standard dry containers are most common, specialised containers exist for specific cargo types. 
@@ -181,45 +163,7 @@ def show():
     """)
     
     # Container types data
-    container_types = pd.DataFrame({
-        'Type': [
-            'Dry Van (General Purpose)',
-            'Reefer (Refrigerated)',
-            'Open Top',
-            'Flat Rack',
-            'Tank Container',
-            'Out of Gauge (OOG)',
-            'Platform/Bolster'
-        ],
-        'Percentage of Fleet': ['85-90%', '6-8%', '~1%', '~1%', '~1%', '<1%', '<1%'],
-        'Primary Use': [
-            'General cargo, boxes, pallets, bags, most manufactured goods',
-            'Perishables, pharmaceuticals, chemicals requiring temperature control',
-            'Oversized cargo that exceeds height, loaded from top',
-            'Heavy machinery, construction equipment, oversized items',
-            'Liquids: chemicals, food-grade liquids, wine, oils',
-            'Cargo exceeding container dimensions (very large equipment)',
-            'Heavy cargo like steel coils, timber, vehicles'
-        ],
-        'Key Features': [
-            'Fully enclosed, weatherproof, lockable doors',
-            'Built-in refrigeration unit, temperature range -35°C to +30°C, requires continuous power',
-            'Removable roof/tarpaulin, same footprint as standard',
-            'Collapsible sides, can stack flat when empty, lashing points',
-            'Cylindrical tank in standard ISO frame, various sizes (14-26k litres)',
-            'Oversized length/width/height, cannot stack containers on top',
-            'Flat base with corner posts, no walls or roof, secure heavy loads'
-        ],
-        'Special Handling': [
-            'Standard handling, most common',
-            'Must connect to power (vessel/terminal/truck), monitor temperature continuously, priority handling',
-            'Crane access required for loading/unloading from top',
-            'Special securing, cannot stack other containers on top, heavy-duty lashing',
-            'Requires certified cleaning between loads, hazmat regulations apply',
-            'Special stowage positions, certified lifting equipment, additional securing',
-            'Heavy-duty securing, special stowage considerations'
-        ]
-    })
+    container_types = catalog.load('containers/container_types')
     
     st.dataframe(container_types, use_container_width=True, hide_index=True)
     
@@ -275,7 +219,7 @@ def show():
     # SECTION 4: Container Anatomy and Specifications
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Anatomy: Key Components</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Anatomy: Key Components')
     
     st.markdown("""
     Understanding container structure helps explain handling procedures and stowage planning. Every component 
@@ -334,38 +278,7 @@ def show():
     st.markdown('<p class="subsection-header">Weight Specifications and SOLAS VGM</p>', unsafe_allow_html=True)
     
     # Weight table
-    weight_specs = pd.DataFrame({
-        'Specification': [
-            'Max Gross Weight',
-            'Tare Weight (20ft)',
-            'Tare Weight (40ft)',
-            'Tare Weight (40ft HC)',
-            'Max Payload (20ft)',
-            'Max Payload (40ft)',
-            'Typical Cargo (20ft)',
-            'Typical Cargo (40ft)'
-        ],
-        'Value': [
-            '30,480 kg (30.48 tonnes)',
-            '2,200-2,400 kg',
-            '3,600-3,900 kg',
-            '3,900-4,200 kg',
-            '28,080-28,280 kg',
-            '26,580-26,880 kg',
-            '20,000-25,000 kg',
-            '22,000-26,000 kg'
-        ],
-        'Notes': [
-            'International ISO standard, some countries allow higher (up to 36 tonnes in some regions)',
-            'Depends on container type and construction (steel vs aluminium)',
-            'Standard 40ft dry container',
-            'High cube slightly heavier due to extra height',
-            'Max gross minus tare weight',
-            'Max gross minus tare weight',
-            'Most containers not loaded to maximum (volume limit reached first)',
-            'Most 40ft containers hit volume limit before weight limit (low-density cargo)'
-        ]
-    })
+    weight_specs = catalog.load('containers/weight_specs')
     
     st.dataframe(weight_specs, use_container_width=True, hide_index=True)
     
@@ -418,7 +331,7 @@ def show():
     # SECTION 5: Container Identification System
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Identification: The ISO 6346 System</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Identification: The ISO 6346 System')
     
     st.markdown("""
     Every container has a unique identification number following the **ISO 6346 standard**. This global system 
@@ -471,17 +384,25 @@ def show():
     """)
     
     # Example container numbers
-    example_numbers = pd.DataFrame({
-        'Container Number': ['MAEU 1234567', 'MSCU 9876543', 'CMAU 5555555', 'TEMU 1111118', 'HLCU 2468024'],
-        'Owner Code': ['MAEU', 'MSCU', 'CMAU', 'TEMU', 'HLCU'],
-        'Owner': ['Maersk Line', 'MSC', 'CMA CGM', 'ONE', 'Hapag-Lloyd'],
-        'Serial': ['123456', '987654', '555555', '111111', '246802'],
-        'Check Digit': ['7', '3', '5', '8', '4'],
-        'Size/Type (example)': ['42G1', '22G1', '45R1', '42G1', '42G1'],
-        'Meaning': ['40ft HC dry', '20ft std dry', '40ft HC reefer', '40ft HC dry', '40ft HC dry']
+    example_numbers = catalog.load('containers/example_numbers')
+    codes, digits = iso6346.validate(example_numbers['Container Number'].to_numpy())
+    example_numbers = example_numbers.assign(**{
+        'Computed Check Digit': digits,
+        'Valid': codes == iso6346.OK,
     })
     
     st.dataframe(example_numbers, use_container_width=True, hide_index=True)
+    invalid = example_numbers.loc[~example_numbers['Valid'], 'Container Number']
+    if len(invalid):
+        st.caption(f"Check digits computed with the ISO 6346 algorithm. The serials are illustrative, and "
+                   f"{len(invalid)} of {len(example_numbers)} carry a check digit that does not match: "
+                   f"{', '.join(invalid)}.")
+    
+    st.markdown("**Size/type codes decoded:**")
+    size_types = size_type.decode(['22G1', '42G1', '45G1', '45R1', '42U1', '22T6', 'L5G1'])
+    st.dataframe(size_types.drop(columns='Known'), use_container_width=True, hide_index=True)
+    
+    container_number_checker()
     
     st.markdown("""
     **Why This System?**
@@ -505,7 +426,7 @@ def show():
     # SECTION 6: Bay-Row-Tier Coordinate System
     # ============================================================================
     
-    st.markdown('<p class="section-header">Bay-Row-Tier: 3D Positioning System</p>', unsafe_allow_html=True)
+    instrument.section_header('Bay-Row-Tier: 3D Positioning System')
     
     st.markdown("""
     Containers in terminals and vessels are positioned using a three-dimensional coordinate system. Every 
@@ -547,10 +468,9 @@ def show():
         - Numbered left to right
         
         **On Vessels:**
-        - Port (left) to Starboard (right)
-        - Centre line: **00**
-        - **Odd**: Port side (01, 03, 05, 07...)
-        - **Even**: Starboard side (02, 04, 06, 08...)
+        - Numbered out from the centre line: **00**
+        - **Odd**: Starboard side (01, 03, 05, 07...)
+        - **Even**: Port side (02, 04, 06, 08...)
         - Range depends on vessel width
         - Large vessels: 00 to 24 (12 containers wide)
         
@@ -588,7 +508,7 @@ def show():
     
     **Bay 12, Row 04, Tier 86**
     - **Bay 12**: 12th longitudinal position (40ft container position)
-    - **Row 04**: 4th position from port side (starboard side, even numbers)
+    - **Row 04**: 2nd row out from the centre line on the port side (even numbers)
     - **Tier 86**: 3 tiers above deck (80 = deck, 82 = 1st above, 84 = 2nd above, 86 = 3rd above)
     
     **Why This System?**
@@ -608,11 +528,13 @@ def show():
     - **Weight distribution software**: Automatic checking of stability constraints
     """)
     
+    slot_address_lookup()
+    
     # ============================================================================
     # SECTION 7: Container Economics
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Economics: The Business Side</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Economics: The Business Side')
     
     st.markdown("""
     Understanding container costs helps explain shipping line and terminal operational decisions. The container 
@@ -622,50 +544,7 @@ def show():
     st.markdown('<p class="subsection-header">Container Costs (2024-2025 Market Prices)</p>', unsafe_allow_html=True)
     
     # Cost breakdown with updated 2024-2025 prices
-    container_costs = pd.DataFrame({
-        'Item': [
-            'New 20ft Dry Container',
-            'New 40ft Dry Container',
-            'New 40ft High Cube Dry',
-            'New 40ft Reefer',
-            'Used 20ft Container (cargo-worthy)',
-            'Used 40ft Container (cargo-worthy)',
-            'Lifespan',
-            'Maintenance per Year',
-            'Leasing Cost (per day)',
-            'Repositioning Cost (empty)',
-            'Repair (minor damage)',
-            'Repair (major damage)'
-        ],
-        'Cost (2024-2025)': [
-            '$2,200-2,800',
-            '$2,500-3,500',
-            '$3,000-4,000',
-            '$12,000-16,000',
-            '$500-3,000',
-            '$1,000-4,000',
-            '12-15 years',
-            '$150-300',
-            '$1-4 (dry), $10-18 (reefer)',
-            '$500-2,500',
-            '$200-600',
-            '$1,000-4,000'
-        ],
-        'Notes': [
-            'Prices fluctuate with steel costs (currently elevated post-pandemic)',
-            'Most common type globally; prices affected by China manufacturing costs',
-            'Extra height adds cost; most new containers are HC (volume efficiency)',
-            'Refrigeration unit is expensive; Carrier or Thermo King units',
-            'Condition varies; suitable for cargo but may have cosmetic damage',
-            'Widely available; good for storage or one-way shipping',
-            'After 12-15 years, retired from international shipping or sold for storage/modification',
-            'Inspection, cleaning, minor repairs; higher for reefers (compressor maintenance)',
-            'Daily leasing rate; shipping lines often lease 30-50% rather than own all containers',
-            'Moving empty containers to where demand is; major cost for shipping lines',
-            'Dents, scratches, door repairs, floor patches',
-            'Structural damage, floor replacement, extensive corrosion, side panel replacement'
-        ]
-    })
+    container_costs = catalog.load('containers/container_costs')
     
     st.dataframe(container_costs, use_container_width=True, hide_index=True)
     
@@ -730,11 +609,20 @@ def show():
     - **Equipment shortages**: 2024 saw periodic container shortages in Asia despite global surplus
     """)
     
+    st.markdown("""
+    **Planning the repositioning:** Lines plan empty flows as a minimum-cost network problem. Each port has a weekly 
+    surplus or deficit of empties, and each service leg offers a number of slots for empties at a cost per TEU. 
+    A deficit that repositioning cannot cover cheaply is met by leasing boxes locally. The plan below is optimal 
+    for a 14-port main-line network. Change one port's balance and the plan is re-solved from the current one.
+    """)
+    
+    empty_repositioning()
+    
     # ============================================================================
     # SECTION 8: Current Industry Trends (2024-2025)
     # ============================================================================
     
-    st.markdown('<p class="section-header">Current Industry Trends (2024-2025)</p>', unsafe_allow_html=True)
+    instrument.section_header('Current Industry Trends (2024-2025)')
     
     st.markdown("""
     The container industry is experiencing significant transformation driven by technology, sustainability, 
@@ -781,7 +669,7 @@ def show():
     # SECTION 9: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -864,3 +752,127 @@ def show():
     500 to 25,000+ TEU, vessel classifications, and the complex art of stowage planning that relies on the 
     Bay-Row-Tier system you've just learned.
     """)
+
+
+@st.fragment
+def container_number_checker():
+    st.markdown("**Check container numbers** (one per line; spaces and dashes are ignored)")
+    text = st.text_area("Container numbers", "MAEU 123456-7\nMSCU 987654-3\nCSQU3054383", height=120,
+                        key='iso6346_ids', label_visibility='collapsed')
+    ids = [line.strip() for line in text.splitlines() if line.strip()]
+    if not ids:
+        return
+    results = iso6346.validate_frame(ids)
+    valid = int((results['Code'] == iso6346.OK).sum())
+    col1, col2 = st.columns(2)
+    col1.metric("Valid", f"{valid} of {len(results)}")
+    col2.metric("Rejected", len(results) - valid)
+    results['Check Digit'] = results['Check Digit'].astype(str).replace('-1', '–')
+    results = results.rename(columns={'Check Digit': 'Expected Check Digit'})
+    st.dataframe(results.drop(columns='Code'), use_container_width=True, hide_index=True)
+
+
+@st.fragment
+def teu_calculator():
+    st.markdown("**TEU calculator** (upload a manifest CSV, or use the sample of 20,000 boxes)")
+    upload = st.file_uploader("Manifest CSV", type='csv', key='teu_manifest', label_visibility='collapsed')
+    if upload is None:
+        sample = page_cache.table(__name__, 'teu_sample', lambda: teu.sample_manifest(20_000))
+        columns = list(sample.columns)
+    else:
+        try:
+            columns = list(pd.read_csv(upload, nrows=0).columns)
+        except (ValueError, UnicodeDecodeError) as e:
+            st.error(f"Could not read the manifest: {e}")
+            return
+        upload.seek(0)
+    guess = next((i for i, c in enumerate(columns) if any(w in c.lower() for w in ('iso', 'size', 'type'))), 0)
+    col1, col2 = st.columns(2)
+    size_column = col1.selectbox("Size or ISO code column", columns, index=guess, key='teu_size_column')
+    groups = ['(none)'] + [c for c in columns if c != size_column]
+    group = col2.selectbox("Group by", groups, index=groups.index('Line') if 'Line' in groups else 0, key='teu_group')
+    by = [] if group == '(none)' else [group]
+
+    try:
+        if upload is None:
+            tally = teu.Tally(by)
+            tally.add(sample, size_column)
+        else:
+            tally = teu.summarise(upload, by, size_column)
+    except teu.TeuError as e:
+        st.error(str(e))
+        return
+    total = tally.total()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total TEU", f"{total['TEU']:,.0f}")
+    col2.metric("Boxes", f"{int(total['Boxes']):,}")
+    col3.metric("TEU per Box", f"{total['TEU per Box']:.2f}" if pd.notna(total['TEU per Box']) else '–')
+    col4.metric("Unreadable Sizes", f"{int(total['Unknown']):,}")
+    st.dataframe(tally.result(), use_container_width=True)
+
+
+@st.fragment
+def slot_address_lookup():
+    st.markdown("**Read a slot address** (BBRRTT, e.g. 120486; BBBRRTT from bay 100)")
+    text = st.text_input("Slot address", '120486', key='slot_address', label_visibility='collapsed')
+    code = slot_address.parse([text])[0]
+    if code == slot_address.INVALID:
+        st.warning(f"'{text}' is not a Bay-Row-Tier address")
+        return
+    fields = slot_address.describe(code)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Bay", fields['Bay'])
+    col2.metric("Row", fields['Row'])
+    col3.metric("Tier", fields['Tier'])
+    # The same bay and tier across the ship, in packed-address order
+    _, bay, _, tier = slot_address.decode(code)
+    across = sorted(slot_address.encode(bay, range(7), tier))
+    st.caption(f"Packed as the integer {fields['Packed']:,}. Sorted as integers, rows 00-06 in this bay and tier "
+               f"run from port to starboard: {' · '.join(slot_address.format(across))}")
+
+
+@st.fragment
+def empty_repositioning():
+    ports, lanes, balance = repositioning.example_network()
+    col1, col2 = st.columns(2)
+    port = col1.selectbox("Port", ports, index=ports.index('Los Angeles'), key='reposition_port')
+    change = col2.slider("Change in weekly balance (TEU)", -3000, 3000, 0, step=200, key='reposition_change')
+
+    # One network per session, re-solved incrementally as the inputs change
+    net = st.session_state.get('reposition_network')
+    if net is None:
+        net = repositioning.Network(ports, lanes, balance)
+        st.session_state['reposition_network'] = net
+        st.session_state['reposition_plan'] = net.solve()
+    target = balance.copy()
+    target[port] += change
+    for name in target.index[target != net.balance]:
+        st.session_state['reposition_plan'] = net.set_balance(name, int(target[name]))
+    plan = st.session_state['reposition_plan']
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Weekly Cost", f"${plan.cost / 1e6:.2f}M")
+    col2.metric("Empties Repositioned", f"{int(plan.flows['TEU'].sum()):,} TEU")
+    col3.metric("Leased Locally", f"{int(plan.ports['Leased'].sum()):,} TEU")
+
+    def build_repositioning_chart():
+        fig = repositioning.flow_figure(plan)
+        fig.update_layout(
+            title={
+                'text': f"Empty Flows with {port} at {int(target[port]):+,} TEU",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=460,
+        )
+        return fig
+
+    # The plan belongs to this session, so the chart is keyed on its tables
+    fig = page_cache.figure(__name__, f'repositioning_{port}_{change}', build_repositioning_chart,
+                            deps=(plan.flows, plan.ports))
+    st.plotly_chart(fig, width='stretch')
+    st.caption(f"Green ports have a surplus and red ports a deficit. Re-planned in {plan.seconds * 1e3:.1f} ms "
+               f"({plan.paths} augmenting paths).")
+    st.dataframe(plan.flows[['From', 'To', 'Service', 'TEU', 'Cost', 'Total']].rename(
+        columns={'Cost': 'Cost per TEU', 'Total': 'Cost'}), use_container_width=True, hide_index=True)
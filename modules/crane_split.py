@@ -0,0 +1,290 @@
+"""Quay crane split: divide a vessel's bays between cranes and order their work.
+
+The input is a workload of moves per bay, split into the four operations of a
+bay in the order they are worked: discharge from deck, discharge from the
+hold, load into the hold, load on deck. Quay cranes run on the same rails, so:
+
+- they cannot pass each other. Crane 1 (bow end) to crane N (stern end)
+  each work a contiguous run of bays, and all of them move from bow to stern
+  (unidirectional schedules).
+- two cranes must be more than ``safety_bays`` bays apart at all times.
+  A crane that would come too close waits until the crane ahead of it has
+  moved on.
+
+A bay on the boundary between two cranes can be shared. The stern-side crane
+starts its run with the first part of that bay (its discharge), and the
+bow-side crane finishes its run with the rest.
+
+``split()`` minimises the makespan, which is when the last crane finishes.
+For a target makespan T, cranes are filled from the stern. Each takes the
+longest run of bays it can finish by T, allowing for its waits behind the
+crane ahead. T is found by bisection between a lower bound and a
+single-crane upper bound. The lower bound is the larger of:
+
+- total work shared evenly between the cranes
+- the busiest window of ``safety_bays + 1`` adjacent bays, which only one
+  crane can work at a time
+
+The gap to that bound is reported with every plan. A 24-bay, 20,000 TEU
+vessel splits in well under a second:
+
+    workload = crane_split.vessel_workload(bays=24, moves=9000)
+    plan = crane_split.split(workload, cranes=6)
+    plan.makespan, plan.lower_bound, plan.gap
+    plan.worklists                     # Crane, Seq, Bay, Operation, Moves, Start, End, Wait
+    plan.violations()                  # pairs of tasks breaking the safety distance: empty
+
+    python -m modules.crane_split demo --cranes 6
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+OPERATIONS = ['Discharge Deck', 'Discharge Hold', 'Load Hold', 'Load Deck']
+
+
+class SplitError(ValueError):
+    pass
+
+
+def vessel_workload(bays=24, moves=9000, seed=0):
+    # Moves per 40-foot bay of a large vessel: fewer in the narrow bow and
+    # stern, and a varying mix of discharge and load in each bay. 40-foot bays
+    # take the even number between their two 20-foot bays (02, 06, 10, ...).
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 1, bays)
+    shape = np.clip(1 - np.maximum(0.3 - x, 0) * 2.5 - np.maximum(x - 0.85, 0) * 3, 0.2, 1)
+    weights = shape * rng.gamma(6, 1 / 6, bays)
+    per_bay = rng.multinomial(moves, weights / weights.sum())
+    discharge = rng.binomial(per_bay, rng.beta(4, 4, bays))
+    load = per_bay - discharge
+    discharge_deck = rng.binomial(discharge, 0.45)
+    load_deck = rng.binomial(load, 0.45)
+    return pd.DataFrame({
+        'Bay': np.char.zfill((4 * np.arange(bays) + 2).astype(str), 2),
+        'Discharge Deck': discharge_deck,
+        'Discharge Hold': discharge - discharge_deck,
+        'Load Hold': load - load_deck,
+        'Load Deck': load_deck,
+    })
+
+
+class _Timeline:
+    # One crane's tasks: bay index, moves, and start and end hours
+
+    def __init__(self, bays, moves, starts, ends, waits):
+        self.bays, self.moves, self.starts, self.ends, self.waits = bays, moves, starts, ends, waits
+
+    @property
+    def finish(self):
+        return self.ends[-1] if self.ends else 0.0
+
+
+class _Splitter:
+    def __init__(self, workload, cranes, crane_mph, safety_bays, gantry_min):
+        missing = set(OPERATIONS) - set(workload.columns)
+        if missing:
+            raise SplitError(f"Workload is missing {', '.join(sorted(missing))}")
+        if cranes < 1:
+            raise SplitError("At least one crane is needed")
+        self.workload = workload.reset_index(drop=True)
+        self.per_bay = self.workload[OPERATIONS].to_numpy(np.int64).sum(axis=1)
+        if self.per_bay.sum() < 1:
+            raise SplitError("Workload has no moves to split")
+        # Work is laid out bay by bay in cumulative moves: bay k is
+        # [cum[k], cum[k + 1]). Within a bay the layout runs backwards through
+        # the operations, so the stern-side share of a split bay is its first
+        # operations.
+        self.cum = np.r_[0, np.cumsum(self.per_bay)]
+        self.total = int(self.cum[-1])
+        self.cranes = cranes
+        self.hours_per_move = 1 / crane_mph
+        self.safety = safety_bays
+        self.gantry = gantry_min / 60
+
+    def timeline(self, a, b, ahead):
+        # Crane working cumulative moves [a, b), bow to stern, behind the
+        # crane `ahead` (None for the stern-most crane)
+        bays, moves, starts, ends, waits = [], [], [], [], []
+        if b <= a:
+            return _Timeline(bays, moves, starts, ends, waits)
+        cum = self.cum
+        first = int(np.searchsorted(cum, a, side='right')) - 1
+        last = int(np.searchsorted(cum, b, side='left')) - 1
+        t, position = 0.0, first
+        for bay in range(first, last + 1):
+            amount = min(b, cum[bay + 1]) - max(a, cum[bay])
+            if amount <= 0:
+                continue
+            arrive = t + self.gantry * (bay - position)
+            start = max(arrive, self._clear(ahead, bay)) if ahead is not None else arrive
+            end = start + amount * self.hours_per_move
+            bays.append(bay)
+            moves.append(int(amount))
+            starts.append(start)
+            ends.append(end)
+            waits.append(start - arrive)
+            t, position = end, bay
+        return _Timeline(bays, moves, starts, ends, waits)
+
+    def _clear(self, ahead, bay):
+        # When the crane ahead is more than `safety` bays beyond `bay`: as it
+        # starts its first task there, or once it has finished and moved off
+        needed = bay + self.safety + 1
+        i = np.searchsorted(ahead.bays, needed)
+        if i == 0:
+            return 0.0
+        if i < len(ahead.bays):
+            return ahead.starts[i]
+        return ahead.finish + self.gantry * (needed - ahead.bays[-1])
+
+    def fill(self, target):
+        # Fill cranes from the stern, each with the longest run it can
+        # finish by `target`. Returns the cuts and timelines, or None.
+        b, ahead = self.total, None
+        cuts, timelines = [self.total], []
+        for _ in range(self.cranes):
+            lo, hi = 0, b
+            if self.timeline(lo, b, ahead).finish > target:
+                # Smallest a whose run [a, b) finishes in time
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if self.timeline(mid, b, ahead).finish <= target:
+                        hi = mid
+                    else:
+                        lo = mid
+                a = hi
+            else:
+                a = 0
+            if a == b:
+                # An idle crane here would stand between two working ones
+                return None
+            ahead = self.timeline(a, b, ahead)
+            timelines.append(ahead)
+            cuts.append(a)
+            b = a
+            if b == 0:
+                break
+        if b > 0:
+            return None
+        # Cranes that got no work stay at the bow end
+        timelines += [_Timeline([], [], [], [], []) for _ in range(self.cranes - len(timelines))]
+        cuts += [0] * (self.cranes + 1 - len(cuts))
+        return cuts[::-1], timelines[::-1]
+
+    def lower_bound(self):
+        window = np.convolve(self.per_bay, np.ones(self.safety + 1, dtype=np.int64), mode='valid')
+        busiest = window.max() if len(window) else self.per_bay.sum()
+        return max(self.total / self.cranes, busiest) * self.hours_per_move
+
+    def solve(self, tolerance=0.01):
+        lo = self.lower_bound()
+        hi = self.total * self.hours_per_move + self.gantry * len(self.per_bay)
+        best = self.fill(hi)
+        while hi - lo > tolerance:
+            mid = (lo + hi) / 2
+            result = self.fill(mid)
+            if result is None:
+                lo = mid
+            else:
+                hi, best = mid, result
+        return best
+
+
+class SplitPlan:
+    def __init__(self, splitter, cuts, timelines):
+        self.cuts = cuts
+        self.lower_bound = float(splitter.lower_bound())
+        self.finish = np.array([t.finish for t in timelines])
+        self.makespan = float(self.finish.max())
+        self.safety_bays = splitter.safety
+        self.worklists = self._worklists(splitter, cuts, timelines)
+
+    @property
+    def gap(self):
+        return self.makespan / self.lower_bound - 1
+
+    @staticmethod
+    def _worklists(splitter, cuts, timelines):
+        # One row per crane, bay and operation, in working order
+        workload = splitter.workload
+        ops = workload[OPERATIONS].to_numpy(np.int64)
+        ops_cum = np.c_[np.zeros(len(ops), dtype=np.int64), np.cumsum(ops, axis=1)]
+        rows = []
+        for crane, (line, a, b) in enumerate(zip(timelines, cuts[:-1], cuts[1:]), start=1):
+            for bay, moves, start, end, wait in zip(line.bays, line.moves, line.starts, line.ends, line.waits):
+                # This crane's share of the bay, as positions in operation order
+                offset = max(a, splitter.cum[bay]) - splitter.cum[bay]
+                p1 = splitter.per_bay[bay] - offset
+                p0 = p1 - moves
+                t = start
+                for op, name in enumerate(OPERATIONS):
+                    n = min(p1, ops_cum[bay, op + 1]) - max(p0, ops_cum[bay, op])
+                    if n <= 0:
+                        continue
+                    rows.append((crane, workload.at[bay, 'Bay'], name, int(n), t, t + n * splitter.hours_per_move,
+                                 wait if t == start else 0.0))
+                    t += n * splitter.hours_per_move
+        df = pd.DataFrame(rows, columns=['Crane', 'Bay', 'Operation', 'Moves', 'Start', 'End', 'Wait'])
+        df.insert(1, 'Seq', df.groupby('Crane').cumcount() + 1)
+        df.attrs['bay_index'] = {bay: i for i, bay in enumerate(workload['Bay'])}
+        return df
+
+    def violations(self):
+        # Pairs of tasks on different cranes that overlap in time while fewer
+        # than safety_bays + 1 bays apart, or with cranes out of order
+        df = self.worklists
+        bay = df['Bay'].map(df.attrs['bay_index']).to_numpy()
+        crane, start, end = df['Crane'].to_numpy(), df['Start'].to_numpy(), df['End'].to_numpy()
+        i, j = np.triu_indices(len(df), k=1)
+        overlap = (crane[i] != crane[j]) & (start[i] < end[j] - 1e-9) & (start[j] < end[i] - 1e-9)
+        gap = (bay[j] - bay[i]) * np.sign(crane[j] - crane[i])
+        bad = overlap & (gap <= self.safety_bays)
+        return pd.DataFrame({'Task': i[bad], 'Other': j[bad]})
+
+    def summary(self):
+        return {
+            'cranes': len(self.finish),
+            'moves': int(self.worklists['Moves'].sum()),
+            'makespan_h': round(self.makespan, 2),
+            'lower_bound_h': round(self.lower_bound, 2),
+            'gap_pct': round(100 * self.gap, 1),
+            'wait_h': round(float(self.worklists['Wait'].sum()), 2),
+        }
+
+
+def split(workload, cranes, crane_mph=30.0, safety_bays=1, gantry_min=3.0):
+    # gantry_min: minutes to move a crane one bay and set up there
+    splitter = _Splitter(workload, cranes, crane_mph, safety_bays, gantry_min)
+    cuts, timelines = splitter.solve()
+    return SplitPlan(splitter, cuts, timelines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.crane_split',
+                                     description='Split a vessel between quay cranes.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    demo = sub.add_parser('demo', help='split a synthetic vessel and time it')
+    demo.add_argument('--bays', type=int, default=24)
+    demo.add_argument('--moves', type=int, default=9000)
+    demo.add_argument('--cranes', type=int, default=6)
+    demo.add_argument('--safety-bays', type=int, default=1)
+    demo.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    workload = vessel_workload(args.bays, args.moves, args.seed)
+    start = time.perf_counter()
+    plan = split(workload, args.cranes, safety_bays=args.safety_bays)
+    elapsed = time.perf_counter() - start
+    print(plan.summary())
+    print(plan.worklists.groupby('Crane').agg(Bays=('Bay', 'nunique'), Moves=('Moves', 'sum'),
+                                              Finish=('End', 'max'), Wait=('Wait', 'sum')).round(2).to_string())
+    print(f"\nsplit in {elapsed * 1e3:.0f} ms, {len(plan.violations())} safety distance violations")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
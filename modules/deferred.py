@@ -0,0 +1,26 @@
+"""Deferred imports for heavy third-party modules.
+
+``pd = deferred.module('pandas')`` binds a stand-in that imports pandas the
+first time one of its attributes is used. Modules on the app's startup path
+(the sidebar, search and the catalog) can then name pandas and pyarrow at
+top level without paying for them until a page actually loads a table.
+
+Once imported, the real module's attributes are copied onto the stand-in, so
+later lookups are plain attribute reads.
+"""
+import importlib
+import sys
+
+
+class module:
+    def __init__(self, name):
+        self.__name = name
+
+    def __getattr__(self, attr):
+        real = importlib.import_module(self.__name)
+        self.__dict__.update(vars(real))
+        return getattr(real, attr)
+
+    def __repr__(self):
+        state = 'imported' if self.__name in sys.modules else 'deferred'
+        return f'<{state} module {self.__name!r}>'
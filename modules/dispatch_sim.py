@@ -0,0 +1,311 @@
+"""Horizontal transport dispatch: prime movers or AGVs between quay and yard.
+
+A shift of work is a job list per quay crane, worked in order. Discharge
+jobs run crane -> vehicle -> yard block. Load jobs fetch a box from a yard
+block and bring it to the crane. Every job needs a vehicle under the crane
+when the crane is ready, so a late vehicle is crane waiting time. Each
+yard block hands boxes over with ``yard_cranes`` cranes, and vehicles queue
+there when they are busy. Travel times come from a ``Layout`` of cranes
+along the quay and blocks behind it, with some random variation on every
+trip.
+
+The fleet is dispatched by one of three policies, as on the Terminal
+Operations page:
+
+- ``fixed``: every vehicle belongs to one crane and only does its jobs.
+  After a discharge it returns empty to its crane, even when another crane
+  has a load waiting at the block it just served.
+- ``pooled``: a free vehicle takes the job, on any crane, with the least
+  slack before the crane needs it, counting the empty drive to start it
+  against the job. A box delivered to a block is often followed by a load
+  from the same block.
+- ``hybrid``: ``fixed_share`` of the fleet is fixed, the rest is pooled
+
+No crane is given more than ``lookahead`` jobs in progress at once, so a
+pool cannot pile onto one crane.
+
+The simulation runs on the event queue from modules/port_stay. A shift of
+six cranes (about 1,700 moves) takes a few tens of milliseconds, so whole
+fleet-size sweeps are quick:
+
+    jobs = dispatch_sim.shift_jobs(cranes=6, hours=8)
+    dispatch_sim.simulate(jobs, fleet=30, policy='pooled')
+    dispatch_sim.compare(jobs, fleets=range(12, 49, 6))   # every policy x fleet size
+
+    python -m modules.dispatch_sim demo --fleet 30
+"""
+import argparse
+import math
+import sys
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from modules.port_stay import Engine, Pool
+
+POLICIES = ('fixed', 'hybrid', 'pooled')
+DISCHARGE, LOAD = 0, 1
+EMPTY_WEIGHT = 2.0     # seconds of slack one second of empty driving is worth
+
+
+class DispatchError(ValueError):
+    pass
+
+
+class Layout:
+    # Cranes along the quay, blocks in rows behind it. Travel is along the
+    # terminal's grid of lanes (Manhattan distance) plus a fixed allowance
+    # for turning, positioning and handover.
+
+    def __init__(self, cranes=6, blocks=12, crane_spacing=60.0, block_rows=2, speed=6.0, fixed_s=40.0):
+        crane_x = 150 + crane_spacing * np.arange(cranes)
+        quay_length = crane_x[-1] + 150
+        per_row = math.ceil(blocks / block_rows)
+        block_x = np.tile((np.arange(per_row) + 0.5) * quay_length / per_row, block_rows)[:blocks]
+        block_y = np.repeat(120 + 150 * np.arange(block_rows), per_row)[:blocks]
+        # Nodes: cranes first, then blocks
+        x = np.r_[crane_x, block_x]
+        y = np.r_[np.zeros(cranes), block_y]
+        self.cranes, self.blocks = cranes, blocks
+        self.distance = np.abs(x[:, None] - x[None, :]) + np.abs(y[:, None] - y[None, :])
+        self.travel = self.distance / speed + fixed_s
+
+
+def shift_jobs(cranes=6, hours=8.0, crane_mph=35.0, blocks=12, discharge_share=0.5, seed=0):
+    # Each crane discharges a vessel's imports, then loads its exports, and
+    # the shift catches every crane at a different point in that cycle.
+    # Boxes go to (and come from) a few blocks per crane, mostly those
+    # nearest its bays.
+    rng = np.random.default_rng(seed)
+    moves = int(hours * crane_mph)
+    rows = []
+    for crane in range(cranes):
+        near = np.argsort(np.abs((np.arange(blocks) % (blocks / 2)) / (blocks / 2) - crane / cranes))[:4]
+        discharge = int(round(moves * discharge_share))
+        kind = np.roll(np.r_[np.full(discharge, DISCHARGE), np.full(moves - discharge, LOAD)], rng.integers(moves))
+        block = np.where(rng.random(moves) < 0.8, rng.choice(near, moves), rng.integers(0, blocks, moves))
+        rows.append(pd.DataFrame({'Crane': crane, 'Seq': np.arange(moves), 'Kind': kind, 'Block': block}))
+    return pd.concat(rows, ignore_index=True)
+
+
+class _Shift:
+    # One run: cranes working their job lists, vehicles dispatched between them
+
+    def __init__(self, jobs, layout, fleet, policy, fixed_share, lookahead, crane_mph, yard_mph, yard_cranes, seed):
+        if policy not in POLICIES:
+            raise DispatchError(f"Unknown policy {policy!r}; expected one of {', '.join(POLICIES)}")
+        if fleet < 1:
+            raise DispatchError(f"Fleet must have at least one vehicle, got {fleet}")
+        self.layout = layout
+        cranes = layout.cranes
+        jobs = jobs.sort_values(['Crane', 'Seq'])
+        self.kind = [g.to_numpy() for _, g in jobs.groupby('Crane')['Kind']]
+        self.block = [g.to_numpy() + cranes for _, g in jobs.groupby('Crane')['Block']]   # as layout nodes
+        if len(self.kind) != cranes:
+            raise DispatchError(f"Job list has {len(self.kind)} cranes; the layout has {cranes}")
+        rng = np.random.default_rng(seed)
+        self.engine = Engine()
+        self.yard = [Pool(yard_cranes) for _ in range(layout.blocks)]
+
+        # Random cycle, handover and travel variation, drawn up front
+        n = len(jobs)
+        self.cycle = [rng.gamma(8.0, 3600 / crane_mph / 8.0, len(k)) for k in self.kind]
+        self.yard_service = iter(rng.gamma(6.0, 3600 / yard_mph / 6.0, n).tolist())
+        self.noise = iter(rng.lognormal(0.0, 0.15, 3 * n + fleet).tolist())
+        self.mean_cycle = 3600 / crane_mph
+        self.mean_yard = 3600 / yard_mph
+
+        self.next_job = [0] * cranes            # next job each crane works
+        self.assigned = [0] * cranes            # next job to hand to a vehicle
+        self.ready_at = [0.0] * cranes          # when the crane last became free
+        self.busy = [False] * cranes
+        self.under = [{} for _ in range(cranes)]  # load job -> vehicle waiting under the crane with its box
+        self.empties = [deque() for _ in range(cranes)]   # vehicles waiting to take a discharged box
+        self.lookahead = lookahead or math.ceil(fleet / cranes) + 1
+
+        fixed = fleet if policy == 'fixed' else 0 if policy == 'pooled' else round(fleet * fixed_share)
+        if fixed == fleet and fleet < cranes:
+            # Every vehicle is tied to a crane, so some cranes would get none
+            raise DispatchError(f"{policy.capitalize()} dispatch of {fleet} vehicles leaves cranes without one; "
+                                f"it needs at least one vehicle per crane ({cranes})")
+        self.home = [v % cranes if v < fixed else -1 for v in range(fleet)]
+        self.location = [v % cranes for v in range(fleet)]    # vehicles start at the quay
+        self.since = [0.0] * fleet
+        self.idle = list(range(fleet))
+        self.busy_time = self.empty_time = self.loaded_time = 0.0
+        self.crane_wait = 0.0
+        self.moves = 0
+
+    def _trip(self, vehicle, node, loaded):
+        seconds = self.layout.travel[self.location[vehicle], node] * next(self.noise)
+        if loaded:
+            self.loaded_time += seconds
+        else:
+            self.empty_time += seconds
+        self.location[vehicle] = node
+        return seconds
+
+    def run(self):
+        self._wake()
+        return self.engine.run()
+
+    # Dispatching
+    def _wake(self):
+        idle, self.idle = self.idle, []
+        for vehicle in idle:
+            if not self._dispatch(vehicle):
+                self.idle.append(vehicle)
+
+    def _dispatch(self, vehicle):
+        home = self.home[vehicle]
+        best, best_score = -1, math.inf
+        now = self.engine.now
+        travel = self.layout.travel[self.location[vehicle]]
+        for crane in ([home] if home >= 0 else range(self.layout.cranes)):
+            job = self.assigned[crane]
+            if job >= len(self.kind[crane]) or job - self.next_job[crane] >= self.lookahead:
+                continue
+            # Slack: when the crane will want this job, less how long the
+            # vehicle needs to get under it (straight there for a discharge,
+            # by way of the yard for a load). The least slack goes first, and
+            # empty driving counts against a job.
+            needed = max(now, self.ready_at[crane]) + (job - self.next_job[crane]) * self.mean_cycle
+            if self.kind[crane][job] == DISCHARGE:
+                empty = arrival = travel[crane]
+            else:
+                block = self.block[crane][job]
+                empty = travel[block]
+                arrival = empty + self.mean_yard + self.layout.travel[block, crane]
+            score = needed - arrival + EMPTY_WEIGHT * empty
+            if score < best_score:
+                best, best_score = crane, score
+        if best < 0:
+            return False
+        job = self.assigned[best]
+        self.assigned[best] += 1
+        self.since[vehicle] = now
+        if self.kind[best][job] == DISCHARGE:
+            self.engine.after(self._trip(vehicle, best, False), self._arrive, vehicle, best, job)
+        else:
+            block = self.block[best][job]
+            self.engine.after(self._trip(vehicle, block, False), self.yard[block - self.layout.cranes].request,
+                              self._yard_lift, vehicle, best, job, block)
+        return True
+
+    def _free(self, vehicle):
+        self.busy_time += self.engine.now - self.since[vehicle]
+        if not self._dispatch(vehicle):
+            self.idle.append(vehicle)
+
+    # Yard side
+    def _yard_lift(self, vehicle, crane, job, block):
+        # Load job: the yard crane puts the box on the vehicle, which takes it to the quay
+        self.engine.after(next(self.yard_service), self._loaded, vehicle, crane, job, block)
+
+    def _loaded(self, vehicle, crane, job, block):
+        self.yard[block - self.layout.cranes].release()
+        self.engine.after(self._trip(vehicle, crane, True), self._arrive, vehicle, crane, job)
+
+    def _yard_drop(self, vehicle, block):
+        self.engine.after(next(self.yard_service), self._dropped, vehicle, block)
+
+    def _dropped(self, vehicle, block):
+        self.yard[block - self.layout.cranes].release()
+        self._free(vehicle)
+
+    # Quay side
+    def _arrive(self, vehicle, crane, job):
+        # Load boxes go aboard in stowage order, so each waits for its turn.
+        # A discharged box goes on whichever empty vehicle is first in line.
+        if self.kind[crane][job] == DISCHARGE:
+            self.empties[crane].append(vehicle)
+        else:
+            self.under[crane][job] = vehicle
+        self._start(crane)
+
+    def _start(self, crane):
+        job = self.next_job[crane]
+        if self.busy[crane] or job == len(self.kind[crane]):
+            return
+        if self.kind[crane][job] == DISCHARGE:
+            if not self.empties[crane]:
+                return
+            vehicle = self.empties[crane].popleft()
+        elif job in self.under[crane]:
+            vehicle = self.under[crane].pop(job)
+        else:
+            return
+        self.crane_wait += self.engine.now - self.ready_at[crane]
+        self.busy[crane] = True
+        self.engine.after(self.cycle[crane][job], self._lifted, vehicle, crane, job)
+
+    def _lifted(self, vehicle, crane, job):
+        now = self.engine.now
+        self.busy[crane] = False
+        self.ready_at[crane] = now
+        self.next_job[crane] += 1
+        self.moves += 1
+        if self.kind[crane][job] == DISCHARGE:
+            block = self.block[crane][job]
+            self.engine.after(self._trip(vehicle, block, True), self.yard[block - self.layout.cranes].request,
+                              self._yard_drop, vehicle, block)
+        else:
+            self._free(vehicle)
+        self._start(crane)
+        self._wake()
+
+
+def simulate(jobs, fleet, policy='pooled', layout=None, fixed_share=0.5, lookahead=None,
+             crane_mph=40.0, yard_mph=30.0, yard_cranes=2, seed=0):
+    # crane_mph and yard_mph are the machines' own rates with no waiting.
+    # Returns QC waiting and fleet utilisation for the shift. A vehicle is
+    # utilised from dispatch until it is free again, including time queueing
+    # at a crane or yard block.
+    cranes = int(jobs['Crane'].max()) + 1
+    layout = layout or Layout(cranes, int(jobs['Block'].max()) + 1)
+    start = time.perf_counter()
+    shift = _Shift(jobs, layout, fleet, policy, fixed_share, lookahead, crane_mph, yard_mph, yard_cranes, seed)
+    makespan = shift.run()
+    # Times add up numpy scalars from the random draws, so as plain floats
+    makespan, crane_wait = float(makespan), float(shift.crane_wait)
+    busy, empty, travel = float(shift.busy_time), float(shift.empty_time), float(shift.loaded_time + shift.empty_time)
+    return {
+        'policy': policy,
+        'fleet': fleet,
+        'moves': shift.moves,
+        'makespan_h': round(makespan / 3600, 2),
+        'crane_mph': round(shift.moves / cranes / (makespan / 3600), 1),
+        'qc_wait_h': round(crane_wait / 3600, 2),
+        'qc_wait_pct': round(100 * crane_wait / (cranes * makespan), 1),
+        'utilisation_pct': round(100 * busy / (fleet * makespan), 1),
+        'empty_travel_pct': round(100 * empty / travel, 1),
+        'seconds': round(time.perf_counter() - start, 4),
+    }
+
+
+def compare(jobs, fleets, policies=POLICIES, **options):
+    return pd.DataFrame([simulate(jobs, fleet, policy, **options) for policy in policies for fleet in fleets])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.dispatch_sim',
+                                     description='Compare horizontal transport dispatch policies.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    demo = sub.add_parser('demo', help='simulate one shift under each policy and time it')
+    demo.add_argument('--cranes', type=int, default=6)
+    demo.add_argument('--hours', type=float, default=8.0)
+    demo.add_argument('--fleet', type=int, default=30)
+    demo.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    jobs = shift_jobs(args.cranes, args.hours, seed=args.seed)
+    results = compare(jobs, [args.fleet], seed=args.seed)
+    print(results.to_string(index=False))
+    print(f"\n{len(jobs)} jobs per shift, {results['seconds'].mean() * 1e3:.0f} ms per simulated shift")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
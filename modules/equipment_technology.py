@@ -1,6 +1,6 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, instrument
 
 def show():
     st.markdown('<p class="main-header">🤖 Equipment, Automation & CITOS</p>', unsafe_allow_html=True)
@@ -17,7 +17,7 @@ def show():
     # SECTION 1: Quay-Side Equipment (Vessel Interface)
     # ============================================================================
     
-    st.markdown('<p class="section-header">Quay-Side Equipment: Ship-to-Shore Interface</p>', unsafe_allow_html=True)
+    instrument.section_header('Quay-Side Equipment: Ship-to-Shore Interface')
     
     st.markdown("""
     Quay-side equipment handles the critical interface between vessel and terminal, transferring containers 
@@ -49,56 +49,7 @@ def show():
     """)
     
     # Quay crane specifications
-    qc_specs = pd.DataFrame({
-        'Specification': [
-            'Outreach',
-            'Back Reach',
-            'Lift Height',
-            'Lifting Capacity',
-            'Hoisting Speed (Loaded)',
-            'Trolley Speed',
-            'Gantry Speed',
-            'Target Productivity',
-            'Typical Cost',
-            'Lifespan'
-        ],
-        'Panamax Crane': [
-            '45-50m (13 containers across)',
-            '15m',
-            '35m',
-            '40-50 tonnes',
-            '45 m/min',
-            '180 m/min',
-            '30 m/min',
-            '25-30 GMPH',
-            '$5-8 million',
-            '25-30 years'
-        ],
-        'Post-Panamax Crane': [
-            '50-65m (18 containers across)',
-            '20m',
-            '40m',
-            '50-60 tonnes',
-            '50 m/min',
-            '200 m/min',
-            '35 m/min',
-            '30-35 GMPH',
-            '$10-13 million',
-            '25-30 years'
-        ],
-        'Super Post-Panamax': [
-            '65-80m (24 containers across)',
-            '25m',
-            '50m',
-            '60-65 tonnes',
-            '60 m/min',
-            '240 m/min',
-            '45 m/min',
-            '35-40 GMPH',
-            '$13-18 million',
-            '25-30 years'
-        ]
-    })
+    qc_specs = catalog.load('equipment_technology/qc_specs')
     
     st.dataframe(qc_specs, width='stretch', hide_index=True)
     
@@ -165,7 +116,7 @@ def show():
     # SECTION 2: Yard Equipment (Storage Operations)
     # ============================================================================
     
-    st.markdown('<p class="section-header">Yard Equipment: Container Storage and Handling</p>', unsafe_allow_html=True)
+    instrument.section_header('Yard Equipment: Container Storage and Handling')
     
     st.markdown("""
     Yard equipment moves containers within the storage area, stacking them efficiently and retrieving them 
@@ -298,15 +249,7 @@ def show():
         """)
     
     # Equipment comparison
-    equipment_comparison = pd.DataFrame({
-        'Equipment': ['RTG', 'RMG', 'ARMG', 'Reach Stacker', 'Straddle Carrier'],
-        'Capital Cost ($M)': [2.5, 4.0, 6.0, 0.6, 0.8],
-        'Stacking Height': [6, 7, 10, 4, 3],
-        'Moves/Hour': [12, 18, 23, 6, 8],
-        'Power': ['Diesel', 'Electric', 'Electric', 'Diesel', 'Diesel'],
-        'Automation': ['Manual', 'Semi-auto', 'Full auto', 'Manual', 'Manual'],
-        'Flexibility': ['High', 'Low', 'Low', 'Very High', 'Very High']
-    })
+    equipment_comparison = catalog.load('equipment_technology/equipment_comparison')
     
     st.dataframe(equipment_comparison, width='stretch', hide_index=True)
     
@@ -314,7 +257,7 @@ def show():
     # SECTION 3: Horizontal Transport Equipment
     # ============================================================================
     
-    st.markdown('<p class="section-header">Horizontal Transport: Moving Containers Around Terminal</p>', unsafe_allow_html=True)
+    instrument.section_header('Horizontal Transport: Moving Containers Around Terminal')
     
     st.markdown("""
     Horizontal transport equipment moves containers between quay cranes and yard storage, bridging the 
@@ -422,38 +365,7 @@ def show():
     """)
     
     # PM vs AGV comparison
-    pm_agv_comparison = pd.DataFrame({
-        'Aspect': [
-            'Capital Cost',
-            'Operating Cost',
-            'Labour Required',
-            'Productivity',
-            'Flexibility',
-            'Safety',
-            'Emissions',
-            'Predictability'
-        ],
-        'Prime Movers': [
-            '$100K-150K per unit',
-            'High (fuel, maintenance, labour)',
-            'One driver per PM',
-            '3-4 cycles/hour',
-            'High (human adaptability)',
-            'Moderate (human error risk)',
-            'Diesel emissions',
-            'Variable (driver dependent)'
-        ],
-        'AGVs': [
-            '$300K-500K per unit + infrastructure',
-            'Lower (electricity, maintenance)',
-            'Zero drivers (remote monitoring only)',
-            '6-8 cycles/hour',
-            'Moderate (programmed routes)',
-            'High (no humans in operations)',
-            'Zero (electric)',
-            'High (consistent performance)'
-        ]
-    })
+    pm_agv_comparison = catalog.load('equipment_technology/pm_agv_comparison')
     
     st.dataframe(pm_agv_comparison, width='stretch', hide_index=True)
     
@@ -479,7 +391,7 @@ def show():
     # SECTION 4: Gate Complex Equipment
     # ============================================================================
     
-    st.markdown('<p class="section-header">Gate Complex: Truck Entry and Exit</p>', unsafe_allow_html=True)
+    instrument.section_header('Gate Complex: Truck Entry and Exit')
     
     st.markdown("""
     The gate complex is where external trucks enter and exit the terminal to pick up or deliver containers.
@@ -563,14 +475,7 @@ def show():
     """)
     
     # Gate performance metrics
-    gate_performance = pd.DataFrame({
-        'System Type': ['Traditional Manual', 'Semi-Automated', 'Fully Automated + TAS'],
-        'Transaction Time': ['5-10 minutes', '2-3 minutes', '30-60 seconds'],
-        'Throughput (trucks/hour/lane)': [6-12, 20-30, 60-80],
-        'Labour Required': ['1-2 clerks per lane', '1 clerk per 2-3 lanes', 'Remote monitoring only'],
-        'Accuracy': ['85-90% (human error)', '95-97%', '98-99%'],
-        'Peak Hour Queues': ['30-60 minute waits', '10-15 minute waits', 'No queues']
-    })
+    gate_performance = catalog.load('equipment_technology/gate_performance')
     
     st.dataframe(gate_performance, width='stretch', hide_index=True)
     
@@ -578,7 +483,7 @@ def show():
     # SECTION 5: Automation Levels and Technologies
     # ============================================================================
     
-    st.markdown('<p class="section-header">Automation Levels in Container Terminals</p>', unsafe_allow_html=True)
+    instrument.section_header('Automation Levels in Container Terminals')
     
     st.markdown("""
     Container terminals can be automated to different degrees, from conventional manual operations to 
@@ -586,50 +491,7 @@ def show():
     """)
     
     # Automation levels
-    automation_levels = pd.DataFrame({
-        'Level': [
-            'Level 1: Conventional',
-            'Level 2: Semi-Automated',
-            'Level 3: Highly Automated',
-            'Level 4: Fully Automated'
-        ],
-        'Quay Cranes': [
-            'Manual operation',
-            'Computer-assisted (anti-sway)',
-            'Semi-automated positioning',
-            'Fully automated (ASC)'
-        ],
-        'Horizontal Transport': [
-            'Prime movers (human drivers)',
-            'Prime movers + GPS tracking',
-            'AGVs (automated)',
-            'AGVs or ALVs'
-        ],
-        'Yard Operations': [
-            'RTG (human operators)',
-            'RTG with remote operation',
-            'RMG semi-automated',
-            'ARMG (fully automated)'
-        ],
-        'Gate': [
-            'Manual documentation',
-            'Some OCR, manual verification',
-            'Automated OCR + validation',
-            'Fully automated + TAS'
-        ],
-        'Labour Reduction': [
-            'Baseline (100%)',
-            '20-30% reduction',
-            '50-60% reduction',
-            '70-80% reduction'
-        ],
-        'Examples': [
-            'Most ports worldwide',
-            'Many modern terminals',
-            'Singapore PSA (some terminals)',
-            'Rotterdam (Maasvlakte II), Hamburg (CTA), Los Angeles (LBCT), Singapore (Tuas Phase 1)'
-        ]
-    })
+    automation_levels = catalog.load('equipment_technology/automation_levels')
     
     st.dataframe(automation_levels, width='stretch', hide_index=True)
     
@@ -691,7 +553,7 @@ def show():
     # SECTION 6: Non-Conventional Terminal Layouts
     # ============================================================================
     
-    st.markdown('<p class="section-header">Non-Conventional Terminal Layouts</p>', unsafe_allow_html=True)
+    instrument.section_header('Non-Conventional Terminal Layouts')
     
     st.markdown("""
     Some automated terminals use innovative layouts that differ from conventional parallel-to-quay designs.
@@ -741,7 +603,7 @@ def show():
     # SECTION 7: PSA CITOS - Terminal Operating System
     # ============================================================================
     
-    st.markdown('<p class="section-header">PSA CITOS®: Comprehensive Terminal Operating System</p>', unsafe_allow_html=True)
+    instrument.section_header('PSA CITOS®: Comprehensive Terminal Operating System')
     
     st.markdown("""
     **CITOS (Computer Integrated Terminal Operation System)** is PSA's proprietary Terminal Operating 
@@ -769,44 +631,7 @@ def show():
     st.markdown('<p class="subsection-header">CITOS Core Modules</p>', unsafe_allow_html=True)
     
     # CITOS modules
-    citos_modules = pd.DataFrame({
-        'Module': [
-            'Berth Planning Module',
-            'Vessel Planning Module',
-            'Yard Planning Module',
-            'Resource Planning Module',
-            'Equipment Control Module',
-            'Gate Operating Module',
-            'Reefer Monitoring Module',
-            'Dangerous Goods Module',
-            'PORTNET Integration',
-            'Billing Module'
-        ],
-        'Primary Functions': [
-            'Allocate vessels to berths, optimise BOA, schedule berth windows',
-            'Generate discharge/loading plans, stowage coordination, crane work lists',
-            'Allocate yard locations, minimise re-handles, track inventory',
-            'Schedule QCs, YCs, PMs/AGVs, optimise utilisation',
-            'Real-time dispatching, tracking, performance monitoring',
-            'Truck appointments, OCR integration, automated authorisation',
-            'Monitor temperature, power connections, alarms for refrigerated containers',
-            'Track DG containers, ensure segregation compliance, safety alerts',
-            'Exchange data with port authority, customs, shipping lines',
-            'Track transactions, generate invoices, payment processing'
-        ],
-        'Key Technologies': [
-            'Optimisation algorithms, conflict resolution',
-            'Stability calculations, AI-powered stowage optimisation',
-            'Machine learning for location prediction, re-handle minimisation',
-            'Real-time optimisation, predictive maintenance alerts',
-            'Fleet management, collision avoidance, route optimisation',
-            'OCR, automated validation, TAS integration',
-            'IoT sensors, automated alerts, remote monitoring',
-            'Regulatory database, automated checking',
-            'EDI, APIs, real-time data exchange',
-            'Automated invoicing, payment tracking'
-        ]
-    })
+    citos_modules = catalog.load('equipment_technology/citos_modules')
     
     st.dataframe(citos_modules, width='stretch', hide_index=True)
     
@@ -912,7 +737,7 @@ def show():
     # SECTION 8: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
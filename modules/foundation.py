@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, instrument, page_cache
 
 def show():
     st.markdown('<p class="main-header">⚓ Maritime Industry Foundation</p>', unsafe_allow_html=True)
@@ -17,7 +18,7 @@ def show():
     # SECTION 1: Why Maritime Matters
     # ============================================================================
     
-    st.markdown('<p class="section-header">Why Maritime Trade Matters</p>', unsafe_allow_html=True)
+    instrument.section_header('Why Maritime Trade Matters')
     
     st.markdown("""
     Maritime shipping is the backbone of global commerce, yet it operates largely out of sight. 
@@ -67,7 +68,7 @@ def show():
     # SECTION 2: The Container Revolution
     # ============================================================================
     
-    st.markdown('<p class="section-header">The Container Revolution: How a Simple Box Changed Everything</p>', unsafe_allow_html=True)
+    instrument.section_header('The Container Revolution: How a Simple Box Changed Everything')
     
     st.markdown("""
     Before containerisation, shipping was slow, expensive, and labour-intensive. The introduction of 
@@ -172,7 +173,7 @@ def show():
     # SECTION 3: Three Waves of Change
     # ============================================================================
     
-    st.markdown('<p class="section-header">Three Waves of Change Reshaping Maritime</p>', unsafe_allow_html=True)
+    instrument.section_header('Three Waves of Change Reshaping Maritime')
     
     st.markdown("""
     The maritime industry is currently experiencing three simultaneous transformations that are fundamentally 
@@ -220,50 +221,50 @@ def show():
     """)
     
     # Vessel size evolution chart
-    vessel_evolution = pd.DataFrame({
-        'Year': [1956, 1980, 2000, 2010, 2015, 2020, 2024],
-        'Max Vessel Size (TEU)': [500, 4500, 8000, 15000, 18400, 24000, 25000],
-        'Typical Vessel (TEU)': [500, 3000, 5000, 8000, 10000, 14000, 16000]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=vessel_evolution['Year'],
-        y=vessel_evolution['Max Vessel Size (TEU)'],
-        mode='lines+markers',
-        name='Maximum Vessel Size',
-        line=dict(color='#EF4444', width=3),
-        marker=dict(size=10),
-        fill='tonexty'
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=vessel_evolution['Year'],
-        y=vessel_evolution['Typical Vessel (TEU)'],
-        mode='lines+markers',
-        name='Typical New Vessel Size',
-        line=dict(color='#3B82F6', width=3),
-        marker=dict(size=10),
-        fill='tozeroy',
-        fillcolor='rgba(59, 130, 246, 0.2)'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Container Vessel Size Evolution (1956-2024)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Vessel Capacity (TEU)",
-        height=400,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB'),
-        xaxis=dict(gridcolor='#E5E7EB'),
-        legend=dict(x=0.02, y=0.98)
-    )
+    vessel_evolution = catalog.load('foundation/vessel_evolution')
+    
+    def build_vessel_evolution_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=vessel_evolution['Year'],
+            y=vessel_evolution['Max Vessel Size (TEU)'],
+            mode='lines+markers',
+            name='Maximum Vessel Size',
+            line=dict(color='#EF4444', width=3),
+            marker=dict(size=10),
+            fill='tonexty'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=vessel_evolution['Year'],
+            y=vessel_evolution['Typical Vessel (TEU)'],
+            mode='lines+markers',
+            name='Typical New Vessel Size',
+            line=dict(color='#3B82F6', width=3),
+            marker=dict(size=10),
+            fill='tozeroy',
+            fillcolor='rgba(59, 130, 246, 0.2)'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Container Vessel Size Evolution (1956-2024)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Vessel Capacity (TEU)",
+            height=400,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB'),
+            xaxis=dict(gridcolor='#E5E7EB'),
+            legend=dict(x=0.02, y=0.98)
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'vessel_evolution_chart', build_vessel_evolution_chart, deps=(vessel_evolution,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -335,39 +336,39 @@ def show():
     """)
     
     # Alliance market share
-    alliance_data = pd.DataFrame({
-        'Year': [2000, 2005, 2010, 2015, 2020, 2024],
-        'Alliance Control (%)': [0, 15, 35, 75, 82, 83],
-        'Major Carriers': [17, 15, 15, 15, 10, 9]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=alliance_data['Year'],
-        y=alliance_data['Alliance Control (%)'],
-        mode='lines+markers',
-        name='Alliance Control %',
-        line=dict(color='#10B981', width=4),
-        marker=dict(size=12),
-        fill='tozeroy',
-        fillcolor='rgba(16, 185, 129, 0.2)'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Alliance Control of Global Container Capacity (2000-2024)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Alliance Control (%)",
-        height=400,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 100]),
-        xaxis=dict(gridcolor='#E5E7EB')
-    )
+    alliance_data = catalog.load('foundation/alliance_data')
+    
+    def build_alliance_share_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=alliance_data['Year'],
+            y=alliance_data['Alliance Control (%)'],
+            mode='lines+markers',
+            name='Alliance Control %',
+            line=dict(color='#10B981', width=4),
+            marker=dict(size=12),
+            fill='tozeroy',
+            fillcolor='rgba(16, 185, 129, 0.2)'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Alliance Control of Global Container Capacity (2000-2024)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Alliance Control (%)",
+            height=400,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 100]),
+            xaxis=dict(gridcolor='#E5E7EB')
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'alliance_share_chart', build_alliance_share_chart, deps=(alliance_data,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -433,47 +434,39 @@ def show():
     """)
     
     # Trade pattern changes
-    trade_changes = pd.DataFrame({
-        'Country': ['Vietnam', 'Mexico', 'Malaysia', 'Thailand', 'India', 'Poland', 'China'],
-        'Export Growth 2018-2022 (%)': [80, 42, 45, 41, 35, 28, -0.4],
-        'Primary Driver': [
-            'China+1, electronics',
-            'Nearshoring to US',
-            'Electronics, E&E',
-            'Automotive, electronics',
-            'Pharma, IT, textiles',
-            'Nearshoring to EU',
-            'US trade tensions'
-        ]
-    })
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=trade_changes['Country'],
-            y=trade_changes['Export Growth 2018-2022 (%)'],
-            marker=dict(color=['#10B981' if x >=0 else '#EF4444' for x in trade_changes['Export Growth 2018-2022 (%)']]),
-            text=trade_changes['Export Growth 2018-2022 (%)'],
-            texttemplate='%{text}%',
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Growth: %{y}%<br>Driver: %{customdata}<extra></extra>',
-            customdata=trade_changes['Primary Driver']
+    trade_changes = catalog.load('foundation/trade_changes')
+    
+    def build_trade_changes_chart():
+        fig = go.Figure(data=[
+            go.Bar(
+                x=trade_changes['Country'],
+                y=trade_changes['Export Growth 2018-2022 (%)'],
+                marker=dict(color=['#10B981' if x >=0 else '#EF4444' for x in trade_changes['Export Growth 2018-2022 (%)']]),
+                text=trade_changes['Export Growth 2018-2022 (%)'],
+                texttemplate='%{text}%',
+                textposition='outside',
+                hovertemplate='<b>%{x}</b><br>Growth: %{y}%<br>Driver: %{customdata}<extra></extra>',
+                customdata=trade_changes['Primary Driver']
+            )
+        ])
+        
+        fig.update_layout(
+            title={
+                'text': 'Export Growth: China+1 Beneficiaries (2018-2022)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Country",
+            yaxis_title="Change in Imports from China by USA (%)",
+            height=450,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB'),
+            xaxis=dict(tickangle=-45)
         )
-    ])
-    
-    fig.update_layout(
-        title={
-            'text': 'Export Growth: China+1 Beneficiaries (2018-2022)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Country",
-        yaxis_title="Change in Imports from China by USA (%)",
-        height=450,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB'),
-        xaxis=dict(tickangle=-45)
-    )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'trade_changes_chart', build_trade_changes_chart, deps=(trade_changes,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -506,7 +499,7 @@ def show():
     # SECTION 4: Maritime Economics
     # ============================================================================
     
-    st.markdown('<p class="section-header">Maritime Economics: The Business of Shipping</p>', unsafe_allow_html=True)
+    instrument.section_header('Maritime Economics: The Business of Shipping')
     
     st.markdown("""
     Understanding the economics helps explain why ports and shipping lines make certain strategic decisions.
@@ -593,7 +586,7 @@ def show():
     # SECTION 5: Current Industry Challenges & Future Outlook
     # ============================================================================
     
-    st.markdown('<p class="section-header">Current Industry Challenges (2024-2025)</p>', unsafe_allow_html=True)
+    instrument.section_header('Current Industry Challenges (2024-2025)')
     
     col1, col2 = st.columns(2)
     
@@ -656,7 +649,7 @@ def show():
     # SECTION 6: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -0,0 +1,115 @@
+"""Gantt charts for plans with thousands of bars.
+
+``figure()`` draws every bar of a plan as one horizontal go.Bar trace built
+from column arrays. Per-bar text and hover fields go into ``customdata``.
+The text and hover templates name columns in braces, with an optional d3
+format, and are translated to ``%{customdata[i]}`` references:
+
+    gantt.figure(plan, lane='Berth', start='Start', duration='Hours',
+                 text='{Vessel}<br>{Hours:.0f}h',
+                 hover='<b>{Vessel}</b><br>Start: {Start:.1f}h',
+                 wait='Wait', window=(0, 48))
+
+Only bars that overlap ``window`` are sent, with the x-axis fixed to it.
+Panning to another window is a new figure rather than client-side zoom over
+the whole plan. When a window holds more bars than the chart has pixels
+(``width_px``), bars in a lane that are less than ``merge_px`` pixels apart
+are merged into one "busy" block, which is all that resolution can show.
+Bar labels are drawn only up to ``label_limit`` bars.
+"""
+import re
+
+import numpy as np
+import plotly.graph_objects as go
+
+PALETTE = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4', '#EC4899']
+WAIT_COLOR = 'rgba(156, 163, 175, 0.35)'
+BUSY_COLOR = '#60A5FA'
+
+_FIELD = re.compile(r'\{([^{}:]+)(?::([^{}]*))?\}')
+
+
+def _template(template, columns):
+    # '{Vessel} {Hours:.0f}h' -> '%{customdata[0]} %{customdata[1]:.0f}h'
+    def replace(match):
+        name, fmt = match.group(1), match.group(2)
+        if name not in columns:
+            columns.append(name)
+        return f'%{{customdata[{columns.index(name)}]{":" + fmt if fmt else ""}}}'
+
+    return _FIELD.sub(replace, template)
+
+
+def merge_bars(lanes, starts, ends, gap):
+    # Merges bars in the same lane that are less than gap apart. Returns the
+    # merged (lanes, starts, ends, counts); inputs need not be sorted.
+    codes = np.unique(lanes, return_inverse=True)[1]
+    order = np.lexsort((starts, codes))
+    lanes, codes, starts, ends = lanes[order], codes[order], starts[order], ends[order]
+    # Running maximum end within each lane: lanes are offset so that one
+    # accumulate over the whole array never carries across a lane boundary
+    offset = codes * (ends.max() - starts.min() + gap + 1)
+    reach = np.maximum.accumulate(ends + offset) - offset
+    new_block = np.r_[True, (codes[1:] != codes[:-1]) | (starts[1:] - reach[:-1] >= gap)]
+    block_starts = np.flatnonzero(new_block)
+    counts = np.diff(np.r_[block_starts, len(starts)])
+    return (lanes[block_starts], starts[block_starts],
+            np.maximum.reduceat(ends, block_starts), counts)
+
+
+def figure(plan, lane, start, duration, text=None, hover=None, wait=None, window=None,
+           width_px=1000, merge_px=2, label_limit=60, colors=PALETTE):
+    starts = plan[start].to_numpy(float)
+    durations = plan[duration].to_numpy(float)
+    waits = plan[wait].to_numpy(float) if wait else np.zeros(len(plan))
+    lanes = plan[lane].to_numpy()
+    color = np.asarray(colors, dtype=object)[np.arange(len(plan)) % len(colors)]
+
+    if window is None:
+        window = (float(np.min(starts - waits, initial=0)), float(np.max(starts + durations, initial=1)))
+    visible = (starts + durations > window[0]) & (starts - waits < window[1])
+    if not visible.all():
+        plan, starts, durations, waits, lanes, color = (
+            plan[visible], starts[visible], durations[visible], waits[visible], lanes[visible], color[visible])
+
+    fig = go.Figure()
+    hours_per_px = (window[1] - window[0]) / width_px
+    if len(plan) > width_px:
+        # More bars than pixels: draw lane occupancy instead of single calls
+        lanes, block_starts, block_ends, counts = merge_bars(
+            lanes, starts, starts + durations, merge_px * hours_per_px)
+        fig.add_trace(go.Bar(
+            x=block_ends - block_starts, y=lanes, base=block_starts, orientation='h',
+            marker=dict(color=BUSY_COLOR),
+            customdata=np.column_stack([counts, block_starts, block_ends]),
+            hovertemplate='%{y}<br>%{customdata[0]} calls<br>'
+                          '%{customdata[1]:.1f}h - %{customdata[2]:.1f}h<extra></extra>',
+        ))
+    else:
+        waiting = waits > 0
+        if waiting.any():
+            fig.add_trace(go.Bar(
+                x=waits[waiting], y=lanes[waiting], base=(starts - waits)[waiting], orientation='h',
+                marker=dict(color=WAIT_COLOR, line=dict(color='#9CA3AF', width=1)),
+                customdata=np.column_stack([waits[waiting]]),
+                hovertemplate='Waiting %{customdata[0]:.1f}h<extra></extra>',
+            ))
+
+        columns = []
+        bar = dict(x=durations, y=lanes, base=starts, orientation='h', marker=dict(color=list(color)))
+        if hover:
+            bar['hovertemplate'] = _template(hover, columns) + '<extra></extra>'
+        if text and len(plan) <= label_limit:
+            bar['texttemplate'] = _template(text, columns)
+            bar['textposition'] = 'inside'
+        if columns:
+            bar['customdata'] = np.column_stack([plan[c].to_numpy() for c in columns])
+        fig.add_trace(go.Bar(**bar))
+
+    fig.update_layout(
+        barmode='overlay',
+        showlegend=False,
+        xaxis=dict(range=list(window)),
+        yaxis=dict(categoryorder='category descending'),
+    )
+    return fig
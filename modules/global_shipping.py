@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, page_cache, sections
 
 def show():
     st.markdown('<p class="main-header">🌍 Global Shipping & Alliances</p>', unsafe_allow_html=True)
@@ -13,12 +14,34 @@ def show():
     </div>
     """, unsafe_allow_html=True)
     
+    _industry_consolidation()
+    _the_great_reshuffling_of_2025()
+    _the_new_alliance_structure_2025_present()
+    _how_alliances_work()
+    _hub_and_spoke_network_model()
+    _major_trade_routes()
+    _geopolitics_and_trade_shifts()
+    _key_takeaways()
+    
     # ============================================================================
-    # SECTION 1: Industry Consolidation
+    # Navigation
     # ============================================================================
     
-    st.markdown('<p class="section-header">Industry Consolidation: From Many to Few</p>', unsafe_allow_html=True)
-    
+    st.markdown("---")
+    st.markdown("### 📚 Continue Learning")
+    st.markdown("""
+    **Next Topic:** 🇸🇬 Maritime Singapore Ecosystem - Explore Singapore's comprehensive maritime cluster, 
+    MPA's dual role as regulator and developer, the Tuas Port mega-project, and the innovation ecosystem 
+    driving maritime technology forward in Singapore's quest to remain the world's premier maritime hub.
+    """)
+
+
+# ============================================================================
+# SECTION 1: Industry Consolidation
+# ============================================================================
+
+@sections.section('Industry Consolidation: From Many to Few', lazy=False)
+def _industry_consolidation():
     st.markdown("""
     The container shipping industry has undergone dramatic consolidation over the past two decades. 
     What was once a fragmented industry with dozens of independent carriers is now dominated by 
@@ -62,58 +85,61 @@ def show():
     """)
     
     # Industry consolidation data - updated through 2025
-    consolidation_data = pd.DataFrame({
-        'Year': [2000, 2005, 2010, 2015, 2017, 2020, 2024, 2025],
-        'Number of Major Carriers': [17, 15, 15, 15, 12, 10, 9, 9],
-        'Top 3 Market Share (%)': [28, 32, 35, 39, 42, 48, 52, 54],
-        'Alliance/Group Control (%)': [0, 15, 35, 60, 75, 82, 83, 80]
-    })
+    consolidation_data = catalog.load('global_shipping/consolidation_data')
     
     # Create side-by-side charts
     col1, col2 = st.columns(2)
     
     with col1:
-        fig1 = go.Figure()
-        fig1.add_trace(go.Scatter(
-            x=consolidation_data['Year'],
-            y=consolidation_data['Alliance/Group Control (%)'],
-            mode='lines+markers',
-            fill='tozeroy',
-            line=dict(color='#3B82F6', width=3),
-            marker=dict(size=10),
-            name='Alliance/Group Control'
-        ))
-        fig1.update_layout(
-            title='Alliance/Group Control Growth',
-            xaxis_title="Year",
-            yaxis_title="Market Control (%)",
-            height=350,
-            plot_bgcolor='white',
-            yaxis=dict(gridcolor='#E5E7EB', range=[0, 100]),
-            xaxis=dict(gridcolor='#E5E7EB')
-        )
+        def build_alliance_control_chart():
+            fig1 = go.Figure()
+            fig1.add_trace(go.Scatter(
+                x=consolidation_data['Year'],
+                y=consolidation_data['Alliance/Group Control (%)'],
+                mode='lines+markers',
+                fill='tozeroy',
+                line=dict(color='#3B82F6', width=3),
+                marker=dict(size=10),
+                name='Alliance/Group Control'
+            ))
+            fig1.update_layout(
+                title='Alliance/Group Control Growth',
+                xaxis_title="Year",
+                yaxis_title="Market Control (%)",
+                height=350,
+                plot_bgcolor='white',
+                yaxis=dict(gridcolor='#E5E7EB', range=[0, 100]),
+                xaxis=dict(gridcolor='#E5E7EB')
+            )
+            return fig1
+        
+        fig1 = page_cache.figure(__name__, 'alliance_control_chart', build_alliance_control_chart, deps=(consolidation_data,))
         st.plotly_chart(fig1, use_container_width=True)
     
     with col2:
-        fig2 = go.Figure()
-        fig2.add_trace(go.Scatter(
-            x=consolidation_data['Year'],
-            y=consolidation_data['Number of Major Carriers'],
-            mode='lines+markers',
-            fill='tozeroy',
-            line=dict(color='#EF4444', width=3),
-            marker=dict(size=10),
-            name='Major Carriers'
-        ))
-        fig2.update_layout(
-            title='Number of Major Players Declining',
-            xaxis_title="Year",
-            yaxis_title="Number of Major Carriers",
-            height=350,
-            plot_bgcolor='white',
-            yaxis=dict(gridcolor='#E5E7EB', range=[0, 20]),
-            xaxis=dict(gridcolor='#E5E7EB')
-        )
+        def build_carrier_count_chart():
+            fig2 = go.Figure()
+            fig2.add_trace(go.Scatter(
+                x=consolidation_data['Year'],
+                y=consolidation_data['Number of Major Carriers'],
+                mode='lines+markers',
+                fill='tozeroy',
+                line=dict(color='#EF4444', width=3),
+                marker=dict(size=10),
+                name='Major Carriers'
+            ))
+            fig2.update_layout(
+                title='Number of Major Players Declining',
+                xaxis_title="Year",
+                yaxis_title="Number of Major Carriers",
+                height=350,
+                plot_bgcolor='white',
+                yaxis=dict(gridcolor='#E5E7EB', range=[0, 20]),
+                xaxis=dict(gridcolor='#E5E7EB')
+            )
+            return fig2
+        
+        fig2 = page_cache.figure(__name__, 'carrier_count_chart', build_carrier_count_chart, deps=(consolidation_data,))
         st.plotly_chart(fig2, use_container_width=True)
     
     st.markdown("""
@@ -140,13 +166,15 @@ def show():
     - **"Get big or get out"** became industry mantra
     - Only the largest survived profitably
     """)
-    
-    # ============================================================================
-    # SECTION 2: The Great Reshuffling of 2025
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">The Great Reshuffling of 2025</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 2: The Great Reshuffling of 2025
+# ============================================================================
+
+@sections.section('The Great Reshuffling of 2025')
+def _the_great_reshuffling_of_2025():
     st.markdown("""
     <div class="warning-box">
     <strong>⚠️ MAJOR INDUSTRY RESTRUCTURING - February 1, 2025</strong><br>
@@ -159,35 +187,7 @@ def show():
     st.markdown('<p class="subsection-header">Timeline of the 2025 Reshuffling</p>', unsafe_allow_html=True)
     
     # Timeline
-    timeline_data = pd.DataFrame({
-        'Date': [
-            'January 2023',
-            'January 17, 2024',
-            'September 9, 2024',
-            'January 31, 2025',
-            'February 1, 2025',
-            'February-May 2025',
-            'June 2025'
-        ],
-        'Event': [
-            '2M Alliance Dissolution Announced',
-            'Gemini Cooperation Announced',
-            'Premier Alliance Announced',
-            'Last Day of 2M and THE Alliances',
-            'New Alliance Structure Takes Effect',
-            'Transition Period (Network Phase-In)',
-            'Gemini Fully Operational'
-        ],
-        'Impact': [
-            'MSC & Maersk announce end of 10-year partnership (effective Jan 2025)',
-            'Maersk + Hapag-Lloyd announce new long-term cooperation starting Feb 2025',
-            'ONE + HMM + Yang Ming announce 5-year cooperation (THE rebranded)',
-            '2M ends after decade; Hapag-Lloyd exits THE Alliance 2 years early',
-            'Ocean (unchanged), Gemini (new), Premier (rebranded), MSC (solo) begin',
-            'Gradual rollout of new networks, services, port rotations',
-            'All Gemini vessels operating on new schedules, >90% reliability target'
-        ]
-    })
+    timeline_data = catalog.load('global_shipping/timeline_data')
     
     st.dataframe(timeline_data, use_container_width=True, hide_index=True)
     
@@ -221,56 +221,49 @@ def show():
     - Can optimise network for its own strategic priorities
     - Retains slot exchange partnerships (e.g., with ZIM on trans-Pacific)
     """)
-    
-    # ============================================================================
-    # SECTION 3: The New Alliance Structure (2025-Present)
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">The New Alliance Structure (2025-Present)</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 3: The New Alliance Structure (2025-Present)
+# ============================================================================
+
+@sections.section('The New Alliance Structure (2025-Present)')
+def _the_new_alliance_structure_2025_present():
     st.markdown("""
     As of February 1, 2025, global container shipping is organised into **four competitive groups**: 
     three alliances (Ocean Alliance, Gemini Cooperation, Premier Alliance) plus MSC operating independently.
     """)
     
     # New alliance data (2025)
-    alliance_data_2025 = pd.DataFrame({
-        'Group': ['Ocean Alliance', 'Gemini Cooperation', 'MSC (Independent)', 'Premier Alliance', 'Other Independents'],
-        'Market Share (%)': [29, 21, 20, 11, 19],
-        'Total Capacity (M TEU)': [8.91, 6.75, 7.10, 3.57, 6.5],
-        'Operational Capacity (M TEU)': [3.8, 3.4, 6.4, 3.0, 'N/A'],
-        'Number of Vessels (Operational)': [330, 290, 886, 250, 'Varies'],
-        'Key Members': [
-            'CMA CGM, COSCO, OOCL, Evergreen',
-            'Maersk, Hapag-Lloyd',
-            'MSC only',
-            'ONE, HMM, Yang Ming',
-            'ZIM, Wan Hai, PIL, others'
-        ]
-    })
+    alliance_data_2025 = catalog.load('global_shipping/alliance_data_2025')
     
     st.dataframe(alliance_data_2025, use_container_width=True, hide_index=True)
     
     # Market share visualization
-    fig = go.Figure(data=[go.Pie(
-        labels=alliance_data_2025['Group'],
-        values=alliance_data_2025['Market Share (%)'],
-        marker=dict(colors=['#10B981', '#3B82F6', '#EF4444', '#F59E0B', '#94A3B8']),
-        textinfo='label+percent',
-        textfont=dict(size=13, color='white'),
-        hole=0.4
-    )])
-    
-    fig.update_layout(
-        title={
-            'text': 'Global Container Shipping Market Share by Group (February 2025)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        annotations=[dict(text='Total<br>Market', x=0.5, y=0.5, font_size=16, showarrow=False)],
-        height=450
-    )
+    def build_alliance_share_chart():
+        fig = go.Figure(data=[go.Pie(
+            labels=alliance_data_2025['Group'],
+            values=alliance_data_2025['Market Share (%)'],
+            marker=dict(colors=['#10B981', '#3B82F6', '#EF4444', '#F59E0B', '#94A3B8']),
+            textinfo='label+percent',
+            textfont=dict(size=13, color='white'),
+            hole=0.4
+        )])
+        
+        fig.update_layout(
+            title={
+                'text': 'Global Container Shipping Market Share by Group (February 2025)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            annotations=[dict(text='Total<br>Market', x=0.5, y=0.5, font_size=16, showarrow=False)],
+            height=450
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'alliance_share_chart', build_alliance_share_chart, deps=(alliance_data_2025,))
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -537,77 +530,18 @@ def show():
     # Comparison table
     st.markdown('<p class="subsection-header">Alliance Comparison (2025)</p>', unsafe_allow_html=True)
     
-    comparison_table = pd.DataFrame({
-        'Metric': [
-            'Market Share',
-            'Combined Capacity',
-            'Operational Capacity',
-            'Vessel Count',
-            'Average Vessel Size',
-            'Primary Strategy',
-            'Port Coverage',
-            'Reliability Target',
-            'Environmental Target',
-            'Competitive Advantage'
-        ],
-        'Ocean Alliance': [
-            '29% (Largest)',
-            '8.91M TEU',
-            '3.8M TEU (~330 ships)',
-            '~390 total',
-            '~13,200 TEU',
-            'Balanced: Coverage + Service',
-            'Widest (multiple calls)',
-            'Industry standard (~60%)',
-            'Varied by member',
-            'Scale, Asia strength, stability'
-        ],
-        'Gemini': [
-            '21%',
-            '6.75M TEU',
-            '3.4M TEU (~290 ships)',
-            '290-340 total',
-            '~12,400 TEU',
-            'Reliability over coverage',
-            'Hub-and-spoke (12 hubs)',
-            '>90% (unprecedented)',
-            'Ambitious (2040/2045)',
-            'Reliability, controlled terminals, quality'
-        ],
-        'MSC (Solo)': [
-            '20%',
-            '7.1M TEU',
-            '6.4M TEU (~886 ships)',
-            '886 total',
-            '~13,200 TEU',
-            'Maximum coverage, volume',
-            'Direct calls, many ports',
-            'Not disclosed',
-            'LNG focus',
-            'Scale, flexibility, growth capacity'
-        ],
-        'Premier': [
-            '11% (Smallest)',
-            '3.57M TEU',
-            '~3.0M TEU (~250 ships)',
-            '~250 total',
-            '~11,900 TEU',
-            'Focus on core East-West',
-            'Strategic routes',
-            'Industry standard',
-            'Varied by member',
-            'Northeast Asia expertise, agility'
-        ]
-    })
+    comparison_table = catalog.load('global_shipping/comparison_table')
     
     st.dataframe(comparison_table, use_container_width=True, hide_index=True)
-    
-    # ============================================================================
-    # SECTION 4: How Alliances Work
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">How Shipping Alliances Work</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 4: How Alliances Work
+# ============================================================================
+
+@sections.section('How Shipping Alliances Work')
+def _how_alliances_work():
     st.markdown("""
     Alliances are operational partnerships, not mergers. Understanding what they share (and don't share) 
     is crucial to understanding modern maritime operations.
@@ -706,44 +640,7 @@ def show():
     # Benefits visualization
     st.markdown('<p class="subsection-header">Why Alliances Exist: The Benefits</p>', unsafe_allow_html=True)
     
-    alliance_benefits = pd.DataFrame({
-        'Benefit': [
-            'Network Coverage',
-            'Service Frequency',
-            'Vessel Utilisation',
-            'Port Negotiation',
-            'Operational Flexibility',
-            'Risk Sharing',
-            'Capital Efficiency'
-        ],
-        'Without Alliance': [
-            'Carrier serves 50-100 ports alone',
-            'Weekly service requires 6-8 vessels alone',
-            '70-80% full (must absorb empty slots)',
-            'Small carrier, weak negotiating position',
-            'Limited - constrained by own fleet',
-            'Full exposure to market volatility alone',
-            'Must own full fleet for all routes'
-        ],
-        'With Alliance': [
-            'Alliance serves 200+ ports collectively',
-            'Daily service with 3-4 vessels per carrier',
-            '85-90% full (partners fill empty slots)',
-            'Large alliance, strong negotiating leverage',
-            'Can swap capacity across partner routes',
-            'Shared exposure - smoother revenue',
-            'Share vessels, reduce capital needs'
-        ],
-        'Impact': [
-            'More destinations served at lower cost',
-            'Attractive to shippers (more sailing options)',
-            '15-20% efficiency gain per vessel',
-            '20-30% lower terminal costs',
-            'Better adapt to demand fluctuations',
-            'Lower earnings volatility',
-            '30-40% less capital required per carrier'
-        ]
-    })
+    alliance_benefits = catalog.load('global_shipping/alliance_benefits')
     
     st.dataframe(alliance_benefits, use_container_width=True, hide_index=True)
     
@@ -752,13 +649,15 @@ def show():
     Alliances enable carriers to offer better service at lower cost than operating alone, while still 
     competing on price. This benefits both carriers (lower costs) and shippers (more choice, competitive pricing).
     """)
-    
-    # ============================================================================
-    # SECTION 5: Hub-and-Spoke Network Model
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Hub-and-Spoke Network Model</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 5: Hub-and-Spoke Network Model
+# ============================================================================
+
+@sections.section('Hub-and-Spoke Network Model')
+def _hub_and_spoke_network_model():
     st.markdown("""
     Modern container shipping operates primarily on a **hub-and-spoke model**, where large vessels connect 
     major hub ports, and smaller feeder vessels distribute cargo to regional ports. This model dominates 
@@ -848,41 +747,10 @@ def show():
     - Most cargo globally (85%+) goes via hub-and-spoke, not point-to-point
     """)
     
-    st.markdown('<p class="subsection-header">Singapore: The World's Premier Hub</p>', unsafe_allow_html=True)
+    st.markdown('<p class="subsection-header">Singapore: The World\'s Premier Hub</p>', unsafe_allow_html=True)
     
     # Singapore statistics
-    singapore_stats = pd.DataFrame({
-        'Metric': [
-            'Container Throughput (2024)',
-            'Transshipment Percentage',
-            'Shipping Lines Calling',
-            'Ports Connected',
-            'Vessel Calls per Year',
-            'Weekly Container Services',
-            'Average Vessel Size',
-            'Geographic Advantage'
-        ],
-        'Value': [
-            '39.9 million TEU (world #2 after Shanghai)',
-            '85% (highest among major ports)',
-            '200+ shipping lines',
-            '600+ ports in 120+ countries',
-            '140,000+ vessel calls',
-            '1,000+ weekly services',
-            '8,000-12,000 TEU average',
-            'On major trade routes: Asia-Europe, Intra-Asia, Trans-Pacific'
-        ],
-        'Significance': [
-            'Massive volume enables scale economies',
-            'Pure transshipment hub (not destination)',
-            'Comprehensive carrier coverage',
-            'Global connectivity unmatched',
-            'Highest port efficiency (quick turnaround)',
-            'Frequent sailings (shipper choice)',
-            'Accommodates large and small vessels',
-            'Natural chokepoint (Malacca Strait) and central location'
-        ]
-    })
+    singapore_stats = catalog.load('global_shipping/singapore_stats')
     
     st.dataframe(singapore_stats, use_container_width=True, hide_index=True)
     
@@ -932,71 +800,22 @@ def show():
     while Gemini prioritizes reliability through hub concentration. Two opposite strategies competing in 2025.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SECTION 6: Major Trade Routes
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Major Global Trade Routes</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 6: Major Trade Routes
+# ============================================================================
+
+@sections.section('Major Global Trade Routes')
+def _major_trade_routes():
     st.markdown("""
     Container shipping operates on well-established trade routes connecting major economic regions. 
     Understanding these routes is essential to understanding global trade flows and alliance strategies.
     """)
     
     # Trade routes data
-    trade_routes = pd.DataFrame({
-        'Trade Route': [
-            'Intra-Asia',
-            'Asia - North Europe',
-            'Trans-Pacific (Asia-USWC)',
-            'Trans-Pacific (Asia-USEC)',
-            'Asia - Mediterranean',
-            'Trans-Atlantic',
-            'Asia - Middle East',
-            'North-South (multiple)'
-        ],
-        'Annual Volume (TEU)': [
-            '~35 million',
-            '~24 million',
-            '~16 million',
-            '~10 million',
-            '~10 million',
-            '~7 million',
-            '~8 million',
-            '~15 million (combined)'
-        ],
-        'Transit Time': [
-            '3-7 days',
-            '30-35 days (Suez) / 40-45 days (Cape)',
-            '12-16 days',
-            '21-28 days (Panama) / 25-35 days (Suez)',
-            '25-30 days',
-            '10-14 days',
-            '15-20 days',
-            'Varies (10-25 days)'
-        ],
-        'Key Characteristics': [
-            'Highest volume, shortest distance, frequent service',
-            'Longest route, largest vessels (20,000+ TEU), Red Sea disruptions 2024-2025',
-            'High-value cargo, fast transit, largest US trade',
-            'Panama Canal or Suez via Asia-Europe, longer but more capacity',
-            'Growing trade, similar to Asia-Europe but shorter',
-            'Balanced trade (Europe-US exports/imports), moderate volumes',
-            'Oil-related, strong growth, strategic importance',
-            'Emerging markets, Europe/Asia to Africa/South America/Oceania'
-        ],
-        'Alliance Competition': [
-            'All groups compete, regional carriers strong',
-            'Ocean Alliance + MSC dominant (7 services each)',
-            'Ocean Alliance leader (15 weekly sailings)',
-            'Balanced across all groups',
-            'Ocean + Gemini + MSC compete',
-            'Gemini strong (5 services), Ocean slot exchange',
-            'All groups present, growing focus',
-            'Mix of mainline and regional services'
-        ]
-    })
+    trade_routes = catalog.load('global_shipping/trade_routes')
     
     st.dataframe(trade_routes, use_container_width=True, hide_index=True)
     
@@ -1042,13 +861,15 @@ def show():
     - **Strategic importance**: Connects world's two largest economic blocs
     - **Bellwether route**: Freight rates here signal global market conditions
     """)
-    
-    # ============================================================================
-    # SECTION 7: Geopolitics and Trade Shifts
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Geopolitics Reshaping Global Trade</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 7: Geopolitics and Trade Shifts
+# ============================================================================
+
+@sections.section('Geopolitics Reshaping Global Trade')
+def _geopolitics_and_trade_shifts():
     st.markdown("""
     Geopolitical tensions, particularly US-China relations, are fundamentally reshaping container shipping 
     patterns. The "China+1" strategy and supply chain diversification are creating new trade flows and 
@@ -1081,37 +902,7 @@ def show():
     st.markdown('<p class="subsection-header">"China+1" and Manufacturing Diversification</p>', unsafe_allow_html=True)
     
     # China+1 growth data
-    intermediary_growth = pd.DataFrame({
-        'Country': ['Vietnam', 'Malaysia', 'Thailand', 'Indonesia', 'Bangladesh', 'Mexico', 'India'],
-        'Export Growth 2019-2024 (%)': ['+80%', '+45%', '+35%', '+40%', '+60%', '+55%', '+50%'],
-        'Key Industries': [
-            'Electronics, textiles, furniture',
-            'Electronics, semiconductors, E&E',
-            'Auto parts, electronics, food processing',
-            'Textiles, electronics, commodities',
-            'Garments, textiles',
-            'Auto, electronics (nearshoring to US)',
-            'Pharmaceuticals, textiles, IT services'
-        ],
-        'Port Investment': [
-            'Expanding Cai Mep, Hai Phong',
-            'Port Klang expansion, Tanjung Pelepas',
-            'Laem Chabang expansion',
-            'Tanjung Priok expansion',
-            'Chittagong expansion',
-            'Pacific coast ports expansion',
-            'JNPT, Mundra expansion'
-        ],
-        'Impact on Singapore': [
-            'Increased feeder traffic',
-            'Competition + cooperation (nearby hub)',
-            'Increased feeder traffic',
-            'Increased feeder traffic',
-            'Alternative hub (Colombo)',
-            'Reduces Asia-US via Singapore',
-            'Alternative hub (own ports)'
-        ]
-    })
+    intermediary_growth = catalog.load('global_shipping/intermediary_growth')
     
     st.dataframe(intermediary_growth, use_container_width=True, hide_index=True)
     
@@ -1143,48 +934,7 @@ def show():
     st.markdown('<p class="subsection-header">Emerging Alternative Routes and Long-Term Threats</p>', unsafe_allow_html=True)
     
     # Alternative routes
-    alternative_routes = pd.DataFrame({
-        'Alternative Route/Development': [
-            'Arctic Route (Northern Sea Route)',
-            'Thailand Kra Canal (proposed)',
-            'China-Europe Rail (Belt & Road)',
-            'Belt and Road Initiative (BRI)',
-            'Suez Canal Expansion',
-            'Panama Canal (New Locks)'
-        ],
-        'Status': [
-            'Operational but limited',
-            'Proposed (not funded)',
-            'Operational',
-            'Ongoing development',
-            'Completed 2015',
-            'Completed 2016'
-        ],
-        'Potential Impact': [
-            'Could divert 30% of Asia-Europe traffic from Suez (if ice-free year-round)',
-            'Would bypass Singapore and Malacca Strait entirely (catastrophic for Singapore if built)',
-            'Competes for China-Europe high-value cargo (limited capacity, ~5% of maritime volume)',
-            'Creates alternative trade corridors (road/rail), reduces reliance on sea routes',
-            'Handles larger vessels, speeds Asia-Europe transit (benefits Singapore)',
-            'Allows New-Panamax vessels (14,500 TEU) on Trans-Pacific routes'
-        ],
-        'Likelihood/Timeline': [
-            'Climate-dependent, 2030s-2040s possible as Arctic warms',
-            'Low likelihood (<10%), decades away if ever (environmental, political obstacles)',
-            'Niche role (high-value, time-sensitive only), limited growth potential',
-            'Gradual development over decades, uneven success',
-            'Already implemented (2015)',
-            'Already implemented (2016)'
-        ],
-        'Singapore Impact': [
-            'Moderate threat if Arctic becomes viable (diverts some Asia-Europe traffic)',
-            'Existential threat if built (would bypass Malacca/Singapore entirely)',
-            'Minimal (rail cannot match maritime volume or cost)',
-            'Indirect (shifts some trade to land corridors)',
-            'Positive (larger vessels use Singapore as hub)',
-            'Neutral (different route, Singapore not affected)'
-        ]
-    })
+    alternative_routes = catalog.load('global_shipping/alternative_routes')
     
     st.dataframe(alternative_routes, use_container_width=True, hide_index=True)
     
@@ -1220,13 +970,15 @@ def show():
     or distant threats. Singapore's position is secure medium-term (10-20 years) but must monitor Arctic 
     and continue infrastructure investment (Tuas Port) to maintain long-term competitiveness.
     """)
-    
-    # ============================================================================
-    # SECTION 8: Key Takeaways
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 8: Key Takeaways
+# ============================================================================
+
+@sections.section('Key Takeaways')
+def _key_takeaways():
     col1, col2 = st.columns(2)
     
     with col1:
@@ -1301,15 +1053,3 @@ def show():
     massive reshuffling was successful or requires further reorganisation.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # Navigation
-    # ============================================================================
-    
-    st.markdown("---")
-    st.markdown("### 📚 Continue Learning")
-    st.markdown("""
-    **Next Topic:** 🇸🇬 Maritime Singapore Ecosystem - Explore Singapore's comprehensive maritime cluster, 
-    MPA's dual role as regulator and developer, the Tuas Port mega-project, and the innovation ecosystem 
-    driving maritime technology forward in Singapore's quest to remain the world's premier maritime hub.
-    """)
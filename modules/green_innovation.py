@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, page_cache, sections
 
 def show():
     st.markdown('<p class="main-header">🌱 Green Maritime & Future Trends</p>', unsafe_allow_html=True)
@@ -13,12 +14,33 @@ def show():
     </div>
     """, unsafe_allow_html=True)
     
+    _the_decarbonization_imperative()
+    _alternative_fuels_for_shipping()
+    _green_port_technologies_and_initiatives()
+    _digital_transformation_and_innovation()
+    _maritime_safety_and_risk_management()
+    _future_trends_and_challenges()
+    _key_takeaways()
+    
     # ============================================================================
-    # SECTION 1: The Decarbonization Imperative
+    # Navigation
     # ============================================================================
     
-    st.markdown('<p class="section-header">The Decarbonisation Imperative</p>', unsafe_allow_html=True)
-    
+    st.markdown("---")
+    st.markdown("### 📚 Continue Learning")
+    st.markdown("""
+    **Final Topic:** 🏗️ Tuas Mega Port Case Study - Explore Singapore's $20B+ mega port development, 
+    understanding why it's being built, how it will operate, and whether it will be enough to maintain 
+    Singapore's competitive position.
+    """)
+
+
+# ============================================================================
+# SECTION 1: The Decarbonization Imperative
+# ============================================================================
+
+@sections.section('The Decarbonisation Imperative', lazy=False)
+def _the_decarbonization_imperative():
     st.markdown("""
     The maritime industry faces mounting pressure to reduce its carbon footprint and achieve net-zero 
     emissions by 2050. This represents one of the most significant transformations in maritime history.
@@ -62,57 +84,47 @@ def show():
     """)
     
     # Emissions reduction pathway
-    reduction_pathway = pd.DataFrame({
-        'Year': [2008, 2015, 2020, 2025, 2030, 2035, 2040, 2045, 2050],
-        'Carbon Intensity (Index)': [100, 95, 90, 75, 60, 45, 30, 15, 0],
-        'Technology Phase': [
-            'Baseline',
-            'Efficiency improvements',
-            'Early alternative fuels',
-            'Alternative fuels scaling',
-            '40% reduction target',
-            'Majority alternative fuels',
-            'Zero-carbon majority',
-            'Near-complete transition',
-            'Net-zero achieved'
-        ]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=reduction_pathway['Year'],
-        y=reduction_pathway['Carbon Intensity (Index)'],
-        mode='lines+markers',
-        line=dict(color='#10B981', width=4),
-        marker=dict(size=12, color='#059669', line=dict(color='white', width=2)),
-        fill='tozeroy',
-        fillcolor='rgba(16, 185, 129, 0.2)',
-        name='Carbon Intensity',
-        hovertemplate='%{x}<br>Carbon Intensity: %{y}<br>%{text}<extra></extra>',
-        text=reduction_pathway['Technology Phase']
-    ))
-    
-    # Add target markers
-    fig.add_hline(y=60, line_dash="dash", line_color="#F59E0B", 
-                  annotation_text="2030 Target: -40%", annotation_position="right")
-    fig.add_hline(y=0, line_dash="dash", line_color="#EF4444", 
-                  annotation_text="2050 Target: Net Zero", annotation_position="right")
-    
-    fig.update_layout(
-        title={
-            'text': 'IMO Decarbonisation Pathway: 2008 → 2050',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Carbon Intensity (Indexed to 2008 = 100)",
-        height=500,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 110]),
-        xaxis=dict(gridcolor='#E5E7EB')
-    )
+    reduction_pathway = catalog.load('green_innovation/reduction_pathway')
+    
+    def build_reduction_pathway_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=reduction_pathway['Year'],
+            y=reduction_pathway['Carbon Intensity (Index)'],
+            mode='lines+markers',
+            line=dict(color='#10B981', width=4),
+            marker=dict(size=12, color='#059669', line=dict(color='white', width=2)),
+            fill='tozeroy',
+            fillcolor='rgba(16, 185, 129, 0.2)',
+            name='Carbon Intensity',
+            hovertemplate='%{x}<br>Carbon Intensity: %{y}<br>%{text}<extra></extra>',
+            text=reduction_pathway['Technology Phase']
+        ))
+        
+        # Add target markers
+        fig.add_hline(y=60, line_dash="dash", line_color="#F59E0B", 
+                      annotation_text="2030 Target: -40%", annotation_position="right")
+        fig.add_hline(y=0, line_dash="dash", line_color="#EF4444", 
+                      annotation_text="2050 Target: Net Zero", annotation_position="right")
+        
+        fig.update_layout(
+            title={
+                'text': 'IMO Decarbonisation Pathway: 2008 → 2050',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 20, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Carbon Intensity (Indexed to 2008 = 100)",
+            height=500,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 110]),
+            xaxis=dict(gridcolor='#E5E7EB')
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'reduction_pathway_chart', build_reduction_pathway_chart, deps=(reduction_pathway,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -128,13 +140,15 @@ def show():
     This is not just an engineering challenge—it's an economic, political, and social transformation.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SECTION 2: Alternative Fuels for Shipping
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Alternative Fuels: The Transition Pathway</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 2: Alternative Fuels for Shipping
+# ============================================================================
+
+@sections.section('Alternative Fuels: The Transition Pathway')
+def _alternative_fuels_for_shipping():
     st.markdown("""
     Multiple alternative fuel options are being developed and deployed, each with different characteristics, 
     benefits, and challenges.
@@ -312,73 +326,61 @@ def show():
     """)
     
     # Alternative fuels comparison
-    fuels_comparison = pd.DataFrame({
-        'Fuel': ['Conventional HFO', 'LNG', 'Methanol (Grey)', 'Methanol (Green)', 'Ammonia (Green)', 'Hydrogen (Green)', 'Biofuels'],
-        'CO2 Reduction (%)': [0, 20, 10, 100, 100, 100, 80],
-        'Technology Maturity': ['Mature', 'Mature', 'Developing', 'Emerging', 'Early stage', 'Early stage', 'Mature'],
-        'Infrastructure Availability': ['Global', 'Good (185 ports)', 'Growing (122 ports)', 'Limited', 'Very limited', 'Very limited', 'Moderate'],
-        'Relative Cost': ['1.0x', '1.2x', '2.0x', '3.0x', '4.0x', '4.5x', '2.5x'],
-        'Energy Density (vs HFO)': ['100%', '60%', '50%', '50%', '45%', '25%', '90%'],
-        'Best For': [
-            'Baseline',
-            'Transition fuel, near-term',
-            'Transition, container ships',
-            'Long-term zero-carbon',
-            'Large vessels, long-haul',
-            'Short-range, small vessels',
-            'Drop-in supplement'
-        ]
-    })
+    fuels_comparison = catalog.load('green_innovation/fuels_comparison')
     
     st.dataframe(fuels_comparison, width='stretch', hide_index=True)
     
     # Fuel adoption timeline
-    fig = go.Figure()
-    
-    fuels_timeline = [
-        {'fuel': 'LNG', 'start': 2015, 'peak': 2030, 'color': '#3B82F6'},
-        {'fuel': 'Methanol', 'start': 2023, 'peak': 2035, 'color': '#10B981'},
-        {'fuel': 'Ammonia', 'start': 2025, 'peak': 2040, 'color': '#F59E0B'},
-        {'fuel': 'Biofuels', 'start': 2020, 'peak': 2035, 'color': '#8B5CF6'}
-    ]
-    
-    for i, fuel in enumerate(fuels_timeline):
-        years = list(range(2015, 2051))
-        adoption = []
-        for year in years:
-            if year < fuel['start']:
-                adoption.append(0)
-            elif year < fuel['peak']:
-                # Ramp up
-                progress = (year - fuel['start']) / (fuel['peak'] - fuel['start'])
-                adoption.append(progress * 100)
-            else:
-                # At peak
-                adoption.append(100)
+    def build_fuel_adoption_chart():
+        fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=adoption,
-            mode='lines',
-            name=fuel['fuel'],
-            line=dict(color=fuel['color'], width=3)
-        ))
+        fuels_timeline = [
+            {'fuel': 'LNG', 'start': 2015, 'peak': 2030, 'color': '#3B82F6'},
+            {'fuel': 'Methanol', 'start': 2023, 'peak': 2035, 'color': '#10B981'},
+            {'fuel': 'Ammonia', 'start': 2025, 'peak': 2040, 'color': '#F59E0B'},
+            {'fuel': 'Biofuels', 'start': 2020, 'peak': 2035, 'color': '#8B5CF6'}
+        ]
+        
+        for i, fuel in enumerate(fuels_timeline):
+            years = list(range(2015, 2051))
+            adoption = []
+            for year in years:
+                if year < fuel['start']:
+                    adoption.append(0)
+                elif year < fuel['peak']:
+                    # Ramp up
+                    progress = (year - fuel['start']) / (fuel['peak'] - fuel['start'])
+                    adoption.append(progress * 100)
+                else:
+                    # At peak
+                    adoption.append(100)
+        
+            fig.add_trace(go.Scatter(
+                x=years,
+                y=adoption,
+                mode='lines',
+                name=fuel['fuel'],
+                line=dict(color=fuel['color'], width=3)
+            ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Alternative Fuel Adoption Timeline (Projected)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Relative Adoption (%)",
+            height=450,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB'),
+            xaxis=dict(gridcolor='#E5E7EB'),
+            legend=dict(x=0.02, y=0.98, bgcolor='rgba(255,255,255,0.8)')
+        )
+        return fig
     
-    fig.update_layout(
-        title={
-            'text': 'Alternative Fuel Adoption Timeline (Projected)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Relative Adoption (%)",
-        height=450,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB'),
-        xaxis=dict(gridcolor='#E5E7EB'),
-        legend=dict(x=0.02, y=0.98, bgcolor='rgba(255,255,255,0.8)')
-    )
+    fig = page_cache.figure(__name__, 'fuel_adoption_chart', build_fuel_adoption_chart)
     
     st.plotly_chart(fig, width='stretch')
     
@@ -406,13 +408,15 @@ def show():
     - Portfolio approach reduces risk of choosing "wrong" fuel
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SECTION 3: Green Port Technologies and Initiatives
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Green Port Technologies and Initiatives</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 3: Green Port Technologies and Initiatives
+# ============================================================================
+
+@sections.section('Green Port Technologies and Initiatives')
+def _green_port_technologies_and_initiatives():
     st.markdown("""
     Ports play a critical role in maritime decarbonisation through infrastructure, operations, and 
     ecosystem development.
@@ -449,42 +453,35 @@ def show():
     """)
     
     # Bunkering infrastructure availability
-    bunkering_data = pd.DataFrame({
-        'Fuel Type': ['Conventional HFO/MGO', 'LNG', 'Methanol', 'Biofuels', 'Ammonia', 'Hydrogen'],
-        'Ports Offering (Globally)': [500, 185, 122, 50, 0, 5],
-        'Singapore Status': [
-            'Established (#1 globally, 40M+ tonnes)',
-            'Established (multiple providers)',
-            'Developing (pilot programmes)',
-            'Limited (blending)',
-            'Planning (2030+ target)',
-            'Research (limited scope)'
-        ]
-    })
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=bunkering_data['Fuel Type'],
-            y=bunkering_data['Ports Offering (Globally)'],
-            marker=dict(color=['#94A3B8', '#3B82F6', '#10B981', '#8B5CF6', '#F59E0B', '#EF4444']),
-            text=bunkering_data['Ports Offering (Globally)'],
-            textposition='outside'
+    bunkering_data = catalog.load('green_innovation/bunkering_data')
+    
+    def build_bunkering_chart():
+        fig = go.Figure(data=[
+            go.Bar(
+                x=bunkering_data['Fuel Type'],
+                y=bunkering_data['Ports Offering (Globally)'],
+                marker=dict(color=['#94A3B8', '#3B82F6', '#10B981', '#8B5CF6', '#F59E0B', '#EF4444']),
+                text=bunkering_data['Ports Offering (Globally)'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title={
+                'text': 'Alternative Fuel Bunkering Infrastructure Availability',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Fuel Type",
+            yaxis_title="Number of Ports Offering (Globally)",
+            height=400,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB')
         )
-    ])
-    
-    fig.update_layout(
-        title={
-            'text': 'Alternative Fuel Bunkering Infrastructure Availability',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Fuel Type",
-        yaxis_title="Number of Ports Offering (Globally)",
-        height=400,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB')
-    )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'bunkering_chart', build_bunkering_chart, deps=(bunkering_data,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -580,13 +577,15 @@ def show():
     - Green spaces and biodiversity preservation
     - Circular economy principles (waste reduction, recycling)
     """)
-    
-    # ============================================================================
-    # SECTION 4: Digital Transformation and Innovation
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Digital Transformation: The Future is Data-Driven</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 4: Digital Transformation and Innovation
+# ============================================================================
+
+@sections.section('Digital Transformation: The Future is Data-Driven')
+def _digital_transformation_and_innovation():
     st.markdown("""
     Beyond green technologies, digital innovation is transforming how ports operate and compete.
     """)
@@ -707,13 +706,15 @@ def show():
     - Multiple technologies deployed commercially
     - Singapore positioned as maritime tech innovation leader
     """)
-    
-    # ============================================================================
-    # SECTION 5: Maritime Safety and Risk Management
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Maritime Safety and Risk Management</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 5: Maritime Safety and Risk Management
+# ============================================================================
+
+@sections.section('Maritime Safety and Risk Management')
+def _maritime_safety_and_risk_management():
     st.markdown("""
     Safety remains paramount in maritime operations. Understanding and managing risk is fundamental.
     """)
@@ -777,13 +778,15 @@ def show():
     - Cameras and monitoring ensure compliance
     - AI identifies risky patterns
     """)
-    
-    # ============================================================================
-    # SECTION 6: Future Trends and Challenges
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Future Trends: What\'s Next for Maritime?</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 6: Future Trends and Challenges
+# ============================================================================
+
+@sections.section('Future Trends: What\'s Next for Maritime?')
+def _future_trends_and_challenges():
     st.markdown("""
     Looking ahead, several major trends will shape the maritime industry over the next 20-30 years.
     """)
@@ -885,13 +888,15 @@ def show():
     - Pressure to reduce supply chain emissions
     - Impact: Favour efficient, green ports and shipping lines
     """)
-    
-    # ============================================================================
-    # SECTION 7: Key Takeaways
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 7: Key Takeaways
+# ============================================================================
+
+@sections.section('Key Takeaways')
+def _key_takeaways():
     col1, col2 = st.columns(2)
     
     with col1:
@@ -954,15 +959,3 @@ def show():
     that lag will struggle.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # Navigation
-    # ============================================================================
-    
-    st.markdown("---")
-    st.markdown("### 📚 Continue Learning")
-    st.markdown("""
-    **Final Topic:** 🏗️ Tuas Mega Port Case Study - Explore Singapore's $20B+ mega port development, 
-    understanding why it's being built, how it will operate, and whether it will be enough to maintain 
-    Singapore's competitive position.
-    """)
@@ -0,0 +1,131 @@
+"""Per-section render timing for the knowledge-base pages.
+
+Disabled by default. Start the app with MARITIME_PROFILE=1 to record, for
+each section of the page being rendered:
+
+- wall time from its header to the next one (tables, charts and text)
+- time spent building and serializing its Plotly figures
+- the size of the figure JSON sent to the browser
+
+The results are shown in a "Section timings" panel in the sidebar and logged
+under the ``modules.instrument`` logger.
+
+Pages mark sections with ``section_header(title)``, which renders the usual
+header (with an ``id`` anchor, see ``anchor()``) and starts a new timing
+section. Code that is not split by headers can use ``with section(name):``
+instead. The app wraps each page in ``with page(name):``.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+ENABLED = os.environ.get('MARITIME_PROFILE', '').lower() in ('1', 'true', 'yes', 'on')
+
+_log = logging.getLogger(__name__)
+# Each script run happens on its own thread, so per-run state is thread-local
+_state = threading.local()
+
+
+class _Section:
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        self.figures = 0
+        self.figure_time = 0.0
+        self.figure_bytes = 0
+
+
+def _current():
+    return getattr(_state, 'current', None)
+
+
+def _open(name):
+    _close()
+    _state.current = _Section(name)
+
+
+def _close():
+    current = _current()
+    if current is not None:
+        current.elapsed = time.perf_counter() - current.start
+        _state.sections.append(current)
+        _state.current = None
+
+
+@contextmanager
+def page(name):
+    if not ENABLED:
+        yield
+        return
+    _state.sections = []
+    _state.current = None
+    _open('(page intro)')
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _close()
+        _report(name, time.perf_counter() - start, _state.sections)
+        del _state.sections
+
+
+@contextmanager
+def section(name):
+    if not ENABLED or not hasattr(_state, 'sections'):
+        yield
+        return
+    _open(name)
+    try:
+        yield
+    finally:
+        _close()
+
+
+def anchor(title):
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+
+
+def section_header(title):
+    st.markdown(f'<p class="section-header" id="{anchor(title)}">{title}</p>', unsafe_allow_html=True)
+    if ENABLED and hasattr(_state, 'sections'):
+        _open(title)
+
+
+def record_figure(seconds, nbytes):
+    current = _current() if ENABLED else None
+    if current is not None:
+        current.figures += 1
+        current.figure_time += seconds
+        current.figure_bytes += nbytes
+
+
+def _report(name, total, sections):
+    rows = [{
+        'Section': s.name,
+        'Time (ms)': round(s.elapsed * 1e3, 1),
+        'Figures (ms)': round(s.figure_time * 1e3, 1),
+        'Figures': s.figures,
+        'Figure JSON (KB)': round(s.figure_bytes / 1024, 1),
+    } for s in sections]
+
+    for row in rows:
+        _log.info('%s | %-60s %8.1f ms  figs %d %7.1f ms %8.1f KB', name, row['Section'][:60],
+                  row['Time (ms)'], row['Figures'], row['Figures (ms)'], row['Figure JSON (KB)'])
+    _log.info('%s | total %.1f ms over %d sections', name, total * 1e3, len(rows))
+
+    with st.sidebar.expander('⏱️ Section timings', expanded=False):
+        st.caption(f'{name}: {total * 1e3:.1f} ms total')
+        st.dataframe(sorted(rows, key=lambda row: -row['Time (ms)']), hide_index=True)
+
+
+if ENABLED and not _log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+    _log.addHandler(_handler)
+    _log.setLevel(logging.INFO)
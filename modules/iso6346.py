@@ -0,0 +1,224 @@
+"""ISO 6346 container numbers: check digits and validation in bulk.
+
+A container number is a three-letter owner code, a category letter (U for
+freight containers, J for detachable equipment, Z for trailers and
+chassis), six serial digits and a check digit, e.g. ``MAEU 123456 7``.
+The check digit is computed from the first ten characters:
+
+- letters take the values 10-38, skipping multiples of 11 (A=10, B=12, ...
+  K=21, L=23, ... U=32, ... Z=38), and digits their own value
+- each value is weighted by 2**position, counting from 0
+- the sum is taken modulo 11, and a remainder of 10 becomes 0
+
+Here IDs are validated as a batch. The batch is packed into a
+``(n, WIDTH)`` byte array. Spaces and dashes are squeezed out and letters
+are upper-cased. Character classes and letter values come from 256-entry
+lookup tables, and the weighted sum is a single matrix product. There is no
+per-ID Python code, so one core checks around two million IDs a second, about
+ten times a per-string loop:
+
+    codes, digits = iso6346.validate(['MAEU 123456-7', 'MSCU9876543', 'bad'])
+    codes                                  # [0, 6, 1]: OK, CHECK_DIGIT, LENGTH
+    [iso6346.ERRORS[c] for c in codes]
+    iso6346.check_digit(['MAEU123456'])    # [7]
+
+Each ID gets one error code, the first that applies, in the order of
+``ERRORS``. ``validate_frame()`` returns a table for display.
+``validate_stream()`` reads CSV or text input in chunks, so a file of any
+size runs in bounded memory. The same is available from the command line:
+
+    python -m modules.iso6346 validate gate_feed.csv --column Container -o checked.csv
+    python -m modules.iso6346 validate ids.txt --errors-only
+
+See benchmarks/bench_iso6346.py for throughput.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+WIDTH = 16            # longest raw ID accepted, separators included
+CATEGORIES = b'UJZ'
+
+OK, LENGTH, OWNER, CATEGORY, SERIAL, CHECK_CHARACTER, CHECK_DIGIT = range(7)
+ERRORS = {
+    OK: 'OK',
+    LENGTH: 'Not 11 characters',
+    OWNER: 'Owner code is not 3 letters',
+    CATEGORY: 'Category is not U, J or Z',
+    SERIAL: 'Serial is not 6 digits',
+    CHECK_CHARACTER: 'Check digit is not a digit',
+    CHECK_DIGIT: 'Check digit does not match',
+}
+
+
+def _tables():
+    # Byte -> character value (letters 10-38 skipping multiples of 11,
+    # digits 0-9), and byte -> class: 1 letter, 2 digit, 0 other
+    value = np.zeros(256, dtype=np.float32)
+    kind = np.zeros(256, dtype=np.uint8)
+    letters = np.arange(ord('A'), ord('Z') + 1)
+    letter_values = np.arange(10, 50)
+    letter_values = letter_values[letter_values % 11 != 0][:26]
+    value[letters] = letter_values
+    kind[letters] = 1
+    digits = np.arange(ord('0'), ord('9') + 1)
+    value[digits] = np.arange(10)
+    kind[digits] = 2
+    return value, kind
+
+
+VALUE, KIND = _tables()
+WEIGHTS = 2 ** np.arange(10, dtype=np.float32)
+
+
+def pack(ids, width=WIDTH):
+    # IDs (str, bytes, or an array or Series of them) -> (n, width + 1)
+    # uint8, zero padded. A character in the last column means the ID was
+    # longer than `width`; it is kept so that the length check fails.
+    ids = np.asarray(ids)
+    n = len(ids)
+    if ids.dtype.kind == 'O':
+        ids = np.where(pd.isna(ids), '', ids).astype(f'U{width + 1}')
+    if ids.dtype.kind == 'U':
+        # UCS-4 code points, with anything outside ASCII as '?'
+        points = ids.astype(f'U{width + 1}').view(np.uint32).reshape(n, width + 1)
+        raw = points.astype(np.uint8)
+        wide = points > 127
+        if wide.any():
+            raw[wide] = ord('?')
+        return raw
+    return ids.astype(f'S{width + 1}').view(np.uint8).reshape(n, width + 1).copy()
+
+
+def normalise(raw):
+    # Squeeze out spaces and dashes, upper-case letters, in place. Returns the
+    # compacted array and each ID's length. Most feeds are already compact
+    # (every kept character before the first dropped one), and those rows
+    # are not sorted.
+    keep = (raw != 0) & (raw != ord(' ')) & (raw != ord('-'))
+    raw[~keep] = 0
+    length = np.count_nonzero(keep, axis=1)
+    gaps = np.argmin(keep, axis=1) != length
+    if gaps.any():
+        rows = raw[gaps]
+        order = np.argsort(rows == 0, axis=1, kind='stable')
+        raw[gaps] = np.take_along_axis(rows, order, axis=1)
+    lower = (raw >= ord('a')) & (raw <= ord('z'))
+    if lower.any():
+        raw[lower] -= 32
+    return raw, length
+
+
+def _digits(compact):
+    # Weighted sums stay below 2**16, so float32 arithmetic is exact
+    return (VALUE[compact[:, :10]] @ WEIGHTS).astype(np.int64) % 11 % 10
+
+
+def check_digit(ids):
+    # Check digit for each ID's first ten characters (owner, category and
+    # serial), with or without a check digit after them
+    compact, _ = normalise(pack(ids))
+    return _digits(compact)
+
+
+def validate(ids):
+    # Error code per ID, and the check digit its first ten characters call
+    # for (-1 where they are not valid)
+    compact, length = normalise(pack(ids))
+    kind = KIND[compact[:, :11]]
+    letters, digits = kind == 1, kind == 2
+    expected = _digits(compact)
+    conditions = [
+        length != 11,
+        ~letters[:, :3].all(axis=1),
+        ~np.isin(compact[:, 3], np.frombuffer(CATEGORIES, dtype=np.uint8)),
+        ~digits[:, 4:10].all(axis=1),
+        ~digits[:, 10],
+        compact[:, 10] - ord('0') != expected,
+    ]
+    codes = np.select(conditions, [LENGTH, OWNER, CATEGORY, SERIAL, CHECK_CHARACTER, CHECK_DIGIT], OK).astype(np.uint8)
+    # Only IDs that are well formed up to the check digit call for one
+    well_formed = (codes == OK) | (codes >= CHECK_CHARACTER)
+    return codes, np.where(well_formed, expected, -1)
+
+
+def validate_frame(ids):
+    ids = pd.Series(ids, dtype=object).fillna('')
+    codes, digits = validate(ids.to_numpy())
+    return pd.DataFrame({
+        'Container': ids.to_numpy(),
+        'Check Digit': digits,
+        'Code': codes,
+        'Result': np.asarray(list(ERRORS.values()), dtype=object)[codes],
+    })
+
+
+def validate_stream(source, column=None, chunk_rows=1_000_000):
+    # Yields one validate_frame() table per chunk. `source` is a CSV file
+    # (with `column` naming the IDs) or a text file with one ID per line.
+    # Row numbers continue across chunks.
+    start = 0
+    if column is not None:
+        chunks = (chunk[column] for chunk in pd.read_csv(source, usecols=[column], dtype=str,
+                                                          keep_default_na=False, chunksize=chunk_rows))
+    else:
+        chunks = _text_chunks(source, chunk_rows)
+    for ids in chunks:
+        frame = validate_frame(ids)
+        frame.index = pd.RangeIndex(start, start + len(frame), name='Row')
+        start += len(frame)
+        yield frame
+
+
+def _text_chunks(source, chunk_rows):
+    handle = open(source, 'rb') if isinstance(source, (str, Path)) else source
+    try:
+        lines = []
+        for line in handle:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8', errors='replace')
+            lines.append(line.rstrip('\r\n'))
+            if len(lines) == chunk_rows:
+                yield np.array(lines)
+                lines = []
+        if lines:
+            yield np.array(lines)
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.iso6346', description='Validate ISO 6346 container numbers.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    check = sub.add_parser('validate', help='check a CSV or text file of container numbers')
+    check.add_argument('source', help="CSV file, text file with one ID per line, or '-' for stdin")
+    check.add_argument('--column', help='CSV column holding the IDs (without it, input is read as text)')
+    check.add_argument('-o', '--output', help='write per-row results as CSV (default: stdout)')
+    check.add_argument('--errors-only', action='store_true', help='only output rows that fail')
+    check.add_argument('--chunk-rows', type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    source = sys.stdin.buffer if args.source == '-' else args.source
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    counts = np.zeros(len(ERRORS), dtype=np.int64)
+    try:
+        for i, frame in enumerate(validate_stream(source, args.column, args.chunk_rows)):
+            counts += np.bincount(frame['Code'], minlength=len(ERRORS))
+            if args.errors_only:
+                frame = frame[frame['Code'] != OK]
+            frame.to_csv(out, header=i == 0)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    for code, count in enumerate(counts):
+        if count:
+            print(f"{ERRORS[code]:30s} {count:12,d}", file=sys.stderr)
+    return 0 if counts[OK] == counts.sum() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
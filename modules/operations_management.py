@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, instrument, page_cache
 
 def show():
     st.markdown('<p class="main-header">🎯 Operations Management Fundamentals</p>', unsafe_allow_html=True)
@@ -17,7 +18,7 @@ def show():
     # SECTION 1: Introduction to Operations Management
     # ============================================================================
     
-    st.markdown('<p class="section-header">What is Operations Management?</p>', unsafe_allow_html=True)
+    instrument.section_header('What is Operations Management?')
     
     st.markdown("""
     **Operations Management** is the administration of business practices to create the highest level 
@@ -46,7 +47,7 @@ def show():
     # SECTION 2: The "Big Six" Competencies
     # ============================================================================
     
-    st.markdown('<p class="section-header">The "Big Six" Competitive Competencies</p>', unsafe_allow_html=True)
+    instrument.section_header('The "Big Six" Competitive Competencies')
     
     st.markdown("""
     Six key operational competencies determine whether a port (or any operation) attracts and retains 
@@ -208,44 +209,36 @@ def show():
     """)
     
     # Big Six visualization
-    big_six_data = pd.DataFrame({
-        'Competency': ['Quality', 'Reliability', 'Responsiveness', 'Agility', 'Service', 'Cost'],
-        'Importance': [95, 98, 90, 85, 88, 80],
-        'Singapore Score': [95, 98, 92, 88, 90, 75],
-        'Description': [
-            'Zero damage, accuracy, compliance',
-            'BOA >90%, predictable schedules',
-            'Fast turnaround, high crane productivity',
-            'Handle demand fluctuations, service mix',
-            'Customer support, information, problem solving',
-            'Competitive pricing with value delivery'
-        ]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=big_six_data['Singapore Score'],
-        theta=big_six_data['Competency'],
-        fill='toself',
-        name='Singapore Performance',
-        line=dict(color='#3B82F6', width=3),
-        fillcolor='rgba(59, 130, 246, 0.3)'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 100])
-        ),
-        showlegend=False,
-        title={
-            'text': 'The "Big Six" Operational Competencies',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1F2937'}
-        },
-        height=500
-    )
+    big_six_data = catalog.load('operations_management/big_six_data')
+    
+    def build_big_six_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatterpolar(
+            r=big_six_data['Singapore Score'],
+            theta=big_six_data['Competency'],
+            fill='toself',
+            name='Singapore Performance',
+            line=dict(color='#3B82F6', width=3),
+            fillcolor='rgba(59, 130, 246, 0.3)'
+        ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(visible=True, range=[0, 100])
+            ),
+            showlegend=False,
+            title={
+                'text': 'The "Big Six" Operational Competencies',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 20, 'color': '#1F2937'}
+            },
+            height=500
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'big_six_chart', build_big_six_chart, deps=(big_six_data,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -264,7 +257,7 @@ def show():
     # SECTION 3: Quality Management
     # ============================================================================
     
-    st.markdown('<p class="section-header">Quality Management in Port Operations</p>', unsafe_allow_html=True)
+    instrument.section_header('Quality Management in Port Operations')
     
     st.markdown("""
     Quality management ensures that operations consistently meet specifications and customer expectations. 
@@ -308,28 +301,7 @@ def show():
     """)
     
     # FMEA example
-    fmea_example = pd.DataFrame({
-        'Failure Mode': [
-            'Crane breakdown during operations',
-            'Wrong container loaded on vessel',
-            'Container damaged during handling',
-            'Reefer power failure in yard',
-            'Documentation error (wrong destination)',
-            'Yard equipment collision'
-        ],
-        'Severity (1-10)': [7, 9, 8, 9, 7, 10],
-        'Occurrence (1-10)': [3, 2, 3, 2, 4, 2],
-        'Detection (1-10)': [2, 6, 3, 4, 5, 3],
-        'RPN': [42, 108, 72, 72, 140, 60],
-        'Mitigation Strategy': [
-            'Preventive maintenance, backup cranes',
-            'Double-check systems, RFID tracking',
-            'Operator training, equipment sensors',
-            'Redundant power, monitoring systems',
-            'Automated systems, verification checks',
-            'Collision avoidance systems, training'
-        ]
-    })
+    fmea_example = catalog.load('operations_management/fmea_example')
     
     # Sort by RPN
     fmea_example = fmea_example.sort_values('RPN', ascending=False)
@@ -337,33 +309,37 @@ def show():
     st.dataframe(fmea_example, width='stretch', hide_index=True)
     
     # RPN visualization
-    fig = go.Figure(data=[
-        go.Bar(
-            x=fmea_example['RPN'],
-            y=fmea_example['Failure Mode'],
-            orientation='h',
-            marker=dict(
-                color=fmea_example['RPN'],
-                colorscale='Reds',
-                line=dict(color='#1F2937', width=1)
-            ),
-            text=fmea_example['RPN'],
-            textposition='outside'
+    def build_fmea_chart():
+        fig = go.Figure(data=[
+            go.Bar(
+                x=fmea_example['RPN'],
+                y=fmea_example['Failure Mode'],
+                orientation='h',
+                marker=dict(
+                    color=fmea_example['RPN'],
+                    colorscale='Reds',
+                    line=dict(color='#1F2937', width=1)
+                ),
+                text=fmea_example['RPN'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title={
+                'text': 'Risk Priority Numbers (RPN) - Focus on Highest First',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Risk Priority Number (Higher = More Urgent)",
+            height=400,
+            plot_bgcolor='white',
+            xaxis=dict(gridcolor='#E5E7EB')
         )
-    ])
-    
-    fig.update_layout(
-        title={
-            'text': 'Risk Priority Numbers (RPN) - Focus on Highest First',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Risk Priority Number (Higher = More Urgent)",
-        height=400,
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='#E5E7EB')
-    )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'fmea_chart', build_fmea_chart, deps=(fmea_example,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -430,7 +406,7 @@ def show():
     # SECTION 4: Capacity Management
     # ============================================================================
     
-    st.markdown('<p class="section-header">Capacity Management</p>', unsafe_allow_html=True)
+    instrument.section_header('Capacity Management')
     
     st.markdown("""
     **Capacity** is the maximum output an operation can produce in a given time period. For ports, capacity 
@@ -516,32 +492,32 @@ def show():
     """)
     
     # Capacity visualization
-    capacity_data = pd.DataFrame({
-        'Capacity Type': ['Design Capacity', 'Effective Capacity', 'Actual Output'],
-        'TEU (Millions)': [30, 25.5, 23],
-        'Percentage': [100, 85, 77]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Funnel(
-        y=capacity_data['Capacity Type'],
-        x=capacity_data['TEU (Millions)'],
-        textposition="inside",
-        textinfo="value+percent initial",
-        marker=dict(color=['#3B82F6', '#10B981', '#F59E0B']),
-        connector={"line": {"color": "#64748B", "width": 3}}
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Port Capacity: Design → Effective → Actual',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        height=400
-    )
+    capacity_data = catalog.load('operations_management/capacity_data')
+    
+    def build_capacity_funnel_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Funnel(
+            y=capacity_data['Capacity Type'],
+            x=capacity_data['TEU (Millions)'],
+            textposition="inside",
+            textinfo="value+percent initial",
+            marker=dict(color=['#3B82F6', '#10B981', '#F59E0B']),
+            connector={"line": {"color": "#64748B", "width": 3}}
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Port Capacity: Design → Effective → Actual',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=400
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'capacity_funnel_chart', build_capacity_funnel_chart, deps=(capacity_data,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -551,26 +527,7 @@ def show():
     Capacity decisions operate on different time horizons with different decision-making approaches:
     """)
     
-    capacity_horizons = pd.DataFrame({
-        'Time Horizon': ['Long-term (5-10 years)', 'Medium-term (6-18 months)', 'Short-term (Daily-Weekly)'],
-        'Decisions': [
-            'New berths, terminals, major equipment investments',
-            'Equipment purchases, workforce planning, maintenance schedules',
-            'Berth allocation, crane assignment, shift scheduling'
-        ],
-        'Capacity Changes': [
-            'Add/remove major capacity (berths, cranes, terminals)',
-            'Add/remove minor capacity (equipment, staffing levels)',
-            'Optimise existing capacity (better scheduling, utilisation)'
-        ],
-        'Flexibility': ['Low - Hard to reverse', 'Medium - Moderately reversible', 'High - Easily adjusted'],
-        'Investment': ['Very high ($billions)', 'Moderate ($millions)', 'Low (operating costs)'],
-        'Examples': [
-            'Tuas Mega Port development (S$20B+, 20+ years)',
-            'Purchase 3 new quay cranes ($15M each)',
-            'Add overtime shift for peak season'
-        ]
-    })
+    capacity_horizons = catalog.load('operations_management/capacity_horizons')
     
     st.dataframe(capacity_horizons, width='stretch', hide_index=True)
     
@@ -593,7 +550,7 @@ def show():
     # SECTION 5: Demand Management Strategies
     # ============================================================================
     
-    st.markdown('<p class="section-header">Demand Management Strategies</p>', unsafe_allow_html=True)
+    instrument.section_header('Demand Management Strategies')
     
     st.markdown("""
     Rather than just adding capacity to meet demand, operations can also manage demand patterns to better 
@@ -602,33 +559,7 @@ def show():
     
     st.markdown('<p class="subsection-header">Four Demand Management Strategies</p>', unsafe_allow_html=True)
     
-    demand_strategies = pd.DataFrame({
-        'Strategy': ['Level Strategy', 'Chase Strategy', 'Mixed Strategy', 'Demand Management (Pricing)'],
-        'Description': [
-            'Maintain constant output regardless of demand fluctuations',
-            'Adjust capacity to match demand changes (hire/fire, overtime)',
-            'Combination of level and chase strategies',
-            'Use pricing to shift demand from peak to off-peak periods'
-        ],
-        'Advantages': [
-            'Stable workforce, predictable operations, lower training costs',
-            'Minimum inventory, high capacity utilisation, matches demand',
-            'Balances costs and flexibility, pragmatic approach',
-            'Smooths demand, improves utilisation, maximizes revenue'
-        ],
-        'Disadvantages': [
-            'Excess capacity in low periods, inventory costs, inflexibility',
-            'Workforce instability, higher hiring/training costs, quality issues',
-            'Complexity in execution, requires careful balance',
-            'May lose price-sensitive customers, complex pricing models'
-        ],
-        'Port Application': [
-            'Maintain fixed berth/crane/labour capacity year-round',
-            'Hire temporary workers for peak season, overtime shifts',
-            'Core permanent staff + temporary workers for peaks',
-            'Peak pricing during busy periods, discounts for off-peak'
-        ]
-    })
+    demand_strategies = catalog.load('operations_management/demand_strategies')
     
     st.dataframe(demand_strategies, width='stretch', hide_index=True)
     
@@ -650,7 +581,7 @@ def show():
     # SECTION 6: Maintenance Management
     # ============================================================================
     
-    st.markdown('<p class="section-header">Maintenance Management</p>', unsafe_allow_html=True)
+    instrument.section_header('Maintenance Management')
     
     st.markdown("""
     Maintaining equipment availability is critical for port capacity and reliability. Different maintenance 
@@ -755,7 +686,7 @@ def show():
     # SECTION 7: Strategic Trade-offs
     # ============================================================================
     
-    st.markdown('<p class="section-header">Strategic Trade-offs in Operations</p>', unsafe_allow_html=True)
+    instrument.section_header('Strategic Trade-offs in Operations')
     
     st.markdown("""
     Operations management is fundamentally about making trade-offs. You cannot maximize all objectives 
@@ -764,40 +695,7 @@ def show():
     
     st.markdown('<p class="subsection-header">Common Trade-offs</p>', unsafe_allow_html=True)
     
-    tradeoffs = pd.DataFrame({
-        'Trade-off': [
-            'Cost vs Quality',
-            'Cost vs Flexibility',
-            'Speed vs Quality',
-            'Capacity vs Utilisation',
-            'Standardization vs Customization',
-            'Automation vs Employment'
-        ],
-        'Description': [
-            'Lower costs often mean lower quality materials/processes vs premium quality costs more',
-            'Excess capacity for flexibility is expensive vs maximize utilisation reduces flexibility',
-            'Rushing operations increases error risk vs careful work takes longer',
-            'Build excess capacity for peaks (expensive) vs run at high utilisation (inflexible)',
-            'Standard processes are efficient but inflexible vs custom services are expensive',
-            'Automation reduces labour costs but eliminates jobs vs labour-intensive preserves jobs'
-        ],
-        'Port Example': [
-            'Cheap cranes break down more vs expensive cranes more reliable',
-            'Extra berths costly but handle peaks vs no spare capacity means delays in peaks',
-            'Fast turnaround risks mistakes vs thorough checks slow operations',
-            "Tuas 65M TEU capacity but currently 37M throughput vs build only what's needed now",
-            'All vessels follow same process (efficient) vs customized handling for special cargo',
-            'AGVs replace human drivers (cost-efficient) vs human workforce (employment)'
-        ],
-        'How Ports Decide': [
-            'Premium pricing justifies quality investment',
-            'Maintain ~10-15% excess capacity as buffer',
-            'Balance with automation and checks',
-            'Long-term planning, build in phases',
-            'Standard core + premium options',
-            'Gradual transition, retrain workers'
-        ]
-    })
+    tradeoffs = catalog.load('operations_management/tradeoffs')
     
     st.dataframe(tradeoffs, width='stretch', hide_index=True)
     
@@ -826,7 +724,7 @@ def show():
     # SECTION 8: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -0,0 +1,85 @@
+import hashlib
+import itertools
+import json
+import time
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from modules import deferred, instrument
+
+pd = deferred.module('pandas')
+
+# Process-wide cache for the tables and figures each page builds.
+#
+# Pages pass a builder callable together with a (page, name) key. The builder
+# only runs on the first request for that key; every later rerun, in any
+# session, gets the cached result back. Builders are taken as underscore
+# arguments so Streamlit does not try to hash them, which also means the key
+# must be unique per page. Cached tables are shared, so callers must treat
+# them as read-only (use e.g. sort_values() rather than in-place edits).
+#
+# Figures are serialized to JSON once and handed to st.plotly_chart as a
+# CachedFigure, so a rerun neither rebuilds nor deep-copies the figure. A
+# figure's cache key includes the versions of the tables it was built from,
+# so replacing a table invalidates every chart drawn from it.
+
+_table_versions = itertools.count(1)
+
+
+class CachedFigure(go.Figure):
+    # Render-only handle for a figure that was serialized once per process.
+    # st.plotly_chart only calls to_dict(), which here parses the cached JSON
+    # into a fresh dict instead of deep-copying a live figure.
+
+    def __init__(self, spec):
+        super().__init__()
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+    def to_plotly_json(self):
+        return self.to_dict()
+
+    def to_json(self, *args, **kwargs):
+        return self._spec
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_table(page, name, _build):
+    df = _build()
+    df.attrs['version'] = next(_table_versions)
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=512)
+def _cached_figure(page, name, deps_key, _build):
+    return CachedFigure(_build().to_json())
+
+
+def version(data):
+    # Tables from table() and catalog.load() carry a version stamp; anything
+    # else is hashed.
+    if isinstance(data, pd.DataFrame):
+        if 'version' in data.attrs:
+            return data.attrs['version']
+        return int(pd.util.hash_pandas_object(data).sum())
+    return hashlib.md5(repr(data).encode()).hexdigest()
+
+
+def table(page, name, build):
+    return _cached_table(page, name, build)
+
+
+def figure(page, name, build, deps=()):
+    start = time.perf_counter()
+    deps_key = tuple(version(d) for d in deps)
+    fig = _cached_figure(page, name, deps_key, build)
+    instrument.record_figure(time.perf_counter() - start, len(fig._spec))
+    return fig
+
+
+def clear():
+    _cached_table.clear()
+    _cached_figure.clear()
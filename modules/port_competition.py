@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, instrument, page_cache
 
 def show():
     st.markdown('<p class="main-header">⚓ Port Strategy & Competition</p>', unsafe_allow_html=True)
@@ -17,7 +18,7 @@ def show():
     # SECTION 1: Critical Success Factors for Transshipment Hubs
     # ============================================================================
     
-    st.markdown('<p class="section-header">Critical Success Factors for Transshipment Hubs</p>', unsafe_allow_html=True)
+    instrument.section_header('Critical Success Factors for Transshipment Hubs')
     
     st.markdown("""
     Not all ports are created equal. To succeed as a major transshipment hub in today's competitive 
@@ -27,38 +28,7 @@ def show():
     st.markdown('<p class="subsection-header">The Essential Eight Factors</p>', unsafe_allow_html=True)
     
     # Success factors with detailed breakdown
-    success_factors = pd.DataFrame({
-        'Factor': [
-            'Efficiency & Flexibility',
-            'Reliability',
-            'Security & Safety',
-            'Cost vs Service Level',
-            'Connectivity',
-            'Infrastructure & Technology',
-            'Skilled Workers + Management',
-            'Strategic Location'
-        ],
-        'Why It Matters': [
-            'Fast turnaround times reduce vessel port stay, lowering costs for shipping lines',
-            'Predictable schedules allow tight connections; JIT supply chains demand reliability',
-            'Cargo safety, port security, maritime safety standards; ISPS compliance required',
-            'Balance competitive pricing with quality service; "tight connections" for time-sensitive cargo',
-            'Number of shipping lines, frequency of services, global port network reach',
-            'Adequate capacity for current + future demand; modern equipment; automation; IT systems',
-            'Technical expertise, operational excellence, stable labour relations, capable leadership',
-            'Proximity to major shipping lanes; centrality to trade flows; natural deep-water harbor'
-        ],
-        "Singapore's Performance": [
-            'Excellent: 24-36 hour vessel turnaround for mega vessels; flexible berth allocation',
-            'Outstanding: BOA >90%; minimal weather disruptions; strong track record',
-            'World-class: ISPS certified; advanced security systems; low piracy risk',
-            'Competitive: Not cheapest but excellent value; premium service justifies pricing',
-            'Best-in-class: 200+ lines, 600+ ports; unmatched global reach',
-            'Leading: S$20B+ Tuas investment; automated systems; CITOS; latest cranes',
-            'Strong: Skilled workforce; SMA training; stable government; capable MPA/PSA management',
-            'Ideal: On Asia-Europe route; 33% of global trade through Straits of Malacca/Singapore'
-        ]
-    })
+    success_factors = catalog.load('port_competition/success_factors')
     
     st.dataframe(success_factors, width='stretch', hide_index=True)
     
@@ -76,46 +46,45 @@ def show():
     """, unsafe_allow_html=True)
     
     # Visual representation of factor importance
-    factors_radar = pd.DataFrame({
-        'Factor': ['Efficiency', 'Reliability', 'Security', 'Cost/Service', 
-                   'Connectivity', 'Infrastructure', 'Workforce', 'Location'],
-        'Singapore': [95, 95, 98, 85, 100, 95, 90, 100],
-        'Competitor Average': [75, 70, 80, 70, 65, 70, 75, 60]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=factors_radar['Singapore'],
-        theta=factors_radar['Factor'],
-        fill='toself',
-        name='Singapore',
-        line=dict(color='#3B82F6', width=3),
-        fillcolor='rgba(59, 130, 246, 0.3)'
-    ))
-    
-    fig.add_trace(go.Scatterpolar(
-        r=factors_radar['Competitor Average'],
-        theta=factors_radar['Factor'],
-        fill='toself',
-        name='Regional Competitor Avg',
-        line=dict(color='#EF4444', width=3),
-        fillcolor='rgba(239, 68, 68, 0.2)'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 100])
-        ),
-        showlegend=True,
-        title={
-            'text': 'Port Competitiveness: Singapore vs Regional Competitors',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        height=500
-    )
+    factors_radar = catalog.load('port_competition/factors_radar')
+    
+    def build_factors_radar_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatterpolar(
+            r=factors_radar['Singapore'],
+            theta=factors_radar['Factor'],
+            fill='toself',
+            name='Singapore',
+            line=dict(color='#3B82F6', width=3),
+            fillcolor='rgba(59, 130, 246, 0.3)'
+        ))
+        
+        fig.add_trace(go.Scatterpolar(
+            r=factors_radar['Competitor Average'],
+            theta=factors_radar['Factor'],
+            fill='toself',
+            name='Regional Competitor Avg',
+            line=dict(color='#EF4444', width=3),
+            fillcolor='rgba(239, 68, 68, 0.2)'
+        ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(visible=True, range=[0, 100])
+            ),
+            showlegend=True,
+            title={
+                'text': 'Port Competitiveness: Singapore vs Regional Competitors',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=500
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'factors_radar_chart', build_factors_radar_chart, deps=(factors_radar,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -123,7 +92,7 @@ def show():
     # SECTION 2: Port Types and Strategic Positioning
     # ============================================================================
     
-    st.markdown('<p class="section-header">Port Types: Gateway vs Transshipment vs Hub</p>', unsafe_allow_html=True)
+    instrument.section_header('Port Types: Gateway vs Transshipment vs Hub')
     
     st.markdown("""
     Different ports serve different strategic roles in the global shipping network. Understanding these 
@@ -228,7 +197,7 @@ def show():
     # SECTION 3: Regional Competition Landscape
     # ============================================================================
     
-    st.markdown('<p class="section-header">Facing Increasing Regional Competition</p>', unsafe_allow_html=True)
+    instrument.section_header('Facing Increasing Regional Competition')
     
     st.markdown("""
     Singapore does not compete in isolation. Ambitious port developments across Southeast Asia are 
@@ -238,53 +207,7 @@ def show():
     st.markdown('<p class="subsection-header">Major Regional Competitors</p>', unsafe_allow_html=True)
     
     # Regional ports data
-    regional_ports = pd.DataFrame({
-        'Port Development': [
-            'Malaysia - Carey Island',
-            'Malaysia - Melaka Gateway',
-            'Malaysia - East Coast Rail Link',
-            'Indonesia - Tanjung Priok',
-            'Thailand - Isthmus of Kra (proposed)',
-            'Vietnam - Cai Mep',
-            'Myanmar - Kyaukpyu'
-        ],
-        'Location': [
-            'Near Port Klang, Malaysia',
-            'Malacca Strait, Malaysia',
-            'Kuantan to Port Klang rail',
-            'Jakarta, Indonesia',
-            'Southern Thailand',
-            'Near Ho Chi Minh City',
-            'Myanmar (Chinese investment)'
-        ],
-        'Status': [
-            'Planned/Developing',
-            'Under development',
-            'Under construction',
-            'Expanding capacity',
-            'Proposed (decades)',
-            'Growing rapidly',
-            'Chinese BRI project'
-        ],
-        'Threat Level to Singapore': [
-            'Medium: Proximity to Malacca Strait',
-            'Medium: Strategic location',
-            'Low-Medium: Inland connectivity',
-            'Low: Gateway port focus',
-            'High (if built): Would bypass Singapore',
-            'Low-Medium: Different hinterland',
-            'Medium: Alternative route to China'
-        ],
-        'Key Advantages': [
-            'Lower costs, land availability',
-            'Good location, government support',
-            'Connects east-west Malaysia',
-            'Serves Indonesian market (large)',
-            'Could save 2-3 days transit time',
-            'Growing Vietnamese economy',
-            'Chinese backing, strategic route'
-        ]
-    })
+    regional_ports = catalog.load('port_competition/regional_ports')
     
     st.dataframe(regional_ports, width='stretch', hide_index=True)
     
@@ -330,7 +253,7 @@ def show():
     # SECTION 4: Global Competition
     # ============================================================================
     
-    st.markdown('<p class="section-header">Global Port Competition</p>', unsafe_allow_html=True)
+    instrument.section_header('Global Port Competition')
     
     st.markdown("""
     Singapore also competes globally with other major transshipment hubs for specific trade lanes and 
@@ -338,65 +261,48 @@ def show():
     """)
     
     # Global competitors
-    global_competitors = pd.DataFrame({
-        'Port': ['Shanghai', 'Ningbo-Zhoushan', 'Shenzhen', 'Busan', 'Hong Kong', 'Dubai', 'Rotterdam', 'Antwerp'],
-        'Country': ['China', 'China', 'China', 'S. Korea', 'China', 'UAE', 'Netherlands', 'Belgium'],
-        'Annual TEU (M)': [49.0, 35.0, 30.0, 22.0, 18.0, 14.0, 15.0, 14.0],
-        'Primary Type': ['Gateway', 'Gateway', 'Gateway', 'Hub', 'Hub', 'Hub', 'Hub', 'Gateway'],
-        'Competitive Focus': [
-            'Chinese exports',
-            'Chinese exports, bulk cargo',
-            'Pearl River Delta gateway',
-            'Northeast Asia hub',
-            'South China gateway + hub',
-            'Middle East/Africa hub',
-            'European gateway + hub',
-            'European gateway'
-        ]
-    })
+    global_competitors = catalog.load('port_competition/global_competitors')
     
     st.dataframe(global_competitors, width='stretch', hide_index=True)
     
     # Top 10 ports visualization
-    top_ports = pd.DataFrame({
-        'Port': ['Shanghai', 'Singapore', 'Ningbo-Zhoushan', 'Shenzhen', 'Guangzhou', 
-                 'Busan', 'Qingdao', 'Hong Kong', 'Tianjin', 'Rotterdam'],
-        'TEU (Millions)': [49.0, 37.3, 35.0, 30.0, 25.0, 22.0, 21.0, 18.0, 17.0, 15.0],
-        'Type': ['Gateway', 'Transship Hub', 'Gateway', 'Gateway', 'Gateway',
-                'Hub', 'Gateway', 'Hub', 'Gateway', 'Hub']
-    })
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=top_ports['TEU (Millions)'],
-            y=top_ports['Port'],
-            orientation='h',
-            marker=dict(
-                color=['#94A3B8' if t == 'Gateway' else '#3B82F6' for t in top_ports['Type']],
-                line=dict(color='#1F2937', width=1)
-            ),
-            text=top_ports['TEU (Millions)'],
-            textposition='outside',
-            textfont=dict(size=12)
+    top_ports = catalog.load('port_competition/top_ports')
+    
+    def build_top_ports_chart():
+        fig = go.Figure(data=[
+            go.Bar(
+                x=top_ports['TEU (Millions)'],
+                y=top_ports['Port'],
+                orientation='h',
+                marker=dict(
+                    color=['#94A3B8' if t == 'Gateway' else '#3B82F6' for t in top_ports['Type']],
+                    line=dict(color='#1F2937', width=1)
+                ),
+                text=top_ports['TEU (Millions)'],
+                textposition='outside',
+                textfont=dict(size=12)
+            )
+        ])
+        
+        fig.update_layout(
+            title={
+                'text': "World's Top 10 Container Ports by Annual Throughput",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Annual TEU (Millions)",
+            height=450,
+            plot_bgcolor='white',
+            xaxis=dict(gridcolor='#E5E7EB'),
+            annotations=[
+                dict(x=35, y='Singapore', text='#1 Transshipment Hub', 
+                     showarrow=True, arrowhead=2, ax=-50, ay=-30, font=dict(color='#3B82F6', size=11))
+            ]
         )
-    ])
-    
-    fig.update_layout(
-        title={
-            'text': "World's Top 10 Container Ports by Annual Throughput",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Annual TEU (Millions)",
-        height=450,
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='#E5E7EB'),
-        annotations=[
-            dict(x=35, y='Singapore', text='#1 Transshipment Hub', 
-                 showarrow=True, arrowhead=2, ax=-50, ay=-30, font=dict(color='#3B82F6', size=11))
-        ]
-    )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'top_ports_chart', build_top_ports_chart, deps=(top_ports,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -423,7 +329,7 @@ def show():
     # SECTION 5: Strategic Planning for Port Competitiveness
     # ============================================================================
     
-    st.markdown('<p class="section-header">Strategic Planning for Port Competitiveness</p>', unsafe_allow_html=True)
+    instrument.section_header('Strategic Planning for Port Competitiveness')
     
     st.markdown("""
     Maintaining competitiveness requires deliberate, long-term strategic planning. Successful ports 
@@ -527,7 +433,7 @@ def show():
     # SECTION 6: Emerging Threats and Route Changes
     # ============================================================================
     
-    st.markdown('<p class="section-header">Emerging Threats: New Trade Routes and Channels</p>', unsafe_allow_html=True)
+    instrument.section_header('Emerging Threats: New Trade Routes and Channels')
     
     st.markdown("""
     Beyond port-to-port competition, Singapore faces potential threats from entirely new routing options 
@@ -537,37 +443,7 @@ def show():
     st.markdown('<p class="subsection-header">Alternative Routes Under Development</p>', unsafe_allow_html=True)
     
     # Threats analysis
-    threats_data = pd.DataFrame({
-        'Threat': [
-            'Arctic Route (Northern Sea Route)',
-            'Kra Canal (Thailand)',
-            'Trans-Pacific Rail Link',
-            'Economic Zones Shifts',
-            'Shipping Alliance Changes'
-        ],
-        'Description': [
-            'Arctic melting opens Norway-Korea route, 30% shorter than Suez',
-            'Canal across Thai isthmus bypasses Malacca Strait entirely',
-            'Seaway to rail connection across North America',
-            'Manufacturing shifts affect origin/destination patterns',
-            'Alliance restructuring changes port calling patterns'
-        ],
-        'Likelihood': ['Medium (2030s-2040s)', 'Low (decades away)', 'Low-Medium', 'High (ongoing)', 'Medium-High'],
-        'Impact if Occurs': [
-            'High: Could divert Asia-Europe traffic away from Singapore',
-            "Very High: Direct threat to Singapore's strategic location",
-            'Low: Limited to specific routes, capacity constrained',
-            'Medium: Requires adaptation but manageable',
-            'Medium: Can be mitigated through relationships and JVs'
-        ],
-        "Singapore's Response": [
-            'Monitor; maintain cost competitiveness; diversify services',
-            'Tuas investment locks in scale; ecosystem creates switching costs',
-            'Not directly addressable; maintain overall competitiveness',
-            'Adapt to new trade patterns; flexible infrastructure',
-            'Joint ventures; dedicated terminals; long-term partnerships'
-        ]
-    })
+    threats_data = catalog.load('port_competition/threats_data')
     
     st.dataframe(threats_data, width='stretch', hide_index=True)
     
@@ -605,7 +481,7 @@ def show():
     # SECTION 7: Green Ports and Sustainability
     # ============================================================================
     
-    st.markdown('<p class="section-header">Green Ports and Sustainability</p>', unsafe_allow_html=True)
+    instrument.section_header('Green Ports and Sustainability')
     
     st.markdown("""
     Environmental sustainability is increasingly a competitive factor in port strategy. Leading ports 
@@ -692,7 +568,7 @@ def show():
     # SECTION 8: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -0,0 +1,311 @@
+"""Monte Carlo simulation of a vessel's port stay.
+
+The Terminal Operations page shows a typical call as six fixed phases that
+add up to 22 hours. Here the same call is a discrete-event simulation, run
+many times with random durations. Each run is driven by a priority queue of
+timed events (``Engine``). Resources with a fixed number of units
+(``Pool``) are shared first come, first served:
+
+- Arrival & Mooring: pilot boarding, sometimes delayed when the pilots or
+  tugs are busy, then mooring
+- Pre-Operations: a safety check, then each crane's section of the vessel is
+  unlashed and its hatch covers opened by one of the lashing gangs. A crane
+  starts as soon as its own section is ready.
+- Discharge and Loading: each quay crane works its share of the moves,
+  discharge first. Every move needs a prime mover under the crane, and the
+  prime movers are one pool shared by all cranes. A crane waits when none
+  is free. Cranes also break down now and then.
+- Post-Operations: lashing gangs secure each section once its crane
+  finishes, then final checks and paperwork
+- Departure: pilot boarding again, then unmooring
+
+The crane split is uneven, so the call ends with the crane that has the most
+moves. Phase durations are measured between milestones (moored, all cranes
+working, discharge done, loading done, ready to sail, departed), so they add
+up to the turnaround time.
+
+Replications are independent. ``replicate()`` spreads them over worker
+processes, with one seed per replication spawned from a single
+``SeedSequence``. The results are the same for any number of workers:
+
+    runs = port_stay.replicate(2000, cranes=4, prime_movers=20)
+    port_stay.percentiles(runs)            # P50 / P80 / P90 / P95 per phase
+    runs['Turnaround'].quantile(0.9)       # an hours figure to commit to
+
+From the command line, as a timing check:
+
+    python -m modules.port_stay demo -n 5000 --workers 4
+"""
+import argparse
+import heapq
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+PHASES = ['Arrival & Mooring', 'Pre-Operations', 'Discharge', 'Loading', 'Post-Operations', 'Departure']
+
+# A 2,200-move call like the one in the operations timeline. Times in hours.
+SCENARIO = dict(
+    discharge=1000,            # import moves
+    load=1200,                 # export moves
+    cranes=4,
+    prime_movers=20,
+    lashing_gangs=2,
+    crane_cycle_min=1.5,       # mean crane cycle per move, minutes
+    yard_trip_min=6.0,         # mean prime mover round trip to the yard for a discharge move, minutes
+    load_trip_min=7.0,         # the same for a load move: export boxes are dug out of the stack in sequence
+    crane_mtbf=40.0,           # mean working hours between crane breakdowns
+    crane_repair=0.75,         # mean repair time
+    pilot_delay_prob=0.3,      # chance the pilot or tugs are busy when needed
+    pilot_delay=0.5,           # mean extra wait when they are
+)
+
+
+class Engine:
+    # Events are (time, sequence, action, args). The sequence number keeps
+    # events at the same time in the order they were scheduled.
+
+    def __init__(self):
+        self.now = 0.0
+        self._queue = []
+        self._count = itertools.count()
+
+    def at(self, when, action, *args):
+        heapq.heappush(self._queue, (when, next(self._count), action, args))
+
+    def after(self, delay, action, *args):
+        self.at(self.now + delay, action, *args)
+
+    def run(self):
+        queue = self._queue
+        while queue:
+            self.now, _, action, args = heapq.heappop(queue)
+            action(*args)
+        return self.now
+
+
+class Pool:
+    # Identical units (prime movers, lashing gangs), granted first come,
+    # first served. The action runs as soon as a unit is free.
+
+    def __init__(self, size):
+        self.free = size
+        self._waiting = deque()
+
+    def request(self, action, *args):
+        if self.free:
+            self.free -= 1
+            action(*args)
+        else:
+            self._waiting.append((action, args))
+
+    def release(self):
+        if self._waiting:
+            action, args = self._waiting.popleft()
+            action(*args)
+        else:
+            self.free += 1
+
+
+class _Call:
+    # One replication of one vessel call
+
+    def __init__(self, rng, scenario):
+        self.rng = rng
+        self.s = scenario
+        self.engine = Engine()
+        self.movers = Pool(scenario['prime_movers'])
+        self.gangs = Pool(scenario['lashing_gangs'])
+        self.milestones = {}
+        self.crane_wait = 0.0
+
+        cranes = scenario['cranes']
+        # Uneven crane split: bays differ in size and not every crane can
+        # reach every bay
+        shares = rng.dirichlet(np.full(cranes, 20.0))
+        self.discharge = rng.multinomial(scenario['discharge'], shares)
+        self.load = rng.multinomial(scenario['load'], shares)
+        self.unready = cranes        # sections not yet unlashed
+        self.discharging = cranes
+        self.working = cranes
+        self.securing = cranes
+
+    def _pilot(self):
+        delayed = self.rng.random() < self.s['pilot_delay_prob']
+        return self.rng.exponential(self.s['pilot_delay']) if delayed else 0.0
+
+    def run(self):
+        e = self.engine
+        e.after(self._pilot() + self.rng.triangular(0.2, 0.3, 0.6), self._moor)
+        e.run()
+        return self.milestones
+
+    # Arrival and pre-operations
+    def _moor(self):
+        self.engine.after(self.rng.triangular(0.7, 1.0, 1.5), self._moored)
+
+    def _moored(self):
+        self.milestones['moored'] = self.engine.now
+        self.engine.after(self.rng.triangular(0.2, 0.3, 0.6), self._prepare)
+
+    def _prepare(self):
+        for crane in range(self.s['cranes']):
+            self.gangs.request(self._unlash, crane)
+
+    def _unlash(self, crane):
+        self.engine.after(self.rng.triangular(0.15, 0.25, 0.5), self._section_ready, crane)
+
+    def _section_ready(self, crane):
+        self.gangs.release()
+        self.unready -= 1
+        if not self.unready:
+            self.milestones['working'] = self.engine.now
+        _Crane(self, crane).next_move()
+
+    # Crane work
+    def crane_discharged(self):
+        self.discharging -= 1
+        if not self.discharging:
+            self.milestones['discharged'] = self.engine.now
+
+    def crane_done(self, crane):
+        self.working -= 1
+        if not self.working:
+            self.milestones['loaded'] = self.engine.now
+        self.gangs.request(self._secure, crane)
+
+    # Post-operations and departure
+    def _secure(self, crane):
+        self.engine.after(self.rng.triangular(0.2, 0.35, 0.7), self._secured)
+
+    def _secured(self):
+        self.gangs.release()
+        self.securing -= 1
+        if not self.securing:
+            self.engine.after(self.rng.triangular(0.3, 0.5, 1.0), self._ready)
+
+    def _ready(self):
+        self.milestones['ready'] = self.engine.now
+        self.engine.after(self._pilot() + self.rng.triangular(0.3, 0.45, 0.8), self._departed)
+
+    def _departed(self):
+        self.milestones['departed'] = self.engine.now
+
+
+class _Crane:
+    # Works its discharge moves, then its load moves. Every move holds a
+    # prime mover for the crane cycle plus its yard round trip.
+
+    def __init__(self, call, crane):
+        self.call = call
+        s, rng = call.s, call.rng
+        discharge, load = int(call.discharge[crane]), int(call.load[crane])
+        moves = discharge + load
+        self.crane = crane
+        self.discharge = discharge
+        self.done = 0
+        self.moves = moves
+        # Gamma-distributed cycle and trip times, drawn for the whole crane
+        # at once: minutes -> hours
+        self.cycle = rng.gamma(6.0, s['crane_cycle_min'] / 6.0 / 60, moves)
+        trip_mean = np.r_[np.full(discharge, s['yard_trip_min']), np.full(load, s['load_trip_min'])]
+        self.trip = rng.gamma(4.0, 1 / 4.0 / 60, moves) * trip_mean
+        self.next_failure = rng.exponential(s['crane_mtbf'])
+        self.worked = 0.0
+        self.requested = 0.0
+        if not discharge:
+            call.crane_discharged()
+
+    def next_move(self):
+        if self.done == self.moves:
+            self.call.crane_done(self.crane)
+            return
+        self.requested = self.call.engine.now
+        self.call.movers.request(self._lift)
+
+    def _lift(self):
+        call = self.call
+        engine = call.engine
+        call.crane_wait += engine.now - self.requested
+        cycle = self.cycle[self.done]
+        engine.after(cycle + self.trip[self.done], call.movers.release)
+        self.worked += cycle
+        delay = cycle
+        if self.worked >= self.next_failure:
+            delay += call.rng.exponential(call.s['crane_repair'])
+            self.next_failure = self.worked + call.rng.exponential(call.s['crane_mtbf'])
+        self.done += 1
+        engine.after(delay, self._finished)
+
+    def _finished(self):
+        if self.done == self.discharge:
+            self.call.crane_discharged()
+        self.next_move()
+
+
+def simulate(seed=None, **scenario):
+    # One replication: phase durations, turnaround and crane hours lost
+    # waiting for prime movers
+    s = {**SCENARIO, **scenario}
+    call = _Call(np.random.default_rng(seed), s)
+    m = call.run()
+    edges = [0.0, m['moored'], m['working'], m['discharged'], m['loaded'], m['ready'], m['departed']]
+    return np.diff(edges).tolist() + [m['departed'], call.crane_wait]
+
+
+def _run_chunk(seeds, scenario):
+    return [simulate(seed, **scenario) for seed in seeds]
+
+
+def replicate(n=1000, workers=None, seed=0, **scenario):
+    seeds = np.random.SeedSequence(seed).spawn(n)
+    workers = min(workers or os.cpu_count() or 1, n)
+    if workers <= 1:
+        rows = _run_chunk(seeds, scenario)
+    else:
+        # A few chunks per worker evens out uneven chunk times. Fresh
+        # interpreters rather than forks, since the app server is threaded.
+        chunks = [list(chunk) for chunk in np.array_split(np.array(seeds, dtype=object), workers * 4) if len(chunk)]
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            rows = [row for part in pool.map(_run_chunk, chunks, itertools.repeat(scenario)) for row in part]
+    return pd.DataFrame(rows, columns=PHASES + ['Turnaround', 'Crane Wait'])
+
+
+def percentiles(runs, q=(50, 80, 90, 95)):
+    # Hours per phase and for the whole stay, one column per percentile
+    table = runs[PHASES + ['Turnaround']].quantile([p / 100 for p in q]).T
+    table.columns = [f'P{p}' for p in q]
+    return table.round(2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.port_stay',
+                                     description='Monte Carlo simulation of a vessel port stay.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    demo = sub.add_parser('demo', help='run replications and time them')
+    demo.add_argument('-n', '--replications', type=int, default=2000)
+    demo.add_argument('--workers', type=int, help='worker processes (default: one per core)')
+    demo.add_argument('--cranes', type=int, default=SCENARIO['cranes'])
+    demo.add_argument('--prime-movers', type=int, default=SCENARIO['prime_movers'])
+    demo.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    runs = replicate(args.replications, args.workers, args.seed, cranes=args.cranes, prime_movers=args.prime_movers)
+    elapsed = time.perf_counter() - start
+    print(percentiles(runs).to_string())
+    print(f"\n{args.replications} replications in {elapsed:.2f} s "
+          f"({elapsed / args.replications * 1e3:.1f} ms each), "
+          f"mean crane wait for prime movers {runs['Crane Wait'].mean():.1f} crane-hours")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,398 @@
+"""Empty container repositioning as a min-cost flow over a port network.
+
+Every port has a weekly empty balance: a surplus (more empties than it needs,
+usually an import-heavy port) or a deficit (an export port short of boxes).
+Empties move along lanes, which are the legs of liner services. Each lane
+has a cost per TEU and the slots its vessels can give to empties each week.
+A deficit that repositioning cannot cover, or only at a higher cost, is
+met by leasing boxes locally at ``lease_cost`` per TEU. Surplus that is not
+needed stays where it is.
+
+As a flow network there is a source S, a sink T and one node per port:
+
+- S -> port, capacity the port's surplus, cost 0
+- S -> port, capacity the port's deficit, cost ``lease_cost`` (on-hire)
+- port -> T, capacity the port's deficit, cost 0
+- port -> port for each lane, capacity its slots, cost its cost per TEU
+
+S sends the total deficit to T at least cost. The solver uses successive
+shortest paths with node potentials. Dijkstra runs from every node with
+excess flow to the nearest node short of it, over reduced costs that the
+potentials keep non-negative. The flow found is optimal and integral.
+
+The residual network and potentials are kept between solves. Changing a
+port's balance only changes the capacity of its three arcs. Any arc that is
+now over capacity or under-used at a negative reduced cost is fixed, which
+leaves a few units of excess. Only those units are re-routed, so a weekly
+update re-plans without starting over:
+
+    net = repositioning.Network(*repositioning.example_network())
+    plan = net.solve()
+    plan.cost, plan.flows, plan.ports
+    plan = net.set_balance('Los Angeles', 4000)    # incremental
+
+``example_network()`` is a 14-port network of main-line services, and
+``synthetic_network()`` builds one of any size:
+
+    python -m modules.repositioning demo --ports 300 --lanes 3000
+"""
+import argparse
+import heapq
+import math
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+LEASE_COST = 900.0            # USD per TEU to on-hire a box where it is needed
+HANDLING = 120.0              # USD per TEU for the lift off and on of one leg
+SLOT_COST_PER_1000_KM = 28.0  # USD per TEU of slot cost
+EPS = 1e-9
+
+# Weekly empty balance in TEU: positive is a surplus, negative a deficit
+PORTS = {
+    'Shanghai': (31.2, 121.5, -5200),
+    'Ningbo': (29.9, 121.6, -3100),
+    'Shenzhen': (22.5, 114.1, -3600),
+    'Busan': (35.1, 129.0, -600),
+    'Singapore': (1.3, 103.8, 400),
+    'Colombo': (6.9, 79.8, 300),
+    'Jebel Ali': (25.0, 55.1, 1400),
+    'Rotterdam': (51.9, 4.1, 2600),
+    'Antwerp': (51.3, 4.3, 1200),
+    'Hamburg': (53.5, 9.9, 1500),
+    'Los Angeles': (33.7, -118.3, 3300),
+    'Long Beach': (33.8, -118.2, 2600),
+    'New York': (40.7, -74.0, 1200),
+    'Santos': (-24.0, -46.3, -1400),
+}
+
+# Port rotations and the slots each gives to empties per week on every leg
+SERVICES = {
+    'Asia - North Europe': (['Shanghai', 'Ningbo', 'Shenzhen', 'Singapore', 'Colombo', 'Rotterdam', 'Hamburg',
+                             'Antwerp'], 2500),
+    'Asia - Middle East': (['Shanghai', 'Ningbo', 'Singapore', 'Jebel Ali'], 900),
+    'Transpacific South': (['Shenzhen', 'Shanghai', 'Busan', 'Los Angeles', 'Long Beach'], 3500),
+    'Transpacific North': (['Busan', 'Ningbo', 'Los Angeles'], 1800),
+    'Asia - US East Coast': (['Shanghai', 'Ningbo', 'Shenzhen', 'Singapore', 'New York'], 1200),
+    'Transatlantic': (['Rotterdam', 'Antwerp', 'Hamburg', 'New York'], 900),
+    'Europe - South America': (['Rotterdam', 'Antwerp', 'Santos'], 800),
+    'Asia - South America': (['Singapore', 'Shenzhen', 'Santos'], 700),
+}
+
+
+class RepositioningError(ValueError):
+    pass
+
+
+def distance_km(a, b):
+    # Great-circle distance between (lat, lon) points, times 1.25 for the
+    # detours of sea routes
+    (lat1, lon1), (lat2, lon2) = np.radians(a), np.radians(b)
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 1.25 * 2 * 6371 * np.arcsin(np.sqrt(h))
+
+
+def lane_cost(km):
+    return np.round(HANDLING + SLOT_COST_PER_1000_KM * np.asarray(km) / 1000, 0)
+
+
+def example_network():
+    # Ports, lanes and balances of the main-line network above
+    ports = list(PORTS)
+    rows = []
+    for name, (rotation, slots) in SERVICES.items():
+        for a, b in zip(rotation, rotation[1:] + rotation[:1]):
+            km = distance_km(PORTS[a][:2], PORTS[b][:2])
+            rows.append((a, b, name, float(lane_cost(km)), slots))
+    lanes = pd.DataFrame(rows, columns=['From', 'To', 'Service', 'Cost', 'Capacity'])
+    balance = pd.Series({port: PORTS[port][2] for port in ports}, name='Balance')
+    return ports, lanes, balance
+
+
+def synthetic_network(ports=300, lanes=3000, seed=0):
+    # Ports scattered over the globe, each linked to its nearest neighbours
+    # and to one distant port, with balances that roughly net out
+    rng = np.random.default_rng(seed)
+    lat = np.degrees(np.arcsin(rng.uniform(-0.8, 0.9, ports)))
+    lon = rng.uniform(-180, 180, ports)
+    names = [f'P{i:03d}' for i in range(ports)]
+    km = distance_km((lat[:, None], lon[:, None]), (lat[None, :], lon[None, :]))
+    np.fill_diagonal(km, np.inf)
+    per_port = max(lanes // ports, 2)
+    near = np.argsort(km, axis=1)[:, :per_port - 1]
+    far = rng.integers(ports, size=(ports, 1))
+    pairs = np.c_[np.repeat(np.arange(ports), per_port), np.c_[near, far].ravel()]
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]][:lanes]
+    lane_table = pd.DataFrame({
+        'From': np.asarray(names)[pairs[:, 0]],
+        'To': np.asarray(names)[pairs[:, 1]],
+        'Cost': lane_cost(km[pairs[:, 0], pairs[:, 1]]),
+        'Capacity': rng.integers(2, 16, len(pairs)) * 100,
+    })
+    balance = np.round(rng.normal(0, 1500, ports) / 50) * 50
+    balance -= np.round(balance.mean())
+    return names, lane_table, pd.Series(balance.astype(np.int64), index=names, name='Balance')
+
+
+class Plan:
+    def __init__(self, network, seconds, paths):
+        self.seconds = seconds
+        self.paths = paths
+        flow = network.lane_flows()
+        lanes = network.lanes.assign(TEU=flow)
+        self.flows = lanes[lanes['TEU'] > 0].assign(Total=lambda d: d['TEU'] * d['Cost']).reset_index(drop=True)
+        balance = network.balance
+        shipped = self.flows.groupby('From')['TEU'].sum().reindex(balance.index, fill_value=0)
+        received = self.flows.groupby('To')['TEU'].sum().reindex(balance.index, fill_value=0)
+        leased = pd.Series(network.leased(), index=balance.index)
+        self.ports = pd.DataFrame({
+            'Balance': balance,
+            'Shipped': shipped,
+            'Received': received,
+            'Leased': leased,
+            # Surplus left where it is: ports can also pass empties on
+            'Idle': (balance - shipped + received).where(balance > 0, 0),
+        })
+        self.repositioning_cost = float(self.flows['Total'].sum())
+        self.lease_cost = float((leased * network.lease_cost).sum())
+        self.cost = self.repositioning_cost + self.lease_cost
+
+    def summary(self):
+        return {
+            'cost_usd': round(self.cost),
+            'repositioning_usd': round(self.repositioning_cost),
+            'leasing_usd': round(self.lease_cost),
+            'moved_teu': int(self.flows['TEU'].sum()),
+            'leased_teu': int(self.ports['Leased'].sum()),
+            'lanes_used': len(self.flows),
+            'paths': self.paths,
+            'seconds': round(self.seconds, 3),
+        }
+
+
+class Network:
+    # Arcs are stored in pairs: arc k and its reverse k ^ 1. cap holds the
+    # residual capacity, so the flow on arc k is cap[k ^ 1].
+
+    def __init__(self, ports, lanes, balance, lease_cost=LEASE_COST):
+        self.port_names = list(ports)
+        index = {name: i for i, name in enumerate(self.port_names)}
+        unknown = (set(lanes['From']) | set(lanes['To']) | set(balance.index)) - set(index)
+        if unknown:
+            raise RepositioningError(f"Unknown ports: {', '.join(sorted(map(str, unknown)))[:200]}")
+        if (lanes['Cost'] < 0).any() or (lanes['Capacity'] < 0).any():
+            raise RepositioningError("Lane costs and capacities must not be negative")
+        self.lanes = lanes.reset_index(drop=True)
+        self.lease_cost = float(lease_cost)
+        n = len(self.port_names)
+        self.source, self.sink = n, n + 1
+        self.head = [[] for _ in range(n + 2)]
+        self.to, self.cap, self.cost = [], [], []
+        self.potential = [0.0] * (n + 2)
+        self.excess = [0] * (n + 2)
+        self.balance = pd.Series(0, index=self.port_names, name='Balance', dtype=np.int64)
+
+        self._supply = [self._arc(self.source, i, 0.0) for i in range(n)]
+        self._lease = [self._arc(self.source, i, self.lease_cost) for i in range(n)]
+        self._demand = [self._arc(i, self.sink, 0.0) for i in range(n)]
+        self._lanes = [self._arc(index[a], index[b], float(c))
+                       for a, b, c in zip(self.lanes['From'], self.lanes['To'], self.lanes['Cost'])]
+        for k, capacity in zip(self._lanes, self.lanes['Capacity']):
+            self._set_capacity(k, int(capacity))
+        self._index = index
+        self._pending = balance.reindex(self.port_names, fill_value=0).astype(np.int64)
+
+    def _arc(self, u, v, cost):
+        k = len(self.to)
+        self.to += [v, u]
+        self.cap += [0, 0]
+        self.cost += [cost, -cost]
+        self.head[u].append(k)
+        self.head[v].append(k + 1)
+        return k
+
+    def _set_capacity(self, k, capacity):
+        # New capacity for arc k, keeping every residual arc at a
+        # non-negative reduced cost. Flow that no longer fits, or that is
+        # now worth sending, becomes excess at the arc's ends.
+        u, v = self.to[k ^ 1], self.to[k]
+        flow = self.cap[k ^ 1]
+        if capacity < flow:
+            self.cap[k ^ 1] = capacity
+            self.cap[k] = 0
+            self.excess[u] += flow - capacity
+            self.excess[v] -= flow - capacity
+            return
+        self.cap[k] = capacity - flow
+        if self.cap[k] and self.cost[k] + self.potential[u] - self.potential[v] < -EPS:
+            extra = self.cap[k]
+            self.cap[k] = 0
+            self.cap[k ^ 1] += extra
+            self.excess[u] -= extra
+            self.excess[v] += extra
+
+    def _apply_balance(self, i, value):
+        old = int(self.balance.iat[i])
+        self.balance.iat[i] = value
+        # S has to deliver the total deficit to T
+        change = max(-value, 0) - max(-old, 0)
+        self.excess[self.source] += change
+        self.excess[self.sink] -= change
+        self._set_capacity(self._supply[i], max(value, 0))
+        self._set_capacity(self._lease[i], max(-value, 0))
+        self._set_capacity(self._demand[i], max(-value, 0))
+
+    def _shortest_path(self):
+        # Dijkstra over reduced costs from every node with excess, to the
+        # first node found short of flow. Updates the potentials and returns
+        # that node and the arc into each node on its path.
+        excess, head, to, cap, cost, potential = self.excess, self.head, self.to, self.cap, self.cost, self.potential
+        dist = {}
+        parent = {}
+        queue = [(0.0, v) for v in range(len(head)) if excess[v] > 0]
+        heapq.heapify(queue)
+        best = {v: 0.0 for _, v in queue}
+        target = None
+        while queue:
+            d, u = heapq.heappop(queue)
+            if u in dist:
+                continue
+            dist[u] = d
+            if excess[u] < 0:
+                target = u
+                break
+            pu = potential[u]
+            for k in head[u]:
+                if cap[k]:
+                    v = to[k]
+                    if v in dist:
+                        continue
+                    nd = d + cost[k] + pu - potential[v]
+                    if nd < best.get(v, math.inf) - EPS:
+                        best[v] = nd
+                        parent[v] = k
+                        heapq.heappush(queue, (nd, v))
+        if target is None:
+            raise RepositioningError("No feasible plan: some deficit cannot be reached")
+        limit = dist[target]
+        for v in range(len(head)):
+            potential[v] += min(dist.get(v, limit), limit)
+        return target, parent
+
+    def _rebalance(self):
+        paths = 0
+        excess, to, cap = self.excess, self.to, self.cap
+        while any(e > 0 for e in excess):
+            target, parent = self._shortest_path()
+            # Walk back to the source of the path for the amount to send
+            amount, v = -excess[target], target
+            while v in parent:
+                k = parent[v]
+                amount = min(amount, cap[k])
+                v = to[k ^ 1]
+            amount = min(amount, excess[v])
+            v = target
+            while v in parent:
+                k = parent[v]
+                cap[k] -= amount
+                cap[k ^ 1] += amount
+                v = to[k ^ 1]
+            excess[v] -= amount
+            excess[target] += amount
+            paths += 1
+        return paths
+
+    def solve(self):
+        start = time.perf_counter()
+        for i, value in enumerate(self._pending):
+            if value != self.balance.iat[i]:
+                self._apply_balance(i, int(value))
+        self._pending = None
+        paths = self._rebalance()
+        return Plan(self, time.perf_counter() - start, paths)
+
+    def set_balance(self, port, value):
+        # Re-plan after one port's balance changes, from the current plan
+        if self._pending is not None:
+            raise RepositioningError("Call solve() before updating balances")
+        if port not in self._index:
+            raise RepositioningError(f"Unknown port: {port}")
+        start = time.perf_counter()
+        self._apply_balance(self._index[port], int(value))
+        paths = self._rebalance()
+        return Plan(self, time.perf_counter() - start, paths)
+
+    def lane_flows(self):
+        return np.array([self.cap[k ^ 1] for k in self._lanes], dtype=np.int64)
+
+    def leased(self):
+        return np.array([self.cap[k ^ 1] for k in self._lease], dtype=np.int64)
+
+
+def flow_figure(plan, ports=PORTS):
+    # Lanes carrying empties on a world map, width by TEU
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    top = plan.flows['TEU'].max() if len(plan.flows) else 1
+    for row in plan.flows.itertuples():
+        (lat1, lon1, _), (lat2, lon2, _) = ports[row.From], ports[row.To]
+        fig.add_trace(go.Scattergeo(
+            lat=[lat1, lat2], lon=[lon1, lon2], mode='lines', showlegend=False,
+            line=dict(width=1 + 7 * row.TEU / top, color='#3B82F6'), opacity=0.7,
+            hoverinfo='text', text=f"{row.From} → {row.To}: {row.TEU:,} TEU at ${row.Cost:,.0f}",
+        ))
+    table = plan.ports
+    names = list(table.index)
+    fig.add_trace(go.Scattergeo(
+        lat=[ports[p][0] for p in names], lon=[ports[p][1] for p in names], mode='markers+text',
+        text=names, textposition='top center', showlegend=False,
+        marker=dict(size=8 + np.sqrt(table['Balance'].abs()) / 6,
+                    color=np.where(table['Balance'] > 0, '#10B981', '#EF4444'), line=dict(color='white', width=1)),
+        hovertext=[f"{p}: balance {b:+,} TEU, leased {le:,}" for p, b, le in zip(names, table['Balance'],
+                                                                                table['Leased'])],
+        hoverinfo='text',
+    ))
+    fig.update_geos(projection_type='natural earth', showland=True, landcolor='#F3F4F6',
+                    showcountries=False, coastlinecolor='#D1D5DB')
+    fig.update_layout(margin=dict(l=0, r=0, t=50, b=0))
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.repositioning',
+                                     description='Empty container repositioning by min-cost flow.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('example', help='solve the 14-port example network')
+    demo = sub.add_parser('demo', help='solve a synthetic network, then re-plan after balance changes')
+    demo.add_argument('--ports', type=int, default=300)
+    demo.add_argument('--lanes', type=int, default=3000)
+    demo.add_argument('--updates', type=int, default=5)
+    demo.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == 'example':
+        plan = Network(*example_network()).solve()
+        print(plan.summary())
+        print(plan.ports.to_string())
+        print(plan.flows[['From', 'To', 'Service', 'TEU', 'Cost']].to_string())
+        return 0
+
+    ports, lanes, balance = synthetic_network(args.ports, args.lanes, args.seed)
+    net = Network(ports, lanes, balance)
+    plan = net.solve()
+    print(f"{len(ports)} ports, {len(lanes)} lanes: {plan.summary()}")
+    rng = np.random.default_rng(args.seed + 1)
+    for port in rng.choice(ports, args.updates, replace=False):
+        value = int(balance[port] + rng.integers(-20, 21) * 50)
+        plan = net.set_balance(port, value)
+        balance[port] = value
+        full = Network(ports, lanes, balance).solve()
+        print(f"{port} -> {value:+,}: incremental {plan.seconds * 1e3:7.1f} ms ({plan.paths} paths), "
+              f"full {full.seconds * 1e3:7.1f} ms, cost {plan.cost:,.0f} vs {full.cost:,.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
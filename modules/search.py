@@ -0,0 +1,264 @@
+"""Full-text search over every page of the knowledge base.
+
+The index is built from page sources rather than by rendering them. Each
+page module is parsed, and the text of its st.* calls is collected together
+with the cells of every catalog table it loads. Text is grouped by the
+section it appears under (an ``instrument.section_header()`` call or an
+``@sections.section()`` function), so each hit names a page and a section
+anchor.
+
+Postings are kept in an inverted index (term -> [(doc, weight)]) and ranked
+with BM25. Terms in section and subsection headers are weighted up, and the
+last query term also matches as a prefix to support search-as-you-type. A
+query touches only the postings of its own terms and takes well under a
+millisecond.
+
+The index is built once per process. It can also be prebuilt and persisted,
+in which case it is reused until a page source or the catalog changes:
+
+    python -m modules.search build
+    python -m modules.search query "berth on arrival"
+"""
+import argparse
+import ast
+import bisect
+import hashlib
+import json
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import streamlit as st
+
+from modules import catalog, instrument
+
+MODULES_DIR = Path(__file__).resolve().parent
+INDEX_PATH = catalog.DATA_DIR / 'search_index.json'
+
+# st.* (and column/container) calls whose string arguments are page content
+TEXT_CALLS = {
+    'markdown', 'write', 'caption', 'text', 'title', 'header', 'subheader',
+    'info', 'success', 'warning', 'error', 'metric', 'expander', 'tabs',
+}
+SECTION_WEIGHT = 3
+SUBSECTION_WEIGHT = 2
+PREFIX_EXPANSIONS = 20
+K1, B = 1.2, 0.75
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_TAG = re.compile(r'<[^>]+>')
+_SUBSECTION = re.compile(r'<p class="subsection-header">(.*?)</p>', re.S)
+_MARKUP = re.compile(r'[*_`#|>]+')
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def _plain(text):
+    text = _TAG.sub(' ', text)
+    text = _MARKUP.sub(' ', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def page_modules():
+    return sorted(
+        path.stem for path in MODULES_DIR.glob('*.py')
+        if '\ndef show(' in path.read_text(encoding='utf-8')
+    )
+
+
+class _PageExtractor(ast.NodeVisitor):
+    # Walks a page module in source order, splitting its text into sections
+
+    def __init__(self, page):
+        self.page = page
+        self.sections = []
+        self._start('(introduction)')
+
+    def _start(self, title):
+        self.current = {'page': self.page, 'section': title, 'anchor': instrument.anchor(title),
+                        'weighted': [(title, SECTION_WEIGHT)], 'text': []}
+        self.sections.append(self.current)
+
+    def _add(self, text, weight=1):
+        plain = _plain(text)
+        if plain:
+            self.current['weighted'].append((plain, weight))
+            self.current['text'].append(plain)
+
+    def visit_FunctionDef(self, node):
+        # Long pages declare sections with @sections.section('Title')
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call) and ast.unparse(decorator.func) == 'sections.section'
+                    and isinstance(decorator.args[0], ast.Constant)):
+                self._start(decorator.args[0].value)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        owner = ast.unparse(func.value) if isinstance(func, ast.Attribute) else ''
+        strings = [a.value for a in list(node.args) + [k.value for k in node.keywords]
+                   if isinstance(a, ast.Constant) and isinstance(a.value, str)]
+
+        if owner == 'instrument' and name == 'section_header' and strings:
+            self._start(strings[0])
+        elif owner == 'catalog' and name == 'load' and strings:
+            self._add_table(strings[0])
+        elif name in TEXT_CALLS:
+            for text in strings:
+                for subsection in _SUBSECTION.findall(text):
+                    self._add(subsection, SUBSECTION_WEIGHT)
+                self._add(_SUBSECTION.sub(' ', text))
+        self.generic_visit(node)
+
+    def _add_table(self, name):
+        df = catalog.load(name)
+        self._add(' '.join(str(c) for c in df.columns))
+        for row in df.astype(str).itertuples(index=False):
+            self._add(' · '.join(row))
+
+
+def _extract(page):
+    source = (MODULES_DIR / f'{page}.py').read_text(encoding='utf-8')
+    extractor = _PageExtractor(page)
+    extractor.visit(ast.parse(source))
+    return [s for s in extractor.sections if s['text'] or s['section'] != '(introduction)']
+
+
+def fingerprint(pages):
+    digest = hashlib.sha256()
+    for page in pages:
+        digest.update(page.encode())
+        digest.update((MODULES_DIR / f'{page}.py').read_bytes())
+    digest.update(json.dumps(catalog.manifest(), sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class SearchIndex:
+    def __init__(self, docs, postings, fingerprint=None):
+        self.docs = docs
+        self.postings = postings
+        self.fingerprint = fingerprint
+        self.vocabulary = sorted(postings)
+        self.avg_length = sum(d['length'] for d in docs) / max(len(docs), 1)
+
+    @classmethod
+    def build(cls, pages):
+        docs, postings = [], defaultdict(list)
+        for page in pages:
+            for section in _extract(page):
+                counts = Counter()
+                for text, weight in section['weighted']:
+                    for term in tokenize(text):
+                        counts[term] += weight
+                doc_id = len(docs)
+                docs.append({
+                    'page': section['page'],
+                    'section': section['section'],
+                    'anchor': section['anchor'],
+                    'text': ' '.join(section['text']),
+                    'length': sum(counts.values()),
+                })
+                for term, weight in counts.items():
+                    postings[term].append((doc_id, weight))
+        return cls(docs, dict(postings), fingerprint(pages))
+
+    def to_dict(self):
+        return {'fingerprint': self.fingerprint, 'docs': self.docs, 'postings': self.postings}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['docs'], data['postings'], data.get('fingerprint'))
+
+    def _expand(self, term):
+        if term in self.postings:
+            return [term]
+        start = bisect.bisect_left(self.vocabulary, term)
+        matches = []
+        for candidate in self.vocabulary[start:start + PREFIX_EXPANSIONS]:
+            if not candidate.startswith(term):
+                break
+            matches.append(candidate)
+        return matches
+
+    def search(self, query, limit=10):
+        terms = tokenize(query)
+        if not terms:
+            return []
+        n = len(self.docs)
+        scores = defaultdict(float)
+        matched = defaultdict(set)
+        for position, term in enumerate(terms):
+            # Only the last term is treated as a prefix (search-as-you-type)
+            candidates = self._expand(term) if position == len(terms) - 1 else [term] if term in self.postings else []
+            for candidate in candidates:
+                postings = self.postings[candidate]
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings:
+                    length = self.docs[doc_id]['length']
+                    scores[doc_id] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / self.avg_length))
+                    matched[doc_id].add(position)
+
+        # Prefer sections matching every term; fall back to any term
+        complete = [d for d in scores if len(matched[d]) == len(terms)]
+        ranked = sorted(complete or scores, key=lambda d: -scores[d])[:limit]
+        return [dict(self._hit(d, terms), score=round(scores[d], 3)) for d in ranked]
+
+    def _hit(self, doc_id, terms):
+        doc = self.docs[doc_id]
+        return {'page': doc['page'], 'section': doc['section'], 'anchor': doc['anchor'],
+                'snippet': _snippet(doc['text'], terms)}
+
+
+def _snippet(text, terms, width=160):
+    lowered = text.lower()
+    positions = [i for i in (lowered.find(t) for t in terms) if i >= 0]
+    start = max(min(positions, default=0) - width // 3, 0)
+    snippet = text[start:start + width]
+    return ('…' if start else '') + snippet + ('…' if start + width < len(text) else '')
+
+
+def save(index, path=INDEX_PATH):
+    path.write_text(json.dumps(index.to_dict(), ensure_ascii=False), encoding='utf-8')
+
+
+@st.cache_resource(show_spinner=False)
+def _load(pages, manifest_version):
+    current = fingerprint(pages)
+    if INDEX_PATH.exists():
+        data = json.loads(INDEX_PATH.read_text(encoding='utf-8'))
+        if data.get('fingerprint') == current:
+            return SearchIndex.from_dict(data)
+    return SearchIndex.build(pages)
+
+
+def load(pages=None):
+    pages = tuple(pages or page_modules())
+    return _load(pages, catalog.manifest()['version'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.search', description='Build or query the search index.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help=f'build and persist the index to {INDEX_PATH}')
+    query = sub.add_parser('query', help='run a query against the index')
+    query.add_argument('text')
+    query.add_argument('-n', '--limit', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index = SearchIndex.build(page_modules())
+        save(index)
+        print(f"indexed {len(index.docs)} sections, {len(index.postings)} terms -> {INDEX_PATH}")
+    else:
+        for hit in load().search(args.text, args.limit):
+            print(f"{hit['score']:7.2f}  {hit['page']} › {hit['section']}  (#{hit['anchor']})")
+            print(f"         {hit['snippet']}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Section-level rendering for long pages.
+
+A long page defines each section as its own function decorated with
+``@section(title)``. The decorated function renders the section header and
+then runs the body as an ``st.fragment``, so interactions inside a section
+rerun that section only.
+
+Lazy sections (the default) only render their header on first paint. The
+body sits behind a collapsed expander that reruns just its own fragment
+when opened, so time-to-first-paint covers the eager sections and the
+section headers. Pass ``lazy=False`` for the sections above the fold.
+"""
+import functools
+
+import streamlit as st
+
+from modules import instrument
+
+EXPANDER_LABEL = '📖 Read this section'
+
+
+def expander_key(module, anchor):
+    # Session-state key of a lazy section's expander, e.g. for search links
+    return f'{module}:{anchor}'
+
+
+@st.fragment
+def _lazy(key, body):
+    with st.expander(EXPANDER_LABEL, key=key, on_change='rerun') as expander:
+        if expander.open:
+            body()
+
+
+def section(title, lazy=True):
+    def decorate(body):
+        fragment = st.fragment(body)
+
+        @functools.wraps(body)
+        def render():
+            instrument.section_header(title)
+            if lazy:
+                _lazy(expander_key(body.__module__, instrument.anchor(title)), body)
+            else:
+                fragment()
+
+        return render
+
+    return decorate
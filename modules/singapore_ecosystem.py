@@ -1,6 +1,6 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, sections
 
 def show():
     st.markdown('<p class="main-header">🇸🇬 Maritime Singapore Ecosystem</p>', unsafe_allow_html=True)
@@ -14,12 +14,33 @@ def show():
     </div>
     """, unsafe_allow_html=True)
     
+    _singapore_s_maritime_position()
+    _maritime_and_port_authority_of_singapore_mpa()
+    _the_complete_maritime_cluster()
+    _innovation_and_digital_transformation()
+    _sustainability_and_green_shipping()
+    _key_takeaways()
+    
     # ============================================================================
-    # SECTION 1: Singapore's Maritime Position
+    # Navigation
     # ============================================================================
     
-    st.markdown('<p class="section-header">Singapore: The World\'s Maritime Capital</p>', unsafe_allow_html=True)
-    
+    st.markdown("---")
+    st.markdown("### 📚 Continue Learning")
+    st.markdown("""
+    **Next Topic:** ⚓ Port Strategy & Competition - Explore the critical success factors for transshipment 
+    hubs, competitive dynamics between Singapore and regional ports (Port Klang, Tanjung Pelepas, Colombo, 
+    Jebel Ali), strategic planning frameworks, and Singapore's response to competition through Tuas Port 
+    investment and ecosystem development.
+    """)
+
+
+# ============================================================================
+# SECTION 1: Singapore's Maritime Position
+# ============================================================================
+
+@sections.section('Singapore: The World\'s Maritime Capital', lazy=False)
+def _singapore_s_maritime_position():
     st.markdown("""
     Singapore has deliberately cultivated its position as the global maritime hub over 70+ years through 
     strategic planning, continuous investment, and ecosystem development. In 2025, Singapore was ranked 
@@ -146,22 +167,7 @@ def show():
     # Performance comparison chart
     st.markdown('<p class="subsection-header">Singapore vs Competitor Ports (2024)</p>', unsafe_allow_html=True)
     
-    port_comparison = pd.DataFrame({
-        'Port': ['Singapore', 'Shanghai', 'Ningbo-Zhoushan', 'Shenzhen', 'Hong Kong', 'Busan', 'Rotterdam', 'Antwerp'],
-        'Throughput (M TEU)': [41.1, 49.2, 35.3, 30.0, 17.8, 22.9, 14.5, 12.0],
-        'Country': ['Singapore', 'China', 'China', 'China', 'China/HK', 'South Korea', 'Netherlands', 'Belgium'],
-        'Transshipment %': [90, 45, 30, 40, 65, 50, 35, 55],
-        'Role': [
-            'Pure transshipment hub',
-            'Import/export gateway',
-            'Import/export gateway',
-            'Import/export gateway',
-            'Transshipment hub',
-            'Regional transshipment',
-            'European gateway',
-            'European gateway'
-        ]
-    })
+    port_comparison = catalog.load('singapore_ecosystem/port_comparison')
     
     st.dataframe(port_comparison, use_container_width=True, hide_index=True)
     
@@ -174,13 +180,15 @@ def show():
     - **Competition**: Shanghai/Ningbo/Shenzhen are destination ports (serving Chinese market)
     - **Regional**: Hong Kong/Busan compete but less comprehensive ecosystem
     """)
-    
-    # ============================================================================
-    # SECTION 2: Maritime and Port Authority of Singapore (MPA)
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Maritime and Port Authority (MPA): The Dual Role</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 2: Maritime and Port Authority of Singapore (MPA)
+# ============================================================================
+
+@sections.section('Maritime and Port Authority (MPA): The Dual Role')
+def _maritime_and_port_authority_of_singapore_mpa():
     st.markdown("""
     MPA is **unique globally** in combining regulatory and developmental functions. This dual mandate 
     enables coordinated long-term strategic planning that has positioned Singapore as the world's premier 
@@ -294,13 +302,15 @@ def show():
     - **Challenge**: Coordination difficulties, conflicting priorities, slower adaptation
     - **Singapore advantage**: Unified strategy, faster decision-making, aligned incentives
     """)
-    
-    # ============================================================================
-    # SECTION 3: The Complete Maritime Cluster
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Singapore\'s Complete Maritime Cluster</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 3: The Complete Maritime Cluster
+# ============================================================================
+
+@sections.section('Singapore\'s Complete Maritime Cluster')
+def _the_complete_maritime_cluster():
     st.markdown("""
     Singapore offers a comprehensive ecosystem of maritime services—this "one-stop shop" creates 
     powerful network effects and high switching costs, reinforcing Singapore's competitive position.
@@ -309,53 +319,7 @@ def show():
     st.markdown('<p class="subsection-header">The Seven Pillars of Maritime Singapore</p>', unsafe_allow_html=True)
     
     # Maritime cluster components - enhanced
-    cluster_components = pd.DataFrame({
-        'Pillar': [
-            '1. Port and Terminal Operations',
-            '2. Shipping and Liner Services',
-            '3. Ship Repair and Shipbuilding',
-            '4. Maritime Ancillary Services',
-            '5. Maritime Finance and Insurance',
-            '6. Maritime Law and Arbitration',
-            '7. Maritime Technology and Innovation'
-        ],
-        'Key Players': [
-            'PSA (40.9M TEU 2024), Jurong Port, cargo handlers',
-            '200+ shipping lines, ship management companies, Asia-Pacific HQs',
-            'Sembcorp Marine, Keppel, 40+ shipyards, dry-docking facilities',
-            'Bunkering (54.92M tonnes 2024), ship chandlers, crew managers, supplies',
-            'Major banks, ship financing, P&I clubs, marine insurers, reinsurers',
-            'Maritime law firms, Singapore Chamber of Maritime Arbitration, courts',
-            '140+ PIER71 startups, R&D centres (NUS, NTU, SUTD, A*STAR), SMI'
-        ],
-        'Services Provided': [
-            'Container handling, cargo storage, transshipment (90% of throughput)',
-            'Liner services, vessel operations, freight forwarding, ship management',
-            'Dry-docking, repairs, retrofits, conversions, new builds (offshore/naval)',
-            'Fuel supply (conventional + alternative), provisions, crew changes, maintenance',
-            'Ship loans, project finance, hull/cargo/P&I insurance, reinsurance',
-            'Maritime disputes, contracts, arbitration, litigation, advisory',
-            'Digital solutions, automation, AI, IoT, blockchain, green tech, cybersecurity'
-        ],
-        'Why Critically Important': [
-            'Core infrastructure - without efficient port, entire hub collapses',
-            'Global connectivity - 200+ lines connect Singapore to 600+ ports worldwide',
-            'Vessel maintenance - ships need periodic servicing (dry-dock every 2-5 years)',
-            'Operational support - vessels need fuel, supplies, crew changes at every port call',
-            'Capital and risk - shipping is capital-intensive, requires sophisticated finance',
-            'Dispute resolution - international contracts need trusted legal framework',
-            'Competitive edge - innovation drives efficiency, sustainability, future growth'
-        ],
-        'Singapore\'s Advantage': [
-            'World-class efficiency (10-16h turnaround), reliability (no strikes), scale',
-            'Most comprehensive liner connectivity globally, 200+ lines, frequent services',
-            '40+ yards, all vessel types, offshore/naval expertise, strategic location',
-            'World\'s largest bunkering port (54.92M tonnes), alternative fuels leadership',
-            'Major financial centre (ranked top 5 globally), ship finance expertise',
-            'Trusted neutral jurisdiction, English common law, maritime expertise',
-            '140+ startups, S$100M+ raised, government support (MINT, PIER71), sandboxes'
-        ]
-    })
+    cluster_components = catalog.load('singapore_ecosystem/cluster_components')
     
     st.dataframe(cluster_components, use_container_width=True, hide_index=True)
     
@@ -492,13 +456,15 @@ def show():
     Singapore increasingly chosen for maritime arbitration (competing with London), especially for 
     Asia-Pacific disputes. SCMA caseload growing, recognition increasing globally.
     """)
-    
-    # ============================================================================
-    # SECTION 4: Innovation and Digital Transformation
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Innovation and Digital Transformation</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 4: Innovation and Digital Transformation
+# ============================================================================
+
+@sections.section('Innovation and Digital Transformation')
+def _innovation_and_digital_transformation():
     st.markdown("""
     Singapore is positioning itself as the world's leading maritime technology hub through coordinated 
     initiatives spanning startups, R&D, digital platforms, and enabling infrastructure.
@@ -714,13 +680,15 @@ def show():
     monitoring and adjusting regulations based on results. This accelerates deployment while 
     maintaining safety and environmental standards.
     """)
-    
-    # ============================================================================
-    # SECTION 5: Sustainability and Green Shipping
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Sustainability and Green Shipping</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 5: Sustainability and Green Shipping
+# ============================================================================
+
+@sections.section('Sustainability and Green Shipping')
+def _sustainability_and_green_shipping():
     st.markdown("""
     Singapore is positioning itself as a green maritime hub through infrastructure investment, 
     incentives, and international cooperation on decarbonisation.
@@ -755,49 +723,7 @@ def show():
     st.markdown('<p class="subsection-header">Alternative Fuel Infrastructure</p>', unsafe_allow_html=True)
     
     # Alternative fuels comparison
-    alt_fuels = pd.DataFrame({
-        'Fuel Type': ['Conventional (LSFO/MGO)', 'LNG', 'Methanol', 'Ammonia', 'Biofuels', 'Hydrogen'],
-        'Singapore Status (2024-2025)': [
-            'Fully operational (54.0M tonnes conventional in 2024)',
-            'Operational (0.46M tonnes in 2024, expanding)',
-            'Commercial-scale (1,626 tonnes in 2024, standards published)',
-            'Trials phase (9.74 tonnes world first, standards in dev 2025)',
-            'Commercial (0.88M tonnes blends up to B50, B100 trials)',
-            'R&D phase (no commercial bunkering yet)'
-        ],
-        'GHG Reduction vs Conventional': [
-            'Baseline (0%)',
-            '20-25% (lifecycle), near-zero SOx',
-            '10-15% (conventional), near-zero if green',
-            'Zero (if green ammonia)',
-            '30-80% (depending on blend, feedstock)',
-            'Zero (if green hydrogen)'
-        ],
-        'Availability': [
-            'Abundant globally',
-            'Growing (7% of global fleet capable)',
-            'Limited, production scaling',
-            'Very limited, in development',
-            'Limited, scaling production',
-            'Very limited, in development'
-        ],
-        'Challenges': [
-            'High GHG emissions, sulphur content',
-            'Methane slip, cryogenic storage, cost',
-            'Toxic, corrosive, lower energy density, cost 2× conventional',
-            'Toxic, NOx emissions, low energy density, cost',
-            'Feedstock availability, cost, compatibility',
-            'Low energy density, storage, cost, safety'
-        ],
-        'Singapore Investment': [
-            'Mature infrastructure',
-            'LNG terminals, bunkering vessels, reloading (EOI Dec 2024)',
-            'Bunkering facilities, Technical Reference 2024',
-            'Safety standards 2025, pilot infrastructure',
-            'Widely available (B50), trialing B100',
-            'R&D support, future infrastructure planned'
-        ]
-    })
+    alt_fuels = catalog.load('singapore_ecosystem/alt_fuels')
     
     st.dataframe(alt_fuels, use_container_width=True, hide_index=True)
     
@@ -862,13 +788,15 @@ def show():
     Singapore actively contributes to IMO standards development, ensuring global regulations are 
     workable and Singapore remains at forefront of alternative fuel adoption.
     """)
-    
-    # ============================================================================
-    # SECTION 6: Key Takeaways
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 6: Key Takeaways
+# ============================================================================
+
+@sections.section('Key Takeaways')
+def _key_takeaways():
     col1, col2 = st.columns(2)
     
     with col1:
@@ -963,16 +891,3 @@ def show():
     support, positions Singapore to remain the world's premier maritime hub for decades to come.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # Navigation
-    # ============================================================================
-    
-    st.markdown("---")
-    st.markdown("### 📚 Continue Learning")
-    st.markdown("""
-    **Next Topic:** ⚓ Port Strategy & Competition - Explore the critical success factors for transshipment 
-    hubs, competitive dynamics between Singapore and regional ports (Port Klang, Tanjung Pelepas, Colombo, 
-    Jebel Ali), strategic planning frameworks, and Singapore's response to competition through Tuas Port 
-    investment and ecosystem development.
-    """)
@@ -0,0 +1,221 @@
+"""Bay-Row-Tier slot addresses packed into one int32.
+
+An address is held as four bit fields, most significant first:
+
+    block (9 bits) | bay (9 bits) | row position (6 bits) | tier (7 bits)
+
+Bays and tiers are stored as their numbers (bay 01-511, tier 01-127), since
+those already run bow to stern and bottom to top. Row numbers do not run
+across the ship. They count out from the centreline, odd to starboard and
+even to port (as in modules/bay_plan), so a row is stored as its position
+from port to starboard:
+
+    row       64 ... 06 04 02 00 01 03 05 ... 61
+    position   0 ... 29 30 31 32 33 34 35 ... 63
+
+The 6-bit field covers even rows up to 64 on the port side and odd rows up
+to 61 on starboard.
+
+Sorting packed addresses therefore orders slots physically: by block (a yard
+block, or a vessel in a fleet), then bay, then across the ship, then up the
+stack. The slots of one stack are contiguous, and ``stack()`` drops the
+tier to give a key for the whole stack. Everything is vectorised:
+
+    codes = slot_address.parse(['120486', '120484', '0010682'])
+    slot_address.decode(codes)          # block, bay, row, tier arrays
+    slot_address.format(codes)          # ['120486', '120484', '010682']
+    np.sort(codes)                      # 120484 below 120486 in the same stack
+    slot_address.encode(bay=12, row=4, tier=86, block=3)
+
+``format()`` writes BBRRTT, BBBRRTT from bay 100 on, and BBBRRTTT from
+tier 100 on (the largest vessels stack 11 tiers on deck, up to tier 102),
+so bay 001 comes back as 01. ``parse()`` reads all three, ignoring spaces
+and dashes, and returns INVALID (-1) for strings that are not an address,
+including bay or tier 00. Both take one address or an array of them. An address is 4 bytes against
+about 65 for a Python string, and sorts and joins are integer operations:
+
+    python -m modules.slot_address demo --vessels 50
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from modules import iso6346
+
+TIER_BITS, ROW_BITS, BAY_BITS, BLOCK_BITS = 7, 6, 9, 9
+ROW_SHIFT = TIER_BITS
+BAY_SHIFT = ROW_SHIFT + ROW_BITS
+BLOCK_SHIFT = BAY_SHIFT + BAY_BITS
+CENTRE = 1 << (ROW_BITS - 1)              # position of row 00
+INVALID = -1
+
+# Where each string length puts its digits in BBBRRTTT
+_LAYOUTS = {
+    8: [0, 1, 2, 3, 4, 5, 6, 7],            # BBBRRTTT
+    7: [0, 1, 2, 3, 4, 6, 7],               # BBBRRTT
+    6: [1, 2, 3, 4, 6, 7],                  # BBRRTT
+}
+
+
+class SlotError(ValueError):
+    pass
+
+
+def row_position(row):
+    # Row number -> position from port to starboard
+    row = np.asarray(row, dtype=np.int32)
+    return np.where(row % 2 == 1, CENTRE + (row + 1) // 2, CENTRE - row // 2)
+
+
+def row_number(position):
+    offset = np.asarray(position, dtype=np.int32) - CENTRE
+    return np.where(offset > 0, 2 * offset - 1, -2 * offset)
+
+
+def _in_range(block, bay, row, tier):
+    # Bays and tiers count from 01; 0 in either field is not a slot
+    return ((block >= 0) & (block < 1 << BLOCK_BITS) & (bay >= 1) & (bay < 1 << BAY_BITS)
+            & (row >= 0) & (row_position(row) < 1 << ROW_BITS) & (tier >= 1) & (tier < 1 << TIER_BITS))
+
+
+def _pack(block, bay, row, tier):
+    return ((block << BLOCK_SHIFT) | (bay << BAY_SHIFT) | (row_position(row) << ROW_SHIFT) | tier).astype(np.int32)
+
+
+def encode(bay, row, tier, block=0):
+    # Scalars or arrays, broadcast together
+    block, bay, row, tier = (np.asarray(x, dtype=np.int32) for x in np.broadcast_arrays(block, bay, row, tier))
+    bad = ~_in_range(block, bay, row, tier)
+    if bad.any():
+        i = np.flatnonzero(bad.ravel())[0]
+        raise SlotError(f"{int(bad.sum())} addresses out of range, e.g. block {block.ravel()[i]} bay "
+                        f"{bay.ravel()[i]} row {row.ravel()[i]} tier {tier.ravel()[i]} (limits: block < "
+                        f"{1 << BLOCK_BITS}, bay 1-{(1 << BAY_BITS) - 1}, odd rows <= {2 * CENTRE - 3}, even rows "
+                        f"<= {2 * CENTRE}, tier 1-{(1 << TIER_BITS) - 1})")
+    return _pack(block, bay, row, tier)
+
+
+def decode(codes):
+    # (block, bay, row, tier) arrays, rows as row numbers
+    codes = np.asarray(codes, dtype=np.int32)
+    block = codes >> BLOCK_SHIFT
+    bay = (codes >> BAY_SHIFT) & ((1 << BAY_BITS) - 1)
+    row = row_number((codes >> ROW_SHIFT) & ((1 << ROW_BITS) - 1))
+    tier = codes & ((1 << TIER_BITS) - 1)
+    return block, bay, row, tier
+
+
+def stack(codes):
+    # Block, bay and row without the tier: equal for every slot in a stack
+    return np.asarray(codes, dtype=np.int32) >> TIER_BITS
+
+
+def parse(addresses, block=0):
+    # Address strings -> packed addresses in `block` (a scalar or one per
+    # address), INVALID where a string is not an address. One string gives
+    # one code.
+    scalar = np.ndim(addresses) == 0
+    compact, length = iso6346.normalise(iso6346.pack(np.atleast_1d(addresses), width=10))
+    n = len(compact)
+    # Spread into the eight-digit BBBRRTTT form, so BBRRTT reads as 0BBRR0TT
+    digits = np.full((n, 8), ord('0'), dtype=np.uint8)
+    for size, columns in _LAYOUTS.items():
+        rows = length == size
+        digits[np.ix_(rows, columns)] = compact[rows, :size]
+    digits -= ord('0')
+    value = digits.astype(np.int32)
+    bay = value[:, 0] * 100 + value[:, 1] * 10 + value[:, 2]
+    row = value[:, 3] * 10 + value[:, 4]
+    tier = value[:, 5] * 100 + value[:, 6] * 10 + value[:, 7]
+    block = np.broadcast_to(np.asarray(block, dtype=np.int32), (n,))
+    ok = np.isin(length, list(_LAYOUTS)) & (digits <= 9).all(axis=1) & _in_range(block, bay, row, tier)
+    codes = np.where(ok, _pack(block, bay, row, tier), INVALID).astype(np.int32)
+    return codes[0] if scalar else codes
+
+
+def format(codes):
+    # Packed addresses -> address strings, '' for INVALID. One code gives
+    # one string.
+    scalar = np.ndim(codes) == 0
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.int32))
+    _, bay, row, tier = decode(codes)
+    fields = np.stack([bay // 100, bay // 10 % 10, bay % 10, row // 10, row % 10,
+                       tier // 100, tier // 10 % 10, tier % 10, np.full_like(bay, -ord('0'))], axis=1)
+    full = (fields + ord('0')).astype(np.uint8)          # BBBRRTTT and a NUL
+    size = np.where(tier >= 100, 8, np.where(bay >= 100, 7, 6))
+    picks = np.full((3, 8), 8)
+    for i, (n, columns) in enumerate(_LAYOUTS.items()):
+        picks[i, :n] = columns
+    text = np.take_along_axis(full, picks[8 - size], axis=1)
+    text[codes < 0] = 0
+    strings = np.ascontiguousarray(text).view('S8').ravel().astype(str)
+    return str(strings[0]) if scalar else strings
+
+
+def describe(code):
+    # One address in words, for display
+    block, bay, row, tier = (int(x) for x in decode(code))
+    side = 'centreline' if row == 0 else ('starboard' if row % 2 else 'port')
+    return {
+        'Bay': f"{bay:02d} ({'40ft' if bay % 2 == 0 else '20ft'} bay)",
+        'Row': f"{row:02d} ({side})",
+        'Tier': f"{tier:02d} ({'on deck' if tier >= 80 else 'in the hold'})",
+        'Packed': int(code),
+        'Stack': int(stack(code)),
+    }
+
+
+def fleet_slots(vessels=50, seed=0):
+    # Every slot of a fleet of mega-vessels, one block per vessel, in random
+    # order. bay_plan imports this module, hence the late import.
+    from modules import bay_plan
+    slots = bay_plan.vessel_slots()
+    plan = bay_plan.BayPlan(slots, [], hold_tiers=11)
+    addresses = plan.addresses()[slots]
+    codes = (addresses[None, :] | (np.arange(vessels, dtype=np.int32)[:, None] << BLOCK_SHIFT)).ravel()
+    return np.random.default_rng(seed).permutation(codes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.slot_address', description='Packed slot addresses.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('decode', help='describe BBRRTT addresses')
+    show.add_argument('addresses', nargs='+')
+    demo = sub.add_parser('demo', help='compare packed addresses with strings for a fleet')
+    demo.add_argument('--vessels', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    if args.command == 'decode':
+        codes = parse(args.addresses)
+        for text, code in zip(args.addresses, codes):
+            print(f"{text:10s}", describe(code) if code != INVALID else 'not an address')
+        return 0 if (codes != INVALID).all() else 1
+
+    codes = fleet_slots(args.vessels)
+    block, _, _, _ = decode(codes)
+    strings = pd.Series(np.char.add(np.char.zfill(block.astype(str), 3), format(codes)), dtype=object)
+    ints = pd.Series(codes)
+    print(f"{len(codes):,} slots in {args.vessels} vessels: "
+          f"{strings.memory_usage(deep=True) / 1e6:.0f} MB as strings, {ints.memory_usage() / 1e6:.0f} MB packed")
+    for name, series in (('strings', strings), ('packed', ints)):
+        start = time.perf_counter()
+        series.sort_values(ignore_index=True)
+        sort_s = time.perf_counter() - start
+        left = pd.DataFrame({'slot': series, 'x': 1})
+        right = pd.DataFrame({'slot': series.sample(frac=0.5, random_state=0), 'y': 2})
+        start = time.perf_counter()
+        left.merge(right, on='slot')
+        join_s = time.perf_counter() - start
+        print(f"{name:8s} sort {sort_s * 1e3:6.0f} ms, join {join_s * 1e3:6.0f} ms")
+    start = time.perf_counter()
+    round_trip = parse(format(codes), block)
+    print(f"format + parse {time.perf_counter() - start:.2f} s, round trip "
+          f"{'exact' if np.array_equal(round_trip, codes) else 'MISMATCH'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
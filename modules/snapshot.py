@@ -0,0 +1,266 @@
+"""Static snapshot of the whole knowledge base.
+
+Every page is run once through the app (headless, via Streamlit's AppTest
+harness) with all of its lazy sections opened. The rendered element tree is
+written out as one JSON document per page, holding:
+
+- markdown and captions as their source text
+- tables as compact pre-rendered HTML
+- Plotly figures as the same JSON spec the app sends to the browser
+- metrics, alerts, columns and expanders with their layout
+
+Alongside each JSON document is a self-contained HTML page that embeds it
+and renders it in the browser, so the snapshot can be served as plain files
+with no Python running per request:
+
+    python -m modules.snapshot build -o site
+    python -m http.server -d site
+
+Plotly.js is copied into the snapshot from the plotly package. Markdown is
+rendered client-side with marked, loaded from a CDN.
+"""
+import argparse
+import ast
+import html
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import plotly.offline
+
+from modules import catalog, search, sections
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'maritime_101.py'
+MARKED_URL = 'https://cdn.jsdelivr.net/npm/marked@12/marked.min.js'
+ALERTS = ('info', 'success', 'warning', 'error')
+METRIC_DIRECTIONS = {0: 'down', 1: 'up', 2: 'none'}
+
+
+def app_pages():
+    # The page registry (sidebar label -> module) from the app script, read
+    # without running it
+    for node in ast.parse(APP.read_text(encoding='utf-8')).body:
+        if isinstance(node, ast.Assign) and [ast.unparse(t) for t in node.targets] == ['PAGES']:
+            return ast.literal_eval(node.value)
+    raise LookupError(f'No PAGES registry in {APP}')
+
+
+def _table_html(df):
+    keep_index = not (df.index.name is None and df.index.equals(type(df.index)(range(len(df)))))
+    return df.to_html(index=keep_index, border=0, na_rep='', classes='dataframe', escape=True)
+
+
+def _elements(node):
+    # Converts an AppTest element tree node into a list of snapshot elements
+    kind = node.type
+    proto = getattr(node, 'proto', None)
+
+    if kind == 'markdown':
+        if proto.element_type == proto.Type.CAPTION:
+            return [{'type': 'caption', 'body': proto.body}]
+        if proto.element_type == proto.Type.DIVIDER:
+            return [{'type': 'divider'}]
+        return [{'type': 'markdown', 'body': proto.body, 'html': proto.allow_html}]
+    if kind in ALERTS:
+        return [{'type': 'alert', 'format': kind, 'body': proto.body}]
+    if kind == 'metric':
+        return [{'type': 'metric', 'label': proto.label, 'value': proto.body, 'delta': proto.delta,
+                 'direction': METRIC_DIRECTIONS.get(proto.direction, 'none')}]
+    if kind == 'dataframe':
+        return [{'type': 'table', 'html': _table_html(node.value)}]
+    if kind == 'plotly_chart':
+        return [{'type': 'plotly', 'spec': json.loads(proto.spec)}]
+    if kind == 'radio':
+        # The page picker becomes links between the snapshot pages
+        return [{'type': 'nav'}]
+
+    children = [e for child in getattr(node, 'children', {}).values() for e in _elements(child)]
+    if kind == 'expander':
+        if proto.label == sections.EXPANDER_LABEL:
+            # Lazy sections are always open in the snapshot
+            return children
+        return [{'type': 'expander', 'label': proto.label, 'expanded': proto.expanded, 'children': children}]
+    if kind == 'column':
+        return [{'type': 'column', 'weight': proto.weight, 'children': children}]
+    if kind == 'tab':
+        return [{'type': 'tab', 'label': proto.label, 'children': children}]
+    if kind == 'tab_container':
+        return [{'type': 'tabs', 'children': children}]
+    if kind == 'flex_container':
+        row = proto.flex_container.direction == proto.FlexContainer.Direction.HORIZONTAL
+        return [{'type': 'row' if row else 'container', 'children': children}]
+    # Widgets (search box, buttons) and scripts have no static equivalent
+    return children
+
+
+def capture(label, module, timeout=60):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP), default_timeout=timeout)
+    app.session_state['page'] = label
+    for section in search._extract(module):
+        app.session_state[sections.expander_key(f'modules.{module}', section['anchor'])] = True
+    app.run()
+    if app.exception:
+        raise RuntimeError(f'{module}: {app.exception[0].message}')
+    return {
+        'page': module,
+        'title': label,
+        'main': _elements(app.main),
+        'sidebar': _elements(app.sidebar),
+    }
+
+
+def _script_json(data):
+    # Safe to inline in a <script> element
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def render(snapshot, nav):
+    return _TEMPLATE.format(
+        title=html.escape(snapshot['title']),
+        marked=MARKED_URL,
+        page=_script_json(snapshot),
+        nav=_script_json(nav),
+    )
+
+
+def build(out_dir, timeout=60):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / 'plotly.min.js').write_text(plotly.offline.get_plotlyjs(), encoding='utf-8')
+
+    pages = app_pages()
+    nav = [{'title': label, 'href': f'{module}.html'} for label, module in pages.items()]
+    written = []
+    for label, module in pages.items():
+        start = time.perf_counter()
+        snapshot = capture(label, module, timeout)
+        page_json = json.dumps(snapshot, ensure_ascii=False, separators=(',', ':'))
+        (out_dir / f'{module}.json').write_text(page_json, encoding='utf-8')
+        (out_dir / f'{module}.html').write_text(render(snapshot, nav), encoding='utf-8')
+        written.append({'page': module, 'title': label, 'html': f'{module}.html', 'json': f'{module}.json',
+                        'bytes': len(page_json.encode()), 'seconds': round(time.perf_counter() - start, 2)})
+        yield written[-1]
+
+    first = next(iter(pages.values()))
+    (out_dir / 'index.html').write_text(
+        f'<!DOCTYPE html><meta charset="utf-8"><meta http-equiv="refresh" content="0; url={first}.html">'
+        f'<a href="{first}.html">Maritime 101</a>\n', encoding='utf-8')
+    (out_dir / 'snapshot.json').write_text(json.dumps({
+        'built': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'catalog_version': catalog.manifest()['version'],
+        'pages': written,
+    }, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.snapshot', description='Export a static snapshot of every page.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    export = sub.add_parser('build', help='render every page and write HTML/JSON files')
+    export.add_argument('-o', '--output', default='site', help='output directory (default: site)')
+    export.add_argument('--timeout', type=float, default=60, help='per-page render timeout in seconds')
+    args = parser.parse_args(argv)
+
+    # Page deprecation warnings are logged on every run
+    logging.disable(logging.WARNING)
+    for entry in build(args.output, args.timeout):
+        print(f"{entry['page']:24s} {entry['bytes'] / 1024:8.1f} KiB  {entry['seconds']:5.2f} s")
+    print(f'wrote {args.output}/')
+
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · Maritime 101</title>
+<script src="plotly.min.js"></script>
+<script src="{marked}"></script>
+<style>
+body {{ margin: 0; display: flex; font-family: "Source Sans Pro", system-ui, sans-serif; color: #31333F; line-height: 1.6; }}
+aside {{ width: 300px; flex: none; background: #F0F2F6; padding: 1.5rem 1rem; min-height: 100vh; box-sizing: border-box; }}
+main {{ flex: 1; min-width: 0; max-width: 1400px; padding: 2rem 3rem; }}
+.row {{ display: flex; gap: 1rem; }}
+.row > .column {{ min-width: 0; }}
+.caption {{ font-size: 0.875rem; color: rgba(49, 51, 63, 0.6); }}
+.alert {{ padding: 1rem; border-radius: 0.5rem; margin: 0.5rem 0; }}
+.alert.info {{ background: #E8F0FE; }} .alert.success {{ background: #E6F4EA; }}
+.alert.warning {{ background: #FFF8E1; }} .alert.error {{ background: #FDECEA; }}
+.metric {{ margin: 0.5rem 0; }} .metric .label {{ font-size: 0.875rem; }} .metric .value {{ font-size: 2.25rem; }}
+.metric .delta.up {{ color: #09AB3B; }} .metric .delta.down {{ color: #FF2B2B; }}
+table.dataframe {{ border-collapse: collapse; font-size: 0.875rem; margin: 0.5rem 0; overflow-x: auto; display: block; }}
+table.dataframe th, table.dataframe td {{ border: 1px solid #E6E9EF; padding: 0.25rem 0.5rem; text-align: left; }}
+details {{ border: 1px solid #E6E9EF; border-radius: 0.5rem; padding: 0.5rem 1rem; margin: 0.5rem 0; }}
+nav a {{ display: block; padding: 0.25rem 0; color: inherit; text-decoration: none; }}
+nav a.current {{ font-weight: bold; color: #2563EB; }}
+</style>
+</head>
+<body>
+<aside id="sidebar"></aside>
+<main id="main"></main>
+<script type="application/json" id="page">{page}</script>
+<script type="application/json" id="nav">{nav}</script>
+<script>
+const page = JSON.parse(document.getElementById('page').textContent);
+const nav = JSON.parse(document.getElementById('nav').textContent);
+const markdown = text => window.marked ? marked.parse(text) : text.replace(/[&<>]/g, c => ({{'&': '&amp;', '<': '&lt;', '>': '&gt;'}})[c]);
+
+function el(tag, cls, content) {{
+  const node = document.createElement(tag);
+  if (cls) node.className = cls;
+  if (content !== undefined) node.innerHTML = content;
+  return node;
+}}
+
+function render(items, parent) {{
+  for (const item of items) {{
+    let node;
+    switch (item.type) {{
+      case 'markdown': node = el('div', 'markdown', markdown(item.body)); break;
+      case 'caption': node = el('div', 'caption', markdown(item.body)); break;
+      case 'divider': node = el('hr'); break;
+      case 'alert': node = el('div', 'alert ' + item.format, markdown(item.body)); break;
+      case 'table': node = el('div', 'table', item.html); break;
+      case 'metric':
+        node = el('div', 'metric');
+        node.append(el('div', 'label', markdown(item.label)), el('div', 'value'));
+        node.lastChild.textContent = item.value;
+        if (item.delta) {{ node.append(el('div', 'delta ' + item.direction)); node.lastChild.textContent = item.delta; }}
+        break;
+      case 'plotly': node = el('div', 'plotly'); break;
+      case 'nav':
+        node = el('nav');
+        for (const link of nav) {{
+          const a = el('a', link.title === page.title ? 'current' : '');
+          a.href = link.href; a.textContent = link.title; node.append(a);
+        }}
+        break;
+      case 'expander':
+        node = el('details'); node.open = item.expanded;
+        node.append(el('summary', '', markdown(item.label)));
+        render(item.children, node); break;
+      case 'column': node = el('div', 'column'); node.style.flex = item.weight; render(item.children, node); break;
+      case 'row': node = el('div', 'row'); render(item.children, node); break;
+      default: node = el('div', item.type); render(item.children || [], node);
+    }}
+    parent.append(node);
+    if (item.type === 'plotly') Plotly.newPlot(node, item.spec.data, item.spec.layout, {{responsive: true, displaylogo: false}});
+  }}
+}}
+
+render(page.sidebar, document.getElementById('sidebar'));
+render(page.main, document.getElementById('main'));
+if (location.hash) document.getElementById(location.hash.slice(1))?.scrollIntoView();
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
-import plotly.express as px
+
+from modules import (bay_plan, berth_planning, capacity, catalog, crane_split, dispatch_sim, gantt, instrument,
+                     page_cache, port_stay, stowage, yard_allocation, yard_sim)
 
 def show():
     st.markdown('<p class="main-header">🏗️ Terminal Operations & Planning</p>', unsafe_allow_html=True)
@@ -18,7 +21,7 @@ def show():
     # SECTION 1: Container Terminal Layout
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Terminal Layout and Zones</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Terminal Layout and Zones')
     
     st.markdown("""
     A modern container terminal is divided into distinct operational zones, each serving specific functions 
@@ -28,48 +31,7 @@ def show():
     st.markdown('<p class="subsection-header">Terminal Zones Overview</p>', unsafe_allow_html=True)
     
     # Terminal zones
-    terminal_zones = pd.DataFrame({
-        'Zone': [
-            'Berth / Quay',
-            'Apron',
-            'Quay Cranes (QC)',
-            'Storage Yard',
-            'Yard Cranes',
-            'Gate Complex',
-            'Control Tower',
-            'Inland Transportation'
-        ],
-        'Function': [
-            'Where vessels dock; interface between sea and land',
-            'Area directly behind berth for container staging and crane operations',
-            'Load/discharge containers between vessel and apron',
-            'Store containers awaiting pickup or loading; organised in blocks/bays',
-            'Move containers between yard storage and trucks/trains',
-            'Entry/exit point for trucks; documentation and security checks',
-            'Central command centre for terminal operations coordination',
-            'Roads/rail connecting terminal to hinterland'
-        ],
-        'Key Equipment': [
-            'Bollards, fenders, vessel-to-shore connections',
-            'Prime movers, automated guided vehicles (AGVs)',
-            'Ship-to-shore cranes, dual trolley systems',
-            'Rubber-tyred gantry cranes (RTG), rail-mounted gantry (RMG)',
-            'RTG, RMG, reach stackers, straddle carriers',
-            'Optical character recognition (OCR), automated gates',
-            'IT systems, communications, CCTV, vessel traffic management',
-            'Trucks, trains, road/rail infrastructure'
-        ],
-        'Typical Dimensions': [
-            '300-450m length × 50-70m width per berth',
-            '50-100m depth behind quay',
-            '60-80m outreach for mega vessels',
-            '10-30 hectares per terminal',
-            '6-8 containers high stacking',
-            'Multiple lanes, 20-40 gates',
-            'Central location with 360° visibility',
-            'Road/rail corridors'
-        ]
-    })
+    terminal_zones = catalog.load('terminal_operations/terminal_zones')
     
     st.dataframe(terminal_zones, width='stretch', hide_index=True)
     
@@ -116,7 +78,7 @@ def show():
     # SECTION 2: Container Terminal Operations Process Flow
     # ============================================================================
     
-    st.markdown('<p class="section-header">Container Terminal Operations: Complete Process</p>', unsafe_allow_html=True)
+    instrument.section_header('Container Terminal Operations: Complete Process')
     
     st.markdown("""
     Container terminal operations follow a structured workflow from vessel notification to departure. 
@@ -225,56 +187,58 @@ def show():
     """)
     
     # Vessel operation timeline
-    operation_timeline = pd.DataFrame({
-        'Phase': ['Arrival & Mooring', 'Pre-Operations', 'Discharge', 'Loading', 'Post-Operations', 'Departure'],
-        'Duration (hours)': [1.5, 1.0, 8.0, 10.0, 1.0, 0.5],
-        'Activities': [
-            'Pilot boards, tugboat assist, vessel moors, gangway',
-            'Safety check, lashing/unlashing prep, hatch covers',
-            '1,000 import containers discharged',
-            '1,200 export containers loaded',
-            'Hatch covers closed, final checks, paperwork',
-            'Lines released, tugboat assist, vessel departs'
-        ]
-    })
+    operation_timeline = catalog.load('terminal_operations/operation_timeline')
     
     # Timeline visualization
-    fig = go.Figure()
-    
-    cumulative_time = [0]
-    for duration in operation_timeline['Duration (hours)']:
-        cumulative_time.append(cumulative_time[-1] + duration)
-    
-    for i in range(len(operation_timeline)):
-        fig.add_trace(go.Scatter(
-            x=[cumulative_time[i], cumulative_time[i+1]],
-            y=[operation_timeline['Phase'][i], operation_timeline['Phase'][i]],
-            mode='lines+markers',
-            line=dict(width=20, color=['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4'][i]),
-            marker=dict(size=10),
-            name=operation_timeline['Phase'][i],
-            hovertemplate=f"<b>{operation_timeline['Phase'][i]}</b><br>" +
-                         f"Duration: {operation_timeline['Duration (hours)'][i]} hours<br>" +
-                         f"{operation_timeline['Activities'][i]}<extra></extra>"
-        ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Typical Vessel Operations Timeline (22 hours total)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Elapsed Time (hours)",
-        yaxis_title="",
-        height=400,
-        showlegend=False,
-        xaxis=dict(range=[0, 22], gridcolor='#E5E7EB'),
-        plot_bgcolor='white'
-    )
+    def build_operation_timeline_chart():
+        fig = go.Figure()
+        
+        cumulative_time = [0]
+        for duration in operation_timeline['Duration (hours)']:
+            cumulative_time.append(cumulative_time[-1] + duration)
+        
+        for i in range(len(operation_timeline)):
+            fig.add_trace(go.Scatter(
+                x=[cumulative_time[i], cumulative_time[i+1]],
+                y=[operation_timeline['Phase'][i], operation_timeline['Phase'][i]],
+                mode='lines+markers',
+                line=dict(width=20, color=['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4'][i]),
+                marker=dict(size=10),
+                name=operation_timeline['Phase'][i],
+                hovertemplate=f"<b>{operation_timeline['Phase'][i]}</b><br>" +
+                             f"Duration: {operation_timeline['Duration (hours)'][i]} hours<br>" +
+                             f"{operation_timeline['Activities'][i]}<extra></extra>"
+            ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Typical Vessel Operations Timeline (22 hours total)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Elapsed Time (hours)",
+            yaxis_title="",
+            height=400,
+            showlegend=False,
+            xaxis=dict(range=[0, 22], gridcolor='#E5E7EB'),
+            plot_bgcolor='white'
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'operation_timeline_chart', build_operation_timeline_chart, deps=(operation_timeline,))
     
     st.plotly_chart(fig, width='stretch')
     
+    st.markdown("""
+    **How long will the stay really be?** The 22 hours above is a typical call, and no two calls are alike. 
+    Pilots are sometimes late, crane cycles vary, prime movers queue, cranes break down, and the crane with 
+    the most moves sets the finish. The chart below simulates the same call hundreds of times. Terminals commit 
+    to a port stay from a high percentile of the results, such as P90, rather than the average.
+    """)
+    
+    port_stay_distribution()
+    
     st.markdown("""
     <div class="success-box">
     <strong>💡 Target Performance:</strong><br>
@@ -290,7 +254,7 @@ def show():
     # SECTION 3: Detailed Planning Processes
     # ============================================================================
     
-    st.markdown('<p class="section-header">The Four Key Planning Processes</p>', unsafe_allow_html=True)
+    instrument.section_header('The Four Key Planning Processes')
     
     st.markdown("""
     Container terminal planning involves four interconnected optimisation problems that must be solved 
@@ -333,52 +297,18 @@ def show():
     - Singapore consistently achieves >90% BOA
     """)
     
-    # Berth planning visualization
-    berth_plan = pd.DataFrame({
-        'Berth': ['Berth 1', 'Berth 1', 'Berth 2', 'Berth 2', 'Berth 3', 'Berth 3', 'Berth 4'],
-        'Vessel': ['Vessel A', 'Vessel D', 'Vessel B', 'Vessel E', 'Vessel C', 'Vessel F', 'Vessel G'],
-        'Start': [0, 20, 2, 24, 5, 28, 10],
-        'Duration': [20, 22, 22, 20, 23, 19, 26],
-        'TEU': [8000, 9000, 7500, 8500, 8200, 7800, 9500]
-    })
-    
-    fig = go.Figure()
-    
-    colors = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4', '#EC4899']
-    
-    for i, row in berth_plan.iterrows():
-        fig.add_trace(go.Bar(
-            name=row['Vessel'],
-            x=[row['Duration']],
-            y=[row['Berth']],
-            orientation='h',
-            marker=dict(color=colors[i % len(colors)]),
-            text=f"{row['Vessel']}<br>{row['TEU']} TEU<br>{row['Duration']}h",
-            textposition='inside',
-            base=row['Start'],
-            hovertemplate=f"<b>{row['Vessel']}</b><br>" +
-                         f"Berth: {row['Berth']}<br>" +
-                         f"Start: {row['Start']}h<br>" +
-                         f"Duration: {row['Duration']}h<br>" +
-                         f"TEU: {row['TEU']}<extra></extra>"
-        ))
+    # Berth planning visualization: the solver's plan, with a what-if slip
+    berth_calls = catalog.load('terminal_operations/berth_calls')
+    berths = catalog.load('terminal_operations/berths')
+    berth_plan_what_if(berth_calls, berths)
     
-    fig.update_layout(
-        title={
-            'text': 'Berth Allocation Plan (48-hour window)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Time (hours)",
-        barmode='overlay',
-        height=400,
-        showlegend=False,
-        xaxis=dict(range=[0, 48], gridcolor='#E5E7EB'),
-        plot_bgcolor='white'
-    )
+    st.markdown("""
+    A real berth plan is much larger than this example. The chart below is the same solver on a synthetic 
+    quarter: twenty berths and two thousand calls. Zoomed out, calls that sit closer together than the 
+    chart can draw are merged into blocks of berth occupancy; narrow the window to see individual vessels.
+    """)
     
-    st.plotly_chart(fig, width='stretch')
+    berth_quarter_view()
     
     st.markdown('<p class="subsection-header">2. Storage Yard Planning</p>', unsafe_allow_html=True)
     
@@ -429,6 +359,15 @@ def show():
     - **Re-handles**: Sometimes unavoidable when container arrival sequence doesn't match departure sequence
     """)
     
+    st.markdown("""
+    **Allocation in practice:** Every discharged container needs a slot decision within seconds. The map 
+    below shows one block after a 1,500-box discharge has been allocated by these rules. Each destination has 
+    its own stacks, heavy boxes sit at the bottom, reefers are on the plugged bays at the far end, and dangerous 
+    goods are in the DG block.
+    """)
+    
+    yard_allocation_map()
+    
     st.markdown("""
     <div class="warning-box">
     <strong>⚠️ The Re-Handle Problem:</strong><br><br>
@@ -444,6 +383,15 @@ def show():
     </div>
     """, unsafe_allow_html=True)
     
+    st.markdown("""
+    **How much does the stacking policy matter?** The simulation below replays a few weeks of import and 
+    export boxes through one 40-bay, 6-row, 5-tier block and counts the re-handles under three policies: 
+    stacking at random, grouping by vessel, and stacking by predicted pickup time (import pickups are only 
+    known roughly, as in practice).
+    """)
+    
+    yard_rehandle_comparison()
+    
     st.markdown('<p class="subsection-header">3. Vessel Stowage Planning</p>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -530,72 +478,57 @@ def show():
     Looking at vessel from stern (back) toward bow (front), showing one bay:
     """)
     
-    bay_plan_data = []
-    # Create a sample bay plan
-    for tier in range(1, 7):  # 6 tiers high
-        for row in range(1, 9):  # 8 rows across
-            # Colour code by destination
-            if tier <= 2:
-                dest = 'Port 3 (Last)'
-                color = '#EF4444'
-            elif tier <= 4:
-                dest = 'Port 2'
-                color = '#F59E0B'
-            else:
-                dest = 'Port 1 (First)'
-                color = '#10B981'
-            
-            if row <= 4:
-                side = 'Port'
-            else:
-                side = 'Starboard'
-            
-            bay_plan_data.append({
-                'Row': row,
-                'Tier': tier,
-                'Destination': dest,
-                'Color': color,
-                'Side': side
-            })
-    
-    bay_df = pd.DataFrame(bay_plan_data)
-    
-    fig = go.Figure(data=go.Scatter(
-        x=bay_df['Row'],
-        y=bay_df['Tier'],
-        mode='markers',
-        marker=dict(
-            size=30,
-            color=bay_df['Color'],
-            line=dict(color='#1F2937', width=2),
-            symbol='square'
-        ),
-        text=bay_df['Destination'],
-        hovertemplate='Row: %{x}<br>Tier: %{y}<br>%{text}<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Bay Plan Example: Stacking by Destination Port',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Row (Port ← → Starboard)",
-        yaxis_title="Tier (Bottom → Top)",
-        height=400,
-        xaxis=dict(tickmode='linear', tick0=1, dtick=1, gridcolor='#E5E7EB'),
-        yaxis=dict(tickmode='linear', tick0=1, dtick=1, gridcolor='#E5E7EB'),
-        plot_bgcolor='white',
-        annotations=[
-            dict(x=2, y=6.5, text='Port 1 (First discharge)', showarrow=False, font=dict(color='#10B981', size=12)),
-            dict(x=6, y=4, text='Port 2', showarrow=False, font=dict(color='#F59E0B', size=12)),
-            dict(x=6, y=1.5, text='Port 3 (Last discharge)', showarrow=False, font=dict(color='#EF4444', size=12))
-        ]
-    )
+    def build_bay_plan_chart():
+        # One bay, 8 rows x 6 tiers, stowed in thirds by discharge port
+        example = bay_plan.generate(np.ones((1, 8, 6), dtype=bool), ['Port 1 (First)', 'Port 2', 'Port 3 (Last)'],
+                                    fill=1, hold_tiers=0)
+        fig = bay_plan.bay_figure(example, bay=0)
+        fig.update_traces(xgap=4, ygap=4, selector=dict(type='heatmap'))
+        
+        fig.update_layout(
+            title={
+                'text': 'Bay Plan Example: Stacking by Destination Port',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=400,
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'bay_plan_chart', build_bay_plan_chart)
     
     st.plotly_chart(fig, width='stretch')
     
+    st.markdown("""
+    A real plan covers the whole vessel. A 24,000 TEU ship has 24 rows across, 22 tiers from the bottom of the hold 
+    to the top of the deck stacks, and 58 twenty-foot bays numbered 01 to 115 from the bow. The bays narrow 
+    towards bow and stern. Pick any bay of the generated plan below. Tiers 02-22 are in the hold and 82 upwards 
+    are on deck.
+    """)
+    
+    vessel_bay_plan()
+    
+    st.markdown("""
+    **Stability while loading:** A stowage planner checks every move. Each container changes the ship's 
+    centre of gravity, so GM, trim and list are updated as it is placed, and it goes where they stay within limits. 
+    The chart follows a synthetic load list for five discharge ports. It is loaded last port first and 
+    heaviest first, and no move is allowed to take GM below 1.5 m.
+    """)
+    
+    stowage_stability()
+    
+    st.markdown("""
+    **Crane work lists:** The last step of vessel planning splits the bays between the quay cranes. Cranes share 
+    one rail, so each crane works a run of neighbouring bays and all of them move the same way along the ship. 
+    They must also stay at least a bay apart. A crane that catches up with the one ahead has to wait. A bay where 
+    two runs meet can be shared: one crane discharges it first, and the other finishes it later. The vessel 
+    leaves when the busiest crane finishes, so a good split keeps every crane's finish time close to the 
+    theoretical best.
+    """)
+    
+    crane_work_lists()
+    
     st.markdown('<p class="subsection-header">4. Transportation Planning (Equipment Scheduling)</p>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -649,21 +582,25 @@ def show():
     """)
     
     # Equipment productivity comparison
-    equipment_productivity = pd.DataFrame({
-        'Equipment Type': ['Quay Crane', 'Yard Crane (RTG)', 'Prime Mover', 'AGV', 'Gate Transaction'],
-        'Unit': ['Moves/hour', 'Moves/hour', 'Cycles/hour', 'Cycles/hour', 'Transactions/hour'],
-        'Traditional System': [25, 15, 4, 0, 20],
-        'Modern Automated': [35, 25, 0, 10, 40],
-        'World-Class Target': [40, 30, 5, 12, 50]
-    })
+    equipment_productivity = catalog.load('terminal_operations/equipment_productivity')
     
     st.dataframe(equipment_productivity, width='stretch', hide_index=True)
     
+    st.markdown("""
+    **Fixed or pooled?** The simulation below runs one 8-hour shift of six quay cranes (1,680 moves) under each 
+    dispatching strategy, for fleets of different sizes. A pooled vehicle takes whichever job, on any crane, is 
+    closest to holding its crane up, and it often picks up an export box at the block where it has just dropped 
+    an import. Crane waiting time is what the vessel feels, and it falls steeply with the first vehicles added and 
+    slowly after that.
+    """)
+    
+    transport_dispatch_comparison()
+    
     # ============================================================================
     # SECTION 4: Terminal Capacity Planning
     # ============================================================================
     
-    st.markdown('<p class="section-header">Terminal Capacity Planning</p>', unsafe_allow_html=True)
+    instrument.section_header('Terminal Capacity Planning')
     
     st.markdown("""
     Terminal capacity is determined by multiple bottleneck resources. Understanding these bottlenecks is 
@@ -673,69 +610,54 @@ def show():
     st.markdown('<p class="subsection-header">Key Capacity Components</p>', unsafe_allow_html=True)
     
     # Capacity components
-    capacity_components = pd.DataFrame({
-        'Component': [
-            'Berth Capacity',
-            'Quay Crane Capacity',
-            'Yard Storage Capacity',
-            'Yard Crane Capacity',
-            'Horizontal Transport',
-            'Gate Capacity',
-            'Marine Channel'
-        ],
-        'Formula / Calculation': [
-            'Berth length × Utilisation × Vessel calls per year × TEU per call',
-            'Number of cranes × Moves per hour × Operating hours per year',
-            'Yard area × Ground slots × Stacking height × Turnover rate',
-            'Number of YCs × Moves per hour × Operating hours per year',
-            'Fleet size × Cycles per hour × Operating hours × Containers per cycle',
-            'Number of lanes × Transactions per hour × Operating hours',
-            'Channel depth × Width × Tidal windows × Vessel traffic capacity'
-        ],
-        'Typical Bottleneck?': [
-            'Often - Determines vessel capacity',
-            'Yes - Drives vessel turnaround time',
-            'Sometimes - When high dwell time',
-            'Sometimes - Can limit throughput',
-            'Rarely - Usually adequate if planned',
-            'Sometimes - Peak hour congestion',
-            'Rarely - Usually adequate'
-        ],
-        'Expansion Strategy': [
-            'Build additional berths (very expensive, long lead time)',
-            'Add more cranes; improve crane productivity',
-            'Increase stacking height; reduce dwell time; better yard planning',
-            'Add more yard cranes; improve scheduling',
-            'Add more PMs/AGVs; improve dispatching',
-            'Add more lanes; automate; off-peak incentives',
-            'Dredging for deeper channel; widening; traffic management'
-        ]
-    })
+    capacity_components = catalog.load('terminal_operations/capacity_components')
     
     st.dataframe(capacity_components, width='stretch', hide_index=True)
     
-    st.markdown("""
+    # Worked example for the berths, computed from the capacity module's base terminal
+    example = capacity.BASE
+    example_teu = capacity.berth(example)
+    berth_hours = example['berths'] * capacity.HOURS_PER_YEAR
+    calls = berth_hours * example['utilisation'] / example['turnaround_h']
+    sensitivity = "\n".join(
+        f"    - {scenario}: {capacity.berth({**example, **change}) / example_teu - 1:+.0%} capacity "
+        f"({capacity.berth({**example, **change}) / 1e6:.1f}M TEU)"
+        for scenario, change in (
+            ("If vessel turnaround improves to 20 hours", dict(turnaround_h=20.0)),
+            ("If berth utilisation increases to 80%", dict(utilisation=0.8)),
+            ("If average vessel grows to 5,000 TEU moves", dict(teu_per_call=5000.0)),
+        )
+    )
+    
+    st.markdown(f"""
     **Capacity Calculation Example:**
     
     **Given:**
-    - 10 berths, each 400m long
-    - Average vessel: 350m long, 2,000 TEU discharged + 2,000 TEU loaded = 4,000 TEU total moves
-    - Berth utilisation target: 70% (to allow flexibility and maintenance)
-    - Average vessel turnaround: 24 hours
+    - {example['berths']} berths, each 400m long
+    - Average vessel: 350m long, 2,000 TEU discharged + 2,000 TEU loaded = {example['teu_per_call']:,.0f} TEU total moves
+    - Berth utilisation target: {example['utilisation']:.0%} (to allow flexibility and maintenance)
+    - Average vessel turnaround: {example['turnaround_h']:.0f} hours
     - 365 days per year
     
     **Calculation:**
-    - Available berth-hours per year: 10 berths × 365 days × 24 hours = 87,600 berth-hours
-    - Actual operational berth-hours: 87,600 × 70% = 61,320 berth-hours
-    - Vessel calls possible: 61,320 / 24 hours per vessel = 2,555 vessel calls per year
-    - Annual capacity: 2,555 vessels × 4,000 TEU per vessel = **10.2 million TEU per year**
+    - Available berth-hours per year: {example['berths']} berths × 365 days × 24 hours = {berth_hours:,} berth-hours
+    - Actual operational berth-hours: {berth_hours:,} × {example['utilisation']:.0%} = {berth_hours * example['utilisation']:,.0f} berth-hours
+    - Vessel calls possible: {berth_hours * example['utilisation']:,.0f} / {example['turnaround_h']:.0f} hours per vessel = {calls:,.0f} vessel calls per year
+    - Annual capacity: {calls:,.0f} vessels × {example['teu_per_call']:,.0f} TEU per vessel = **{example_teu / 1e6:.1f} million TEU per year**
     
     **Sensitivity:**
-    - If vessel turnaround improves to 20 hours: +20% capacity (12.2M TEU)
-    - If berth utilisation increases to 80%: +14% capacity (11.6M TEU)
-    - If average vessel grows to 5,000 TEU moves: +25% capacity (12.8M TEU)
+{sensitivity}
+    """)
+    
+    st.markdown("""
+    **All seven components together:** The berths are only one limit. The explorer below evaluates every formula 
+    in the table for the same terminal, and the smallest result is the terminal's capacity. The tornado chart moves 
+    one assumption at a time between a low and a high value. The heatmap sweeps two assumptions at once and 
+    outlines where the bottleneck moves to another component.
     """)
     
+    capacity_explorer()
+    
     st.markdown("""
     <div class="insight-box">
     <strong>🎯 Capacity Optimisation Strategies:</strong><br><br>
@@ -755,7 +677,7 @@ def show():
     # SECTION 5: TOS - Terminal Operating System
     # ============================================================================
     
-    st.markdown('<p class="section-header">Terminal Operating System (TOS)</p>', unsafe_allow_html=True)
+    instrument.section_header('Terminal Operating System (TOS)')
     
     st.markdown("""
     Modern container terminals rely on sophisticated **Terminal Operating Systems (TOS)** to plan and 
@@ -765,41 +687,7 @@ def show():
     st.markdown('<p class="subsection-header">TOS Core Modules</p>', unsafe_allow_html=True)
     
     # TOS modules
-    tos_modules = pd.DataFrame({
-        'TOS Module': [
-            'Berth Planning',
-            'Vessel Planning',
-            'Yard Planning',
-            'Resource Planning',
-            'Equipment Control',
-            'Gate Operations',
-            'Documentation',
-            'Billing & Invoicing',
-            'Reporting & Analytics'
-        ],
-        'Functions': [
-            'Allocate vessels to berths and time windows; optimise BOA',
-            'Generate discharge and loading plans; stowage coordination',
-            'Allocate yard locations; minimise re-handles; manage inventory',
-            'Schedule cranes, PMs, AGVs, yard cranes; optimise utilisation',
-            'Real-time dispatching of equipment; track positions; performance monitoring',
-            'Truck check-in/out; documentation verification; container matching',
-            'Generate shipping instructions, delivery orders, customs documentation',
-            'Track container movements for billing; generate invoices',
-            'Performance dashboards; KPI tracking; historical analysis'
-        ],
-        'Key Outputs': [
-            'Berth allocation plan, vessel schedule',
-            'Bay plans, crane work lists, loading sequences',
-            'Yard block plans, container locations, retrieval lists',
-            'Equipment assignments, work schedules',
-            'Real-time work orders, route optimisation',
-            'Gate permits, truck appointments, container releases',
-            'eBL, customs declarations, manifests',
-            'Invoices, payment tracking',
-            'Performance reports, bottleneck analysis'
-        ]
-    })
+    tos_modules = catalog.load('terminal_operations/tos_modules')
     
     st.dataframe(tos_modules, width='stretch', hide_index=True)
     
@@ -847,7 +735,7 @@ def show():
     # SECTION 6: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -913,3 +801,458 @@ def show():
     **Next Topic:** 🤖 Equipment, Automation & CITOS - Deep dive into terminal equipment types, automation 
     technologies, and PSA's CITOS terminal operating system.
     """)
+
+
+@st.fragment
+def transport_dispatch_comparison():
+    fleet = st.slider("Fleet size (vehicles)", 12, 48, 30, step=6, key='dispatch_fleet')
+
+    def build_dispatch_results():
+        return dispatch_sim.compare(dispatch_sim.shift_jobs(cranes=6, hours=8), fleets=range(12, 49, 6))
+
+    results = page_cache.table(__name__, 'dispatch_policies', build_dispatch_results)
+    labels = {'fixed': "Fixed", 'hybrid': "Hybrid", 'pooled': "Pooled"}
+
+    def build_dispatch_chart():
+        fig = go.Figure()
+        for (policy, label), color in zip(labels.items(), ['#EF4444', '#F59E0B', '#10B981']):
+            runs = results[results['policy'] == policy]
+            fig.add_trace(go.Scatter(
+                x=runs['fleet'], y=runs['qc_wait_pct'], mode='lines+markers', name=label,
+                line=dict(color=color, width=3), customdata=runs[['utilisation_pct', 'empty_travel_pct']],
+                hovertemplate=f'<b>{label}</b><br>Fleet: %{{x}}<br>Crane waiting: %{{y:.1f}}%<br>'
+                              'Fleet utilisation: %{customdata[0]:.0f}%<br>'
+                              'Empty travel: %{customdata[1]:.0f}%<extra></extra>',
+            ))
+        fig.add_vline(x=fleet, line_dash='dash', line_color='#6B7280')
+        fig.update_layout(
+            title={
+                'text': 'Quay Crane Waiting Time by Fleet Size',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Prime movers / AGVs",
+            yaxis_title="Crane time spent waiting (%)",
+            height=400,
+            xaxis_gridcolor='#E5E7EB',
+            yaxis_gridcolor='#E5E7EB',
+            plot_bgcolor='white',
+            legend=dict(orientation='h', y=-0.2),
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'dispatch_chart', build_dispatch_chart, deps=(results, fleet))
+    st.plotly_chart(fig, width='stretch')
+
+    chosen = results[results['fleet'] == fleet].set_index('policy')
+    for col, (policy, label) in zip(st.columns(3), labels.items()):
+        wait = chosen.at[policy, 'qc_wait_h']
+        delta = wait - chosen.at['fixed', 'qc_wait_h']
+        col.metric(f"{label}: crane hours waiting", f"{wait:.1f}",
+                   f"{delta:+.1f} vs fixed" if policy != 'fixed' else None, delta_color='inverse')
+    st.caption(f"With {fleet} vehicles, fleet utilisation is {chosen['utilisation_pct'].min():.0f}-"
+               f"{chosen['utilisation_pct'].max():.0f}% and empty travel falls from "
+               f"{chosen.at['fixed', 'empty_travel_pct']:.0f}% (fixed) to {chosen.at['pooled', 'empty_travel_pct']:.0f}% "
+               "(pooled). Hybrid keeps half the fleet on fixed cranes.")
+
+
+@st.fragment
+def capacity_explorer():
+    base = capacity.evaluate()
+    col1, col2 = st.columns(2)
+    col1.metric("Terminal Capacity", f"{float(base.capacity) / 1e6:.1f}M TEU per year")
+    col2.metric("Bottleneck", str(base.bottleneck_name))
+
+    swings = page_cache.table(__name__, 'capacity_tornado', capacity.tornado)
+
+    def build_tornado_chart():
+        fig = capacity.tornado_figure(swings)
+        fig.update_layout(
+            title={
+                'text': 'What Moves Terminal Capacity',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=500,
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'capacity_tornado_chart', build_tornado_chart, deps=(swings,))
+    st.plotly_chart(fig, width='stretch')
+
+    options = list(capacity.RANGES)
+    col1, col2 = st.columns(2)
+    x = col1.selectbox("Across", options, index=options.index('turnaround_h'),
+                       format_func=capacity.LABELS.get, key='capacity_heatmap_x')
+    y = col2.selectbox("Up", options, index=options.index('utilisation'),
+                       format_func=capacity.LABELS.get, key='capacity_heatmap_y')
+    if x == y:
+        st.info("Choose two different assumptions to sweep.")
+        return
+
+    def build_capacity_heatmap():
+        grid = capacity.sweep(**{name: np.linspace(*sorted(capacity.RANGES[name]), 60) for name in (y, x)})
+        fig = capacity.heatmap_figure(grid)
+        fig.update_layout(
+            title={
+                'text': f'Terminal Capacity by {capacity.LABELS[x]} and {capacity.LABELS[y]}',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=450,
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'capacity_heatmap', build_capacity_heatmap, deps=(x, y))
+    st.plotly_chart(fig, width='stretch')
+    st.caption("Other assumptions stay at the worked example's values. Hover for the binding component.")
+
+
+@st.fragment
+def port_stay_distribution():
+    col1, col2 = st.columns(2)
+    cranes = col1.select_slider("Quay cranes", [3, 4, 5, 6], value=4, key='port_stay_cranes')
+    movers = col2.slider("Prime movers", 8, 32, 20, step=4, key='port_stay_movers')
+
+    # In process and a modest sample: about a second per setting, where a
+    # process pool costs more to start than the runs take. The CLI runs more.
+    runs = page_cache.table(__name__, f'port_stay_{cranes}_{movers}',
+                            lambda: port_stay.replicate(100, workers=1, cranes=cranes, prime_movers=movers))
+    turnaround = runs['Turnaround']
+    marks = {'P50': turnaround.quantile(0.5), 'P90': turnaround.quantile(0.9), 'P95': turnaround.quantile(0.95)}
+
+    def build_port_stay_chart():
+        fig = go.Figure(go.Histogram(
+            x=turnaround, nbinsx=40, marker_color='#3B82F6', opacity=0.8,
+            hovertemplate='%{x} hours<br>%{y} calls<extra></extra>',
+        ))
+        for (label, hours), color in zip(marks.items(), ['#10B981', '#F59E0B', '#EF4444']):
+            fig.add_vline(x=hours, line_dash='dash', line_color=color,
+                          annotation_text=f'{label} {hours:.1f}h', annotation_position='top')
+        fig.update_layout(
+            title={
+                'text': f'Simulated Port Stay: {cranes} Cranes, {movers} Prime Movers ({len(runs)} Calls)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Turnaround (hours)",
+            yaxis_title="Calls",
+            height=400,
+            bargap=0.05,
+            xaxis_gridcolor='#E5E7EB',
+            yaxis_gridcolor='#E5E7EB',
+            plot_bgcolor='white',
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'port_stay_chart', build_port_stay_chart, deps=(runs,))
+    st.plotly_chart(fig, width='stretch')
+
+    col1, col2, col3, col4 = st.columns(4)
+    for col, (label, hours) in zip((col1, col2, col3), marks.items()):
+        col.metric(f"{label} Port Stay", f"{hours:.1f} h")
+    col4.metric("Crane Hours Waiting for Prime Movers", f"{runs['Crane Wait'].mean():.1f}")
+    st.dataframe(port_stay.percentiles(runs).rename_axis('Phase (hours)').reset_index(), width='stretch',
+                 hide_index=True)
+
+
+@st.fragment
+def berth_plan_what_if(berth_calls, berths):
+    col1, col2 = st.columns(2)
+    with col1:
+        slipped = st.selectbox("What if this vessel arrives late?", berth_calls['Vessel'], key='berth_slip_vessel')
+    with col2:
+        delay = st.slider("Delay (hours)", 0, 12, 0, key='berth_slip_delay')
+
+    plan = berth_planning.solve(berth_calls, berths)
+    moved = []
+    if delay:
+        eta = float(berth_calls.loc[berth_calls['Vessel'] == slipped, 'ETA'].iloc[0])
+        moved = plan.slip(slipped, eta + delay)
+    berth_plan = plan.table().merge(berth_calls[['Vessel', 'TEU']], on='Vessel')
+    summary = plan.summary()
+
+    def build_berth_plan_chart():
+        fig = gantt.figure(
+            berth_plan, lane='Berth', start='Start', duration='Hours', wait='Wait', window=(0, 48),
+            text='{Vessel}<br>{TEU} TEU<br>{Hours:.0f}h',
+            hover='<b>{Vessel}</b><br>Berth: {Berth}<br>Arrived: {ETA:.1f}h<br>Start: {Start:.1f}h<br>'
+                  'Duration: {Hours:.1f}h<br>Moves: {Moves}<br>TEU: {TEU}',
+        )
+        
+        fig.update_layout(
+            title={
+                'text': 'Berth Allocation Plan (48-hour window)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Time (hours)",
+            height=400,
+            xaxis_gridcolor='#E5E7EB',
+            plot_bgcolor='white'
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'berth_plan_chart', build_berth_plan_chart,
+                            deps=(berth_calls, berths, slipped, delay))
+    
+    st.plotly_chart(fig, width='stretch')
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Berth on Arrival", f"{summary['boa_pct']:.0f}%")
+    col2.metric("Average Wait", f"{summary['mean_wait_h']:.1f} h")
+    col3.metric("Longest Wait", f"{summary['max_wait_h']:.1f} h")
+    if moved:
+        st.caption(f"Re-planned: {', '.join(moved)}. Every other vessel keeps its berth and window.")
+
+
+@st.fragment
+def vessel_bay_plan():
+    ports = ['Singapore', 'Colombo', 'Jeddah', 'Rotterdam', 'Hamburg']
+    slots = bay_plan.vessel_slots()
+    labels = list(bay_plan.BayPlan(slots, ports).bay_labels())
+    col1, col2 = st.columns(2)
+    with col1:
+        label = st.selectbox("Bay", labels, index=len(labels) // 2, key='vessel_bay_plan_bay')
+    with col2:
+        color_by = st.selectbox("Colour by", ['Discharge port', 'Weight'], key='vessel_bay_plan_colour')
+    bay = labels.index(label)
+
+    def build_port_totals():
+        plan = bay_plan.generate(slots, ports)
+        return pd.DataFrame({'Port': ports, 'TEU': list(plan.teu_by_port().values())})
+
+    def build_vessel_bay_chart():
+        plan = bay_plan.generate(slots, ports)
+        fig = bay_plan.bay_figure(plan, bay, 'pod' if color_by == 'Discharge port' else 'weight')
+        fig.update_layout(
+            title={
+                'text': f'Bay {label} of a 24,000 TEU Vessel ({int(plan.occupied[bay].sum())} TEU in this bay)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            height=560,
+        )
+        return fig
+
+    port_totals = page_cache.table(__name__, 'vessel_bay_plan_ports', build_port_totals)
+    fig = page_cache.figure(__name__, 'vessel_bay_plan_chart', build_vessel_bay_chart, deps=(bay, color_by))
+    st.plotly_chart(fig, width='stretch')
+    st.caption(f"Whole vessel: {port_totals['TEU'].sum():,} TEU on board of {int(slots.sum()):,} slots, "
+               + ", ".join(f"{row.Port} {row.TEU:,}" for row in port_totals.itertuples()) + ".")
+
+
+@st.fragment
+def stowage_stability():
+    moves = st.select_slider("Load list (moves)", [2000, 6000, 10000, 14000], value=2000, key='stowage_moves')
+
+    def build_history():
+        result = stowage.Planner().plan(stowage.synthetic_load_list(moves))
+        history = result.history.iloc[::max(moves // 500, 1)].assign(Unplaced=len(result.unplaced))
+        return history
+
+    history = page_cache.table(__name__, f'stowage_history_{moves}', build_history)
+
+    def build_stability_chart():
+        fig = go.Figure()
+        for column, color, unit in (('GM', '#3B82F6', 'm'), ('Trim', '#F59E0B', 'm'), ('List', '#EF4444', '°')):
+            fig.add_trace(go.Scatter(
+                x=history['Move'], y=history[column], mode='lines', name=f'{column} ({unit})',
+                line=dict(color=color, width=2),
+                hovertemplate=f'Move %{{x}}<br>{column}: %{{y:.2f}} {unit}<extra></extra>',
+            ))
+        fig.add_hline(y=stowage.GM_MIN_M, line_dash='dash', line_color='#6B7280',
+                      annotation_text='Minimum GM', annotation_position='bottom right')
+        fig.update_layout(
+            title={
+                'text': 'Stability During Loading',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Containers loaded",
+            yaxis_title="Metres / degrees",
+            height=400,
+            xaxis_gridcolor='#E5E7EB',
+            yaxis_gridcolor='#E5E7EB',
+            plot_bgcolor='white',
+            legend=dict(orientation='h', y=-0.2),
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'stowage_stability_chart', build_stability_chart, deps=(history,))
+    st.plotly_chart(fig, width='stretch')
+
+    final = history.iloc[-1]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Final GM", f"{final['GM']:.2f} m")
+    col2.metric("Final Trim", f"{final['Trim']:+.2f} m")
+    col3.metric("Draft", f"{final['Draft']:.1f} m")
+    col4.metric("Shut Out", f"{int(final['Unplaced']):,}")
+
+
+@st.fragment
+def crane_work_lists():
+    cranes = st.select_slider("Quay cranes on the vessel", [4, 5, 6, 7, 8], value=6, key='crane_split_cranes')
+
+    workload = page_cache.table(__name__, 'crane_split_workload', lambda: crane_split.vessel_workload(24, 6000))
+    plan = crane_split.split(workload, cranes)
+    worklists = plan.worklists
+
+    def build_crane_split_chart():
+        # Bay against time: one path per crane, which never cross
+        fig = go.Figure()
+        order = workload['Bay'].tolist()
+        for crane, tasks in worklists.groupby('Crane'):
+            color = gantt.PALETTE[(crane - 1) % len(gantt.PALETTE)]
+            x = np.repeat(tasks['Bay'].to_numpy(), 2)
+            y = np.c_[tasks['Start'], tasks['End']].ravel()
+            fig.add_trace(go.Scatter(
+                x=x, y=y, mode='lines', name=f'QC {crane}', line=dict(color=color, width=6),
+                customdata=np.repeat(tasks[['Operation', 'Moves']].to_numpy(), 2, axis=0),
+                hovertemplate=f'<b>QC {crane}</b><br>Bay %{{x}}: %{{customdata[0]}}<br>'
+                              '%{customdata[1]} moves, at %{y:.1f}h<extra></extra>',
+            ))
+        fig.add_hline(y=plan.makespan, line_dash='dash', line_color='#6B7280',
+                      annotation_text=f'Finish {plan.makespan:.1f}h', annotation_position='top right')
+        fig.update_layout(
+            title={
+                'text': f'Crane Split: {int(workload[crane_split.OPERATIONS].to_numpy().sum()):,} Moves, {cranes} Cranes',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis=dict(title='Bay (Bow → Stern)', type='category', categoryorder='array', categoryarray=order),
+            yaxis=dict(title='Hours from start', autorange='reversed', gridcolor='#E5E7EB'),
+            height=500,
+            plot_bgcolor='white',
+            legend=dict(orientation='h', y=-0.15),
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'crane_split_chart', build_crane_split_chart, deps=(workload, cranes))
+    st.plotly_chart(fig, width='stretch')
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Vessel Finish", f"{plan.makespan:.1f} h")
+    col2.metric("Lower Bound", f"{plan.lower_bound:.1f} h", f"{plan.gap:.1%} above", delta_color='off')
+    col3.metric("Crane Hours Waiting", f"{worklists['Wait'].sum():.1f}")
+
+    crane = st.selectbox("Work list for", range(1, cranes + 1), format_func=lambda c: f"QC {c}",
+                         key='crane_split_list')
+    st.dataframe(worklists[worklists['Crane'] == crane].drop(columns='Crane').round(2), width='stretch',
+                 hide_index=True)
+
+
+@st.fragment
+def yard_allocation_map():
+    yard = yard_allocation.Yard(blocks=4, bays=24, rows=6, tiers=5)
+
+    def build_allocation():
+        return yard.allocate_batch(yard_allocation.synthetic_discharge(1500, vessels=5))
+
+    placed = page_cache.table(__name__, 'yard_allocation', build_allocation)
+    block = st.selectbox("Block", ['B01', 'B02', 'B03', 'B04'], key='yard_allocation_block')
+
+    def build_yard_map():
+        stacks = placed[placed['Block'] == block].groupby(['Bay', 'Row']).agg(
+            Height=('Container', 'size'), Group=('Group', 'first'),
+            Reefers=('Reefer', 'sum'), DG=('DG', 'sum'), Heaviest=('Weight', 'max'))
+        heights = np.zeros((yard.rows, yard.bays))
+        groups = np.full((yard.rows, yard.bays), '', dtype=object)
+        bays = stacks.index.get_level_values('Bay').to_numpy(int) - 1
+        rows = stacks.index.get_level_values('Row').to_numpy(int) - 1
+        heights[rows, bays] = stacks['Height']
+        groups[rows, bays] = np.where(stacks['Reefers'] > 0, stacks['Group'] + ' (reefer)',
+                                      np.where(stacks['DG'] > 0, stacks['Group'] + ' (DG)', stacks['Group']))
+        fig = go.Figure(go.Heatmap(
+            z=heights, x=np.arange(1, yard.bays + 1), y=np.arange(1, yard.rows + 1),
+            customdata=groups, zmin=0, zmax=yard.tiers,
+            colorscale=[[0, '#F3F4F6'], [0.2, '#BFDBFE'], [1, '#1E3A8A']],
+            colorbar=dict(title='Tiers'), xgap=2, ygap=2,
+            hovertemplate='Bay %{x}, Row %{y}<br>%{z} high<br>%{customdata}<extra></extra>',
+        ))
+        fig.update_layout(
+            title={
+                'text': f'Block {block}: Stack Heights (top view)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Bay",
+            yaxis_title="Row",
+            height=320,
+            plot_bgcolor='white'
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'yard_allocation_map', build_yard_map, deps=(placed, block))
+    st.plotly_chart(fig, width='stretch')
+
+
+@st.fragment
+def yard_rehandle_comparison():
+    col1, col2 = st.columns(2)
+    fill = col1.slider("Average block fill (%)", 30, 80, 60, step=10, key='yard_sim_fill')
+    error = col2.select_slider("Import pickup prediction error (±%)", [0, 10, 25, 50], value=50,
+                               key='yard_sim_error')
+
+    def build_rehandles():
+        containers = yard_sim.workload(3000, occupancy=fill / 100, prediction_error=error / 100)
+        return yard_sim.compare(containers)
+
+    results = page_cache.table(__name__, f'yard_rehandles_{fill}_{error}', build_rehandles).set_index('policy')
+    labels = {'random': "Random", 'by_vessel': "By Vessel", 'by_pickup': "By Predicted Pickup"}
+    for col, (policy, label) in zip(st.columns(3), labels.items()):
+        rate = results.at[policy, 'rehandle_pct']
+        delta = rate - results.at['random', 'rehandle_pct']
+        col.metric(f"{label}: re-handles per 100 pickups", f"{rate:.0f}",
+                   f"{delta:+.0f} vs random" if policy != 'random' else None, delta_color='inverse')
+    st.caption("Why so far above the <10% target: the simulation has no housekeeping. Terminals get there by "
+               "re-sorting stacks overnight and booking truck appointments; here a box stays where it was put, and "
+               "one dug out can be dug out again. Half the boxes are imports, whose truck pickup is predicted within "
+               "the error chosen above; half are exports, loaded in an unknown order within their vessel's window, "
+               "which is what remains with exact predictions. Grouping by vessel piles a vessel's imports into tall "
+               "stacks that trucks empty in random order, so in a lightly filled block it loses to random stacking, "
+               "which keeps stacks low.")
+
+
+@st.fragment
+def berth_quarter_view():
+    def build_quarter_plan():
+        berths = berth_planning.synthetic_berths(20)
+        return berth_planning.solve(berth_planning.synthetic_calls(2000, days=90), berths).table()
+
+    quarter_plan = page_cache.table(__name__, 'quarter_berth_plan', build_quarter_plan)
+    first_day, last_day = st.slider("Days shown", 0, 90, (0, 90), key='berth_quarter_window')
+    window = (first_day * 24, max(last_day, first_day + 1) * 24)
+
+    def build_quarter_chart():
+        fig = gantt.figure(
+            quarter_plan, lane='Berth', start='Start', duration='Hours', wait='Wait', window=window,
+            text='{Vessel}',
+            hover='<b>{Vessel}</b><br>Berth: {Berth}<br>Arrived: {ETA:.1f}h<br>Start: {Start:.1f}h<br>'
+                  'Duration: {Hours:.1f}h<br>Moves: {Moves:,.0f}',
+        )
+        fig.update_layout(
+            title={
+                'text': f'Berth Occupancy, Days {first_day}-{max(last_day, first_day + 1)} of a Synthetic Quarter',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Time (hours)",
+            height=500,
+            xaxis_gridcolor='#E5E7EB',
+            plot_bgcolor='white'
+        )
+        return fig
+
+    fig = page_cache.figure(__name__, 'quarter_berth_chart', build_quarter_chart, deps=(quarter_plan, window))
+    st.plotly_chart(fig, width='stretch')
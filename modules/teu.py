@@ -0,0 +1,191 @@
+"""TEU totals and container mix for manifests of any size, read in chunks.
+
+Each box counts as its length over 20 feet: 1 TEU for a 20ft box, 2 for a
+40ft and 2.25 for a 45ft. The size column may hold ISO size/type codes
+(``22G1``, ``L5G1``, decoded by modules/size_type) or lengths in feet
+(``20``, ``40'``, ``40HC``). Boxes whose size cannot be read are counted
+as Unknown and carry no TEU.
+
+A ``Tally`` keeps running totals per group: TEU and boxes by size class.
+Each chunk is reduced to one row per group before it is added, so memory
+grows with the number of groups (vessels, lines, ports) and not with the
+manifest. ``summarise()`` streams a CSV file or upload through a tally:
+
+    totals = teu.summarise('throughput_2025.csv', by=['Line'], size_column='ISO Code')
+    totals                  # Boxes, TEU, TEU per Box, mix shares, per Line
+
+    tally = teu.Tally(by=['Vessel'])
+    for chunk in chunks:
+        tally.add(chunk, 'Size')
+    tally.result(), tally.total()
+
+From the command line, with a synthetic manifest as a timing check:
+
+    python -m modules.teu summarise manifest.csv --by Vessel --size "ISO Code"
+    python -m modules.teu demo -n 5000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from modules import size_type
+
+CLASSES = ['20ft', '40ft', '45ft', 'Other', 'Unknown']
+CHUNK_ROWS = 500_000
+
+# TEU per size/type catalogue row, NaN for unknown codes
+_CODE_TEU = np.r_[np.nan, size_type.CATALOGUE['TEU'].to_numpy(np.float64)]
+
+
+class TeuError(ValueError):
+    pass
+
+
+def _feet_teu(feet):
+    # Lengths outside 10-60 ft are not container lengths
+    return np.where((feet >= 10) & (feet <= 60), feet / 20, np.nan)
+
+
+def box_teu(sizes):
+    # TEU and size class (an index into CLASSES) per box
+    sizes = pd.Series(sizes)
+    if pd.api.types.is_numeric_dtype(sizes.dtype):
+        teu = _feet_teu(sizes.to_numpy(np.float64, na_value=np.nan))
+    else:
+        teu = _CODE_TEU[size_type.lookup(sizes.to_numpy(object))]
+        missing = np.isnan(teu)
+        if missing.any():
+            # Not an ISO code: a length in feet, possibly followed by a
+            # suffix (40', 40HC, 45 ft)
+            feet = pd.to_numeric(sizes[missing].astype(str).str.extract(r'^\s*(\d+(?:\.\d+)?)', expand=False),
+                                 errors='coerce').to_numpy(np.float64, na_value=np.nan)
+            teu[missing] = _feet_teu(feet)
+    size_class = np.select([teu == 1, teu == 2, teu == 2.25, np.isnan(teu)], [0, 1, 2, 4], 3).astype(np.int8)
+    return np.nan_to_num(teu), size_class
+
+
+class Tally:
+    # Running totals: one row per group, with TEU and boxes per size class
+
+    def __init__(self, by=()):
+        self.by = list(by)
+        self.rows = 0
+        self.chunks = 0
+        self._totals = None
+
+    def add(self, chunk, size_column):
+        missing = [c for c in self.by + [size_column] if c not in chunk.columns]
+        if missing:
+            raise TeuError(f"Manifest is missing {', '.join(missing)}")
+        teu, size_class = box_teu(chunk[size_column])
+        counts = np.zeros((len(chunk), len(CLASSES)), dtype=np.int64)
+        counts[np.arange(len(chunk)), size_class] = 1
+        part = pd.DataFrame(counts, columns=CLASSES, index=chunk.index).assign(TEU=teu)
+        if self.by:
+            keys = [chunk[c].fillna('(blank)') for c in self.by]
+            part = part.groupby(keys, sort=False).sum()
+        else:
+            part = part.sum().to_frame('All').T
+        self._totals = part if self._totals is None else self._totals.add(part, fill_value=0)
+        self.rows += len(chunk)
+        self.chunks += 1
+
+    def result(self):
+        # Boxes, TEU, TEU per Box and the mix by boxes, largest TEU first
+        if self._totals is None:
+            return _summary(pd.DataFrame(columns=CLASSES + ['TEU'], dtype=np.float64))
+        return _summary(self._totals).sort_values('TEU', ascending=False)
+
+    def total(self):
+        # One row for everything added, all zero before the first chunk
+        if self._totals is None:
+            totals = pd.DataFrame(0.0, columns=CLASSES + ['TEU'], index=['All'])
+        else:
+            totals = self._totals.sum().to_frame('All').T
+        return _summary(totals).iloc[0]
+
+
+def _summary(totals):
+    boxes = totals[CLASSES].sum(axis=1)
+    known = boxes - totals['Unknown']
+    frame = pd.DataFrame({'Boxes': boxes.astype(np.int64), 'TEU': totals['TEU'].round(2)}, index=totals.index)
+    frame['TEU per Box'] = (totals['TEU'] / known.where(known > 0)).round(3)
+    for name in CLASSES[:-1]:
+        frame[f'{name} %'] = (100 * totals[name] / known.where(known > 0)).round(1)
+    frame['Unknown'] = totals['Unknown'].astype(np.int64)
+    return frame
+
+
+def read_chunks(source, columns, chunk_rows=CHUNK_ROWS):
+    # A CSV path or file object, read `chunk_rows` rows at a time as text
+    try:
+        yield from pd.read_csv(source, usecols=columns, dtype=str, chunksize=chunk_rows)
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        raise TeuError(f"Could not read the manifest: {e}") from e
+    except ValueError as e:
+        if 'Usecols' in str(e):
+            raise TeuError(f"Manifest is missing one of {', '.join(columns)}") from e
+        raise
+
+
+def summarise(source, by=(), size_column='Size', chunk_rows=CHUNK_ROWS):
+    tally = Tally(by)
+    for chunk in read_chunks(source, list(by) + [size_column], chunk_rows):
+        tally.add(chunk, size_column)
+    return tally
+
+
+def sample_manifest(n=100_000, seed=0):
+    # Synthetic box records: vessel, line, port of loading and ISO code
+    rng = np.random.default_rng(seed)
+    lines = np.array(['Maersk', 'MSC', 'CMA CGM', 'COSCO', 'Hapag-Lloyd', 'ONE', 'Evergreen'])
+    ports = np.array(['Shanghai', 'Busan', 'Port Klang', 'Colombo', 'Jebel Ali', 'Rotterdam', 'Tanjung Pelepas'])
+    codes = np.array(['22G1', '42G1', '45G1', '45R1', '22R1', 'L5G1', '22T6', '42U1', '42P3', "40'", '2210'])
+    code_mix = [0.18, 0.17, 0.45, 0.06, 0.03, 0.04, 0.02, 0.015, 0.015, 0.015, 0.005]
+    line = rng.choice(len(lines), n, p=[0.22, 0.24, 0.15, 0.14, 0.1, 0.08, 0.07])
+    return pd.DataFrame({
+        'Vessel': np.char.add(np.char.add(lines[line], ' '), rng.integers(1, 9, n).astype(str)),
+        'Line': lines[line],
+        'Port': ports[rng.integers(len(ports), size=n)],
+        'ISO Code': codes[rng.choice(len(codes), n, p=code_mix)],
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.teu', description='TEU totals for large manifests.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    run = sub.add_parser('summarise', help='TEU and mix per group for a CSV manifest')
+    run.add_argument('source', help="CSV file, or '-' for stdin")
+    run.add_argument('--by', action='append', default=[], help='column to group by (repeatable)')
+    run.add_argument('--size', default='Size', help='column with ISO codes or lengths in feet')
+    run.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    demo = sub.add_parser('demo', help='summarise a synthetic manifest and time it')
+    demo.add_argument('-n', '--rows', type=int, default=2_000_000)
+    demo.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    if args.command == 'summarise':
+        source = sys.stdin if args.source == '-' else args.source
+        tally = summarise(source, args.by, args.size, args.chunk_rows)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'manifest.csv'
+            sample_manifest(args.rows).to_csv(path, index=False)
+            print(f"{args.rows:,} rows, {path.stat().st_size / 1e6:.0f} MB")
+            start = time.perf_counter()
+            tally = summarise(path, ['Line'], 'ISO Code', args.chunk_rows)
+            elapsed = time.perf_counter() - start
+        print(f"{tally.chunks} chunks in {elapsed:.2f} s ({tally.rows / elapsed / 1e6:.1f}M rows/s)\n")
+    print(tally.result().to_string())
+    print()
+    print(tally.total().to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, instrument, page_cache
 
 def show():
     st.markdown('<p class="main-header">🏗️ Tuas Mega Port Case Study</p>', unsafe_allow_html=True)
@@ -18,7 +19,7 @@ def show():
     # SECTION 1: Why Tuas? The Strategic Imperative
     # ============================================================================
     
-    st.markdown('<p class="section-header">Why Tuas? The Strategic Imperative</p>', unsafe_allow_html=True)
+    instrument.section_header('Why Tuas? The Strategic Imperative')
     
     st.markdown("""
     Tuas Mega Port represents Singapore's largest infrastructure project—a S$20+ billion investment 
@@ -186,47 +187,41 @@ def show():
     """)
     
     # Strategic drivers visualization
-    drivers_importance = pd.DataFrame({
-        'Driver': [
-            'Consolidation\nEfficiency',
-            'Accommodate\nMega Vessels',
-            'Regional\nCompetition',
-            'Technology\nLeadership',
-            'Climate\nResilience'
-        ],
-        'Strategic Importance': [95, 100, 90, 85, 80],
-        'Urgency': [85, 95, 100, 80, 90]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Strategic Importance',
-        x=drivers_importance['Driver'],
-        y=drivers_importance['Strategic Importance'],
-        marker_color='#3B82F6'
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Urgency',
-        x=drivers_importance['Driver'],
-        y=drivers_importance['Urgency'],
-        marker_color='#10B981'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Tuas Strategic Drivers: Importance vs Urgency',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        yaxis_title="Score (0-100)",
-        barmode='group',
-        height=450,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 110])
-    )
+    drivers_importance = catalog.load('tuas_development/drivers_importance')
+    
+    def build_drivers_importance_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            name='Strategic Importance',
+            x=drivers_importance['Driver'],
+            y=drivers_importance['Strategic Importance'],
+            marker_color='#3B82F6'
+        ))
+        
+        fig.add_trace(go.Bar(
+            name='Urgency',
+            x=drivers_importance['Driver'],
+            y=drivers_importance['Urgency'],
+            marker_color='#10B981'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Tuas Strategic Drivers: Importance vs Urgency',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            yaxis_title="Score (0-100)",
+            barmode='group',
+            height=450,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 110])
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'drivers_importance_chart', build_drivers_importance_chart, deps=(drivers_importance,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -234,7 +229,7 @@ def show():
     # SECTION 2: Tuas Design and Features
     # ============================================================================
     
-    st.markdown('<p class="section-header">Tuas Mega Port: Design and Features</p>', unsafe_allow_html=True)
+    instrument.section_header('Tuas Mega Port: Design and Features')
     
     st.markdown("""
     Tuas is not just bigger—it's fundamentally different in design philosophy and operational approach.
@@ -243,47 +238,7 @@ def show():
     st.markdown('<p class="subsection-header">Scale and Capacity</p>', unsafe_allow_html=True)
     
     # Tuas specifications
-    tuas_specs = pd.DataFrame({
-        'Specification': [
-            'Total Land Area',
-            'Reclaimed Land',
-            'Quay Length',
-            'Number of Berths',
-            'Water Depth',
-            'Annual Capacity (Phase 1)',
-            'Ultimate Capacity (2040)',
-            'Quay Cranes',
-            'Yard Cranes',
-            'AGVs',
-            'Total Investment'
-        ],
-        'Value': [
-            '1,337 hectares (13.4 km²)',
-            '~800 hectares of new land',
-            '26+ kilometres continuous',
-            '60+ berths',
-            '16-20 metres (accommodate mega vessels)',
-            '20-30M TEU (Phases 1-2)',
-            '65M TEU (fully completed)',
-            '200+ super-post-Panamax cranes',
-            'Hundreds of ARMG',
-            '1,000+ battery-electric AGVs',
-            'S$20+ billion'
-        ],
-        'Comparison': [
-            'Equivalent to ~2,000 football fields',
-            'Largest reclamation project in Singapore',
-            'Longest continuous quay wall globally',
-            'More than entire Singapore currently has',
-            'Deepest in region',
-            'More than many countries\' total throughput',
-            'Nearly 2x current Singapore throughput',
-            'Most advanced crane fleet worldwide',
-            'Fully automated yard operations',
-            'Largest AGV fleet globally',
-            'Singapore\'s largest infrastructure project'
-        ]
-    })
+    tuas_specs = catalog.load('tuas_development/tuas_specs')
     
     st.dataframe(tuas_specs, width='stretch', hide_index=True)
     
@@ -300,61 +255,47 @@ def show():
     """)
     
     # Phases timeline
-    phases_timeline = pd.DataFrame({
-        'Phase': ['Phase 1', 'Phase 2A', 'Phase 2B', 'Phase 3', 'Phase 4'],
-        'Timeline': ['2021-2027', '2027-2032', '2032-2037', '2037-2040', '2040+'],
-        'Capacity Added (M TEU)': [8, 12, 15, 15, 15],
-        'Key Features': [
-            'First automated terminal, foundation infrastructure, pilot operations',
-            'Scale up automation, additional berths, expand yard',
-            'Continue expansion, refine operations, full automation',
-            'Near completion, maximise productivity',
-            'Final capacity, potential future expansion'
-        ],
-        'Status': [
-            'Under construction',
-            'Planning/early works',
-            'Planned',
-            'Planned',
-            'Planned'
-        ]
-    })
+    phases_timeline = catalog.load('tuas_development/phases_timeline')
     
     st.dataframe(phases_timeline, width='stretch', hide_index=True)
     
     # Capacity growth visualization
-    years = [2020, 2027, 2032, 2037, 2040, 2050]
-    capacity = [37, 45, 57, 72, 65, 65]  # Note: 2037-2040 adjustment for ultimate 65M
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=capacity,
-        mode='lines+markers',
-        line=dict(color='#3B82F6', width=4),
-        marker=dict(size=14, color='#2563EB', line=dict(color='white', width=2)),
-        fill='tozeroy',
-        fillcolor='rgba(59, 130, 246, 0.2)',
-        name='Capacity',
-        text=[f"{val}M TEU" for val in capacity],
-        textposition='top center'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Singapore Port Capacity Growth: Current → Tuas Fully Operational',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Annual Capacity (Million TEU)",
-        height=450,
-        plot_bgcolor='white',
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 80]),
-        xaxis=dict(gridcolor='#E5E7EB')
-    )
+    def build_capacity_growth_chart():
+        years = [2020, 2027, 2032, 2037, 2040, 2050]
+        capacity = [37, 45, 57, 72, 65, 65]  # Note: 2037-2040 adjustment for ultimate 65M
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=capacity,
+            mode='lines+markers',
+            line=dict(color='#3B82F6', width=4),
+            marker=dict(size=14, color='#2563EB', line=dict(color='white', width=2)),
+            fill='tozeroy',
+            fillcolor='rgba(59, 130, 246, 0.2)',
+            name='Capacity',
+            text=[f"{val}M TEU" for val in capacity],
+            textposition='top center'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Singapore Port Capacity Growth: Current → Tuas Fully Operational',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Annual Capacity (Million TEU)",
+            height=450,
+            plot_bgcolor='white',
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 80]),
+            xaxis=dict(gridcolor='#E5E7EB')
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'capacity_growth_chart', build_capacity_growth_chart)
     
     st.plotly_chart(fig, width='stretch')
     
@@ -419,7 +360,7 @@ def show():
     # SECTION 3: Implementation Challenges
     # ============================================================================
     
-    st.markdown('<p class="section-header">Implementation Challenges: Not Easy</p>', unsafe_allow_html=True)
+    instrument.section_header('Implementation Challenges: Not Easy')
     
     st.markdown("""
     Building and operating Tuas Mega Port presents significant challenges that Singapore must navigate.
@@ -554,7 +495,7 @@ def show():
     # SECTION 4: Will It Be Enough? Critical Analysis
     # ============================================================================
     
-    st.markdown('<p class="section-header">Critical Question: Will 65M TEU Be Enough?</p>', unsafe_allow_html=True)
+    instrument.section_header('Critical Question: Will 65M TEU Be Enough?')
     
     st.markdown("""
     The ultimate question: Is Singapore making the right bet with Tuas? Will 65M TEU capacity be 
@@ -629,52 +570,34 @@ def show():
     # Scenario analysis
     st.markdown('<p class="subsection-header">Scenario Analysis: 2040 Outcomes</p>', unsafe_allow_html=True)
     
-    scenarios = pd.DataFrame({
-        'Scenario': [
-            'Optimistic',
-            'Base Case',
-            'Conservative',
-            'Pessimistic'
-        ],
-        'Probability': ['20%', '50%', '25%', '5%'],
-        'Singapore 2040 Throughput': ['70M TEU', '55-60M TEU', '45-50M TEU', '35-40M TEU'],
-        'Tuas Utilisation': ['107% (need expansion)', '85-92%', '69-77%', '54-62%'],
-        'Outcome Assessment': [
-            'Tuas insufficient, need Phase 5',
-            'Tuas appropriate, well-utilised',
-            'Tuas has excess capacity, lower ROI',
-            'Tuas significantly underutilised, stranded assets'
-        ],
-        'Key Assumptions': [
-            'Strong global trade, Singapore maintains share, technology helps efficiency',
-            'Moderate trade growth, modest competition, stable market share',
-            'Slow trade growth, increased competition, some volume loss',
-            'Trade stagnation/decline, major competitive losses, technology disruption'
-        ]
-    })
+    scenarios = catalog.load('tuas_development/scenarios')
     
     st.dataframe(scenarios, width='stretch', hide_index=True)
     
     # Scenario probability visualization
-    fig = go.Figure(data=[go.Pie(
-        labels=scenarios['Scenario'],
-        values=[20, 50, 25, 5],
-        marker=dict(colors=['#10B981', '#3B82F6', '#F59E0B', '#EF4444']),
-        textinfo='label+percent',
-        textfont=dict(size=14, color='white'),
-        hole=0.4
-    )])
-    
-    fig.update_layout(
-        title={
-            'text': 'Scenario Probability Distribution (Expert Assessment)',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        annotations=[dict(text='2040<br>Outlook', x=0.5, y=0.5, font_size=16, showarrow=False)],
-        height=450
-    )
+    def build_scenarios_chart():
+        fig = go.Figure(data=[go.Pie(
+            labels=scenarios['Scenario'],
+            values=[20, 50, 25, 5],
+            marker=dict(colors=['#10B981', '#3B82F6', '#F59E0B', '#EF4444']),
+            textinfo='label+percent',
+            textfont=dict(size=14, color='white'),
+            hole=0.4
+        )])
+        
+        fig.update_layout(
+            title={
+                'text': 'Scenario Probability Distribution (Expert Assessment)',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            annotations=[dict(text='2040<br>Outlook', x=0.5, y=0.5, font_size=16, showarrow=False)],
+            height=450
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'scenarios_chart', build_scenarios_chart, deps=(scenarios,))
     
     st.plotly_chart(fig, width='stretch')
     
@@ -740,7 +663,7 @@ def show():
     # SECTION 5: Key Takeaways
     # ============================================================================
     
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
+    instrument.section_header('Key Takeaways')
     
     col1, col2 = st.columns(2)
     
@@ -815,7 +738,7 @@ def show():
     # ============================================================================
     
     st.markdown("---")
-    st.markdown('<p class="section-header">🎓 Course Conclusion</p>', unsafe_allow_html=True)
+    instrument.section_header('🎓 Course Conclusion')
     
     st.markdown("""
     **Congratulations!** You\'ve completed the comprehensive Maritime 101 educational journey.
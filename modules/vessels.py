@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from modules import catalog, page_cache, sections
 
 def show():
     st.markdown('<p class="main-header">🚢 Container Vessels & Evolution</p>', unsafe_allow_html=True)
@@ -13,12 +14,34 @@ def show():
     </div>
     """, unsafe_allow_html=True)
     
+    _vessel_anatomy_and_terminology()
+    _vessel_size_evolution()
+    _vessel_classification_systems()
+    _global_fleet_and_carrier_rankings_2024_2025()
+    _economics_of_vessel_size()
+    _stowage_planning_fundamentals()
+    _technology_and_environmental_evolution()
+    _key_takeaways()
+    
     # ============================================================================
-    # SECTION 1: Vessel Anatomy and Terminology
+    # Navigation
     # ============================================================================
     
-    st.markdown('<p class="section-header">Vessel Anatomy and Maritime Terminology</p>', unsafe_allow_html=True)
-    
+    st.markdown("---")
+    st.markdown("### 📚 Continue Learning")
+    st.markdown("""
+    **Next Topic:** 🌍 Global Shipping & Alliances - Understand how shipping lines have consolidated into 
+    alliances (Ocean Alliance, Gemini Cooperation, Premier Alliance) controlling 80%+ of global capacity, 
+    and how hub-and-spoke networks enable global connectivity through major transhipment hubs like Singapore.
+    """)
+
+
+# ============================================================================
+# SECTION 1: Vessel Anatomy and Terminology
+# ============================================================================
+
+@sections.section('Vessel Anatomy and Maritime Terminology', lazy=False)
+def _vessel_anatomy_and_terminology():
     st.markdown("""
     Before diving into vessel evolution, let's understand basic vessel anatomy and the terminology used 
     throughout the maritime industry. These terms are universal across all maritime professionals worldwide.
@@ -104,13 +127,15 @@ def show():
     - Allows insertion of intermediate positions if needed
     - Provides clear distinction between 20ft and 40ft positions (odd vs even for bays)
     """)
-    
-    # ============================================================================
-    # SECTION 2: Vessel Size Evolution
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">The Dramatic Evolution of Container Vessel Sizes</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 2: Vessel Size Evolution
+# ============================================================================
+
+@sections.section('The Dramatic Evolution of Container Vessel Sizes')
+def _vessel_size_evolution():
     st.markdown("""
     One of the most striking transformations in maritime history is the growth in container vessel sizes. 
     In just 69 years (1956-2025), vessels have grown **nearly 50 times** in capacity—from 500 TEU to 24,000+ TEU.
@@ -124,58 +149,42 @@ def show():
     """)
     
     # Vessel evolution data - updated with 2024-2025 records
-    vessel_evolution = pd.DataFrame({
-        'Year': [1956, 1970, 1980, 1988, 1996, 2006, 2013, 2019, 2020, 2022, 2025],
-        'Vessel Example': [
-            'Ideal X (First)',
-            'Encounter Bay',
-            'American New York',
-            'Panamax Standard',
-            'Regina Maersk',
-            'Emma Maersk',
-            'Maersk Triple E',
-            'MSC Gülsün',
-            'HMM Algeciras',
-            'Ever Alot',
-            'MSC Irina (Current Largest)'
-        ],
-        'Capacity (TEU)': [500, 1500, 3000, 4500, 6500, 15000, 18000, 23756, 24000, 24004, 24346],
-        'Length (m)': [135, 180, 230, 290, 318, 397, 400, 400, 400, 400, 400],
-        'Width (m)': [17, 24, 30, 32, 42, 56, 59, 61, 61, 61.5, 61.5],
-        'Max Draft (m)': [9, 10, 12, 13, 14, 16, 16, 16.5, 16.5, 16.5, 16.5],
-        'Containers Across': ['6', '8', '11', '13', '16', '22', '23', '24', '24', '24', '24']
-    })
+    vessel_evolution = catalog.load('vessels/vessel_evolution')
     
     st.dataframe(vessel_evolution, use_container_width=True, hide_index=True)
     
     # Capacity growth visualisation
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=vessel_evolution['Year'],
-        y=vessel_evolution['Capacity (TEU)'],
-        mode='lines+markers',
-        name='TEU Capacity',
-        line=dict(color='#3B82F6', width=4),
-        marker=dict(size=12, color='#2563EB', line=dict(color='white', width=2)),
-        text=vessel_evolution['Vessel Example'],
-        hovertemplate='<b>%{text}</b><br>Year: %{x}<br>Capacity: %{y:,} TEU<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Container Vessel Capacity Growth: 1956 → 2025',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1F2937'}
-        },
-        xaxis_title="Year",
-        yaxis_title="Capacity (TEU)",
-        height=500,
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='#E5E7EB'),
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 26000])
-    )
+    def build_vessel_evolution_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=vessel_evolution['Year'],
+            y=vessel_evolution['Capacity (TEU)'],
+            mode='lines+markers',
+            name='TEU Capacity',
+            line=dict(color='#3B82F6', width=4),
+            marker=dict(size=12, color='#2563EB', line=dict(color='white', width=2)),
+            text=vessel_evolution['Vessel Example'],
+            hovertemplate='<b>%{text}</b><br>Year: %{x}<br>Capacity: %{y:,} TEU<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Container Vessel Capacity Growth: 1956 → 2025',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 20, 'color': '#1F2937'}
+            },
+            xaxis_title="Year",
+            yaxis_title="Capacity (TEU)",
+            height=500,
+            plot_bgcolor='white',
+            xaxis=dict(gridcolor='#E5E7EB'),
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 26000])
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'vessel_evolution_chart', build_vessel_evolution_chart, deps=(vessel_evolution,))
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -241,72 +250,22 @@ def show():
     - <strong>Market volatility</strong>: 2024-2025 overcapacity concerns reduce incentive for more mega vessels
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # SECTION 3: Vessel Classification Systems
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Vessel Classification by Size</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 3: Vessel Classification Systems
+# ============================================================================
+
+@sections.section('Vessel Classification by Size')
+def _vessel_classification_systems():
     st.markdown("""
     The industry uses several classification systems based on vessel size and capability. Understanding 
     these categories is essential for port planning, route design, and operational discussions.
     """)
     
     # Classification data
-    vessel_classes = pd.DataFrame({
-        'Class': [
-            'Feeder',
-            'Feedermax',
-            'Panamax',
-            'Post-Panamax',
-            'New-Panamax (Neo-Panamax)',
-            'VLCS (Very Large Container Ship)',
-            'ULCS (Ultra Large Container Ship)',
-            'Megamax (24,000 TEU Class)'
-        ],
-        'Capacity Range (TEU)': [
-            '100 - 1,000',
-            '1,000 - 3,000',
-            '3,000 - 5,100',
-            '5,100 - 10,000',
-            '10,000 - 14,500',
-            '14,500 - 18,000',
-            '18,000 - 24,000',
-            '21,000 - 24,346'
-        ],
-        'Typical Width (m)': ['<23', '23-30', '32.2 (max)', '32.3-43', '49-51', '51-59', '59-61', '61-61.5'],
-        'Defining Constraint': [
-            'Small ports, rivers, coastal',
-            'Regional routes',
-            'Old Panama Canal (pre-2016)',
-            'Suez Canal depth, port infrastructure',
-            'New Panama Canal (2016+)',
-            'Port crane reach, major hub ports',
-            'Ultra-deep berths, mega-cranes only',
-            'Maximum practical size (crane reach limit)'
-        ],
-        'Typical Routes': [
-            'Short-sea, river, coastal, intra-regional',
-            'Intra-regional (Asia, Europe, Americas)',
-            'Trans-Pacific, Asia-Europe (obsolete)',
-            'Major trade lanes, hub feedering',
-            'Trans-Pacific via Panama, major trades',
-            'Asia-Europe mainline, Trans-Pacific',
-            'Asia-Europe mainline only',
-            'Asia-Europe mainline, limited deployment'
-        ],
-        'Example Vessels / Operators': [
-            'Regional feeders, short-sea operators',
-            'Wan Hai, Pacific International Lines',
-            'APL China (retired from mainline)',
-            'Maersk Sealand class',
-            'CMA CGM Brazil, APL Temasek',
-            'OOCL Hong Kong, CMA CGM Antoine',
-            'MSC Gülsün, HMM Algeciras',
-            'MSC Irina, Ever Alot (24,346/24,004 TEU)'
-        ]
-    })
+    vessel_classes = catalog.load('vessels/vessel_classes')
     
     st.dataframe(vessel_classes, use_container_width=True, hide_index=True)
     
@@ -376,29 +335,22 @@ def show():
     - **Ton-miles surge**: While trade volume +2.2%, ton-miles +6% (longer routes)
     - **Freight rate volatility**: Shanghai index averaged 2,496 points in 2024 (+149% from 2023)
     """)
-    
-    # ============================================================================
-    # SECTION 4: Global Fleet and Carrier Rankings (2024-2025)
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Global Container Fleet: Current State (December 2025)</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 4: Global Fleet and Carrier Rankings (2024-2025)
+# ============================================================================
+
+@sections.section('Global Container Fleet: Current State (December 2025)')
+def _global_fleet_and_carrier_rankings_2024_2025():
     st.markdown("""
     The global container shipping industry is dominated by a few major carriers, with significant concentration 
     of capacity.
     """)
     
     # Current carrier rankings (December 2025 data)
-    carrier_rankings = pd.DataFrame({
-        'Rank': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'Carrier': ['MSC', 'Maersk', 'CMA CGM', 'COSCO', 'Hapag-Lloyd', 'ONE', 'Evergreen', 'HMM', 'Yang Ming', 'ZIM'],
-        'Fleet Capacity (M TEU)': [7.1, 4.6, 4.1, 3.3, 2.4, 2.0, 1.9, 1.0, 0.7, 0.4],
-        'Number of Vessels': [886, 735, 663, 515, 300, 250, 220, 130, 100, 130],
-        'Market Share (%)': [19.9, 14.6, 12.7, 10.8, 7.0, 5.9, 5.6, 2.9, 2.2, 1.3],
-        'Orderbook (M TEU)': [2.2, 0.8, 1.9, 0.6, 0.3, 0.2, 0.9, 0.2, 0.1, 0.1],
-        'Headquarters': ['Geneva, Switzerland', 'Copenhagen, Denmark', 'Marseille, France', 'Shanghai, China', 
-                        'Hamburg, Germany', 'Singapore', 'Taiwan', 'Seoul, South Korea', 'Taiwan', 'Haifa, Israel']
-    })
+    carrier_rankings = catalog.load('vessels/carrier_rankings')
     
     st.dataframe(carrier_rankings, use_container_width=True, hide_index=True)
     
@@ -442,56 +394,55 @@ def show():
     - **Ocean Alliance**: Unchanged (CMA CGM + COSCO + OOCL + Evergreen)
     - **MSC**: Operating independently (world's largest solo operator)
     """)
-    
-    # ============================================================================
-    # SECTION 5: Economics of Vessel Size
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Economics of Scale: Why Bigger is (Usually) Better</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 5: Economics of Vessel Size
+# ============================================================================
+
+@sections.section('Economics of Scale: Why Bigger is (Usually) Better')
+def _economics_of_vessel_size():
     st.markdown("""
     The dramatic growth in vessel sizes is driven by powerful economic incentives. Let's examine the 
     cost structure and how it changes with vessel size.
     """)
     
     # Cost comparison data
-    cost_comparison = pd.DataFrame({
-        'Vessel Size (TEU)': [1000, 3000, 5000, 8000, 12000, 18000, 24000],
-        'Cost per TEU (Index)': [100, 68, 52, 38, 28, 18, 16],
-        'Crew Size': [15, 20, 22, 24, 25, 25, 25],
-        'Fuel per TEU (Index)': [100, 75, 62, 51, 43, 38, 37],
-        'Port Cost per TEU (Index)': [100, 45, 33, 25, 20, 17, 15],
-        'Capital Cost per TEU (Index)': [100, 70, 58, 47, 40, 35, 34]
-    })
+    cost_comparison = catalog.load('vessels/cost_comparison')
     
     # Cost savings visualisation
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=cost_comparison['Vessel Size (TEU)'],
-        y=cost_comparison['Cost per TEU (Index)'],
-        mode='lines+markers',
-        name='Total Cost per TEU',
-        line=dict(color='#EF4444', width=4),
-        marker=dict(size=12),
-        fill='tozeroy',
-        fillcolor='rgba(239, 68, 68, 0.2)'
-    ))
-    
-    fig.update_layout(
-        title={
-            'text': 'Economies of Scale: Cost per TEU vs Vessel Size',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#1F2937'}
-        },
-        xaxis_title="Vessel Size (TEU)",
-        yaxis_title="Cost per TEU (Indexed to 1,000 TEU = 100)",
-        height=450,
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='#E5E7EB'),
-        yaxis=dict(gridcolor='#E5E7EB', range=[0, 110])
-    )
+    def build_cost_comparison_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=cost_comparison['Vessel Size (TEU)'],
+            y=cost_comparison['Cost per TEU (Index)'],
+            mode='lines+markers',
+            name='Total Cost per TEU',
+            line=dict(color='#EF4444', width=4),
+            marker=dict(size=12),
+            fill='tozeroy',
+            fillcolor='rgba(239, 68, 68, 0.2)'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': 'Economies of Scale: Cost per TEU vs Vessel Size',
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#1F2937'}
+            },
+            xaxis_title="Vessel Size (TEU)",
+            yaxis_title="Cost per TEU (Indexed to 1,000 TEU = 100)",
+            height=450,
+            plot_bgcolor='white',
+            xaxis=dict(gridcolor='#E5E7EB'),
+            yaxis=dict(gridcolor='#E5E7EB', range=[0, 110])
+        )
+        return fig
+    
+    fig = page_cache.figure(__name__, 'cost_comparison_chart', build_cost_comparison_chart, deps=(cost_comparison,))
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -540,13 +491,15 @@ def show():
     - **Diminishing returns**: Cost savings flatten above 18,000-20,000 TEU
     - **Market volatility**: 2024-2025 saw periods of significant oversupply
     """)
-    
-    # ============================================================================
-    # SECTION 6: Stowage Planning Fundamentals
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Vessel Stowage Planning: The Complex 3D Puzzle</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 6: Stowage Planning Fundamentals
+# ============================================================================
+
+@sections.section('Vessel Stowage Planning: The Complex 3D Puzzle')
+def _stowage_planning_fundamentals():
     st.markdown("""
     Stowage planning—determining where each container goes on the vessel—is a complex multi-objective 
     optimisation problem with numerous competing constraints. Modern stowage planning software uses AI 
@@ -774,13 +727,15 @@ def show():
     - **Predictive analytics**: Forecast issues before they occur
     - **Integration**: Connected to Terminal Operating System, shipping line systems
     """)
-    
-    # ============================================================================
-    # SECTION 7: Technology and Environmental Evolution
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Technology Evolution: Efficiency and Sustainability (2024-2025)</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 7: Technology and Environmental Evolution
+# ============================================================================
+
+@sections.section('Technology Evolution: Efficiency and Sustainability (2024-2025)')
+def _technology_and_environmental_evolution():
     st.markdown("""
     Modern container vessels incorporate advanced technologies focused on fuel efficiency, emissions reduction, 
     and operational optimisation. The industry is undergoing a major transition to meet IMO decarbonisation targets.
@@ -905,13 +860,15 @@ def show():
     - **Orderbook shift**: 40-50% of new orders are dual-fuel capable
     - **Timeline challenge**: 2050 net-zero requires massive fleet renewal by 2030-2035
     """)
-    
-    # ============================================================================
-    # SECTION 8: Key Takeaways
-    # ============================================================================
-    
-    st.markdown('<p class="section-header">Key Takeaways</p>', unsafe_allow_html=True)
-    
+
+
+
+# ============================================================================
+# SECTION 8: Key Takeaways
+# ============================================================================
+
+@sections.section('Key Takeaways')
+def _key_takeaways():
     col1, col2 = st.columns(2)
     
     with col1:
@@ -990,15 +947,3 @@ def show():
     further overcapacity but includes more dual-fuel capable vessels, signaling gradual environmental progress.
     </div>
     """, unsafe_allow_html=True)
-    
-    # ============================================================================
-    # Navigation
-    # ============================================================================
-    
-    st.markdown("---")
-    st.markdown("### 📚 Continue Learning")
-    st.markdown("""
-    **Next Topic:** 🌍 Global Shipping & Alliances - Understand how shipping lines have consolidated into 
-    alliances (Ocean Alliance, Gemini Cooperation, Premier Alliance) controlling 80%+ of global capacity, 
-    and how hub-and-spoke networks enable global connectivity through major transhipment hubs like Singapore.
-    """)
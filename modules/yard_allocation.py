@@ -0,0 +1,304 @@
+"""Yard slot allocation: pick a Block-Bay-Row-Tier slot for each container.
+
+A yard is a set of equal blocks of ``bays x rows`` stacks, each up to
+``tiers`` high. Every stack is in one zone:
+
+- ``REEFER``: stacks with a power plug (``reefer_mask``)
+- ``DG``: the isolated dangerous-goods area (``dg_mask``)
+- ``GENERAL``: everything else
+
+The placement rules from the Storage Yard Planning section are applied to
+every container:
+
+- reefers only go on plugged stacks and dangerous goods only in the DG zone.
+  General cargo uses general stacks first and spare reefer stacks after.
+- a stack holds one group (a vessel, or a destination for imports), so
+  boxes that leave together are stored together
+- heavy at the bottom: a box never goes on top of a lighter weight class
+- a group's new stacks are opened in the block it already uses, or the
+  nearest block with room. New groups go to the emptiest block.
+
+Stack state is kept in NumPy arrays: contents, heights, and the group and
+weight class on top. A spatial index is kept alongside it. Open stacks are
+bucketed by (zone, group, top weight class) and empty stacks by (zone,
+block). "Best slot for this container" therefore needs a handful of dict
+and set lookups, not a scan of the yard, and takes microseconds:
+
+    yard = yard_allocation.Yard(blocks=20)
+    yard.allocate('MSKU1234565', group='Vessel A', weight=24.0, reefer=True)
+    # -> ('B01', 40, 1, 1)
+    yard.allocate_batch(discharge)      # a whole vessel discharge
+    yard.release('MSKU1234565')
+
+``allocate_batch()`` places heavy boxes first within each group, so whole
+stacks are built heavy-to-light. Timing on a synthetic discharge:
+
+    python -m modules.yard_allocation demo -n 20000
+"""
+import argparse
+import bisect
+import time
+
+import numpy as np
+import pandas as pd
+
+GENERAL, REEFER, DG = 0, 1, 2
+ZONE_NAMES = {GENERAL: 'General', REEFER: 'Reefer', DG: 'DG'}
+WEIGHT_CLASSES = (10.0, 20.0)   # tonnes: light < 10 <= medium < 20 <= heavy
+
+
+class AllocationError(ValueError):
+    pass
+
+
+def weight_class(weight):
+    return bisect.bisect_right(WEIGHT_CLASSES, weight)
+
+
+def default_masks(blocks, bays, rows):
+    # Plugs along the last 4 bays of every block; the last block is the DG area
+    reefer = np.zeros((blocks, bays, rows), dtype=bool)
+    reefer[:, -4:, :] = True
+    dg = np.zeros((blocks, bays, rows), dtype=bool)
+    if blocks > 1:
+        dg[-1] = True
+        reefer[-1] = False
+    return reefer, dg
+
+
+class Yard:
+    def __init__(self, blocks=8, bays=40, rows=6, tiers=5, reefer_mask=None, dg_mask=None):
+        self.blocks, self.bays, self.rows, self.tiers = blocks, bays, rows, tiers
+        if reefer_mask is None or dg_mask is None:
+            default_reefer, default_dg = default_masks(blocks, bays, rows)
+            reefer_mask = default_reefer if reefer_mask is None else reefer_mask
+            dg_mask = default_dg if dg_mask is None else dg_mask
+        if np.any(reefer_mask & dg_mask):
+            raise AllocationError("A stack cannot be both a reefer and a DG stack")
+
+        n = blocks * bays * rows
+        self.zone = np.where(np.ravel(dg_mask), DG, np.where(np.ravel(reefer_mask), REEFER, GENERAL))
+        self.stacks = np.full((n, tiers), -1, dtype=np.int32)
+        self.height = np.zeros(n, dtype=np.int16)
+        self.top_group = np.full(n, -1, dtype=np.int32)
+        self.top_class = np.full(n, -1, dtype=np.int8)
+        self.block_of = np.arange(n) // (bays * rows)
+
+        self._groups = {}        # group name -> id
+        self._group_block = {}   # group id -> block its first stack was opened in
+        self._ids = []           # container number by internal id
+        self._where = {}         # container number -> (internal id, stack, weight class)
+        # The spatial index: open stacks by (zone, group, top class), empty
+        # stacks by (zone, block), and the bucket each stack is in
+        self._open = {}
+        self._empty = {}
+        self._bucket = [None] * n
+        self._zone_of = self.zone.tolist()
+        self._block_list = self.block_of.tolist()
+        for stack in range(n):
+            self._file(stack, self._empty, (self._zone_of[stack], self._block_list[stack]))
+
+    @property
+    def capacity(self):
+        return self.stacks.size
+
+    @property
+    def occupied(self):
+        return len(self._where)
+
+    def _file(self, stack, index, key):
+        index.setdefault(key, set()).add(stack)
+        self._bucket[stack] = (index, key)
+
+    def _unfile(self, stack):
+        entry = self._bucket[stack]
+        if entry is not None:
+            index, key = entry
+            bucket = index[key]
+            bucket.discard(stack)
+            if not bucket:
+                del index[key]
+            self._bucket[stack] = None
+
+    def _refile(self, stack):
+        self._unfile(stack)
+        height = self.height[stack]
+        if height == 0:
+            self._file(stack, self._empty, (self._zone_of[stack], self._block_list[stack]))
+        elif height < self.tiers:
+            self._file(stack, self._open, (self._zone_of[stack], int(self.top_group[stack]), int(self.top_class[stack])))
+
+    def address(self, stack, tier):
+        # (block, bay, row, tier), bays/rows/tiers 1-based as on yard maps
+        block, rest = divmod(int(stack), self.bays * self.rows)
+        bay, row = divmod(rest, self.rows)
+        return f'B{block + 1:02d}', bay + 1, row + 1, int(tier) + 1
+
+    def _zones(self, reefer, dg):
+        if reefer and dg:
+            raise AllocationError("Reefer DG containers need a dedicated area, which this yard does not model")
+        if reefer:
+            return (REEFER,)
+        if dg:
+            return (DG,)
+        return (GENERAL, REEFER)
+
+    def _find(self, group, klass, zones):
+        # Best stack, zone by zone: on top of the same group, in the lightest
+        # class that is not lighter than this box; otherwise an empty stack
+        # in the group's block or the nearest block to it. A new group starts
+        # in the block with the most empty stacks.
+        for zone in zones:
+            for top in range(klass, len(WEIGHT_CLASSES) + 1):
+                bucket = self._open.get((zone, group, top))
+                if bucket:
+                    return next(iter(bucket))
+            home = self._group_block.get(group)
+            if home is None:
+                home = max(range(self.blocks), key=lambda b: len(self._empty.get((zone, b), ())))
+            for distance in range(self.blocks):
+                for block in (home - distance, home + distance):
+                    bucket = self._empty.get((zone, block))
+                    if bucket:
+                        return min(bucket)
+        return None
+
+    def best_slot(self, group, weight, reefer=False, dg=False):
+        # Where allocate() would put this container, without placing it
+        stack = self._find(self._groups.get(group, -1), weight_class(weight), self._zones(reefer, dg))
+        return None if stack is None else self.address(stack, self.height[stack])
+
+    def allocate(self, container, group, weight, reefer=False, dg=False):
+        if container in self._where:
+            raise AllocationError(f"{container} is already in the yard")
+        group_id = self._groups.setdefault(group, len(self._groups))
+        klass = weight_class(weight)
+        stack = self._find(group_id, klass, self._zones(reefer, dg))
+        if stack is None:
+            kind = 'reefer' if reefer else 'DG' if dg else 'general'
+            raise AllocationError(f"No {kind} slot left for {container}")
+
+        box = len(self._ids)
+        self._ids.append(container)
+        tier = self.height[stack]
+        self.stacks[stack, tier] = box
+        self.height[stack] = tier + 1
+        self.top_group[stack] = group_id
+        self.top_class[stack] = klass
+        self._group_block.setdefault(group_id, self._block_list[stack])
+        self._where[container] = (box, stack, klass)
+        self._refile(stack)
+        return self.address(stack, tier)
+
+    def allocate_batch(self, containers):
+        # containers: Container, Group, Weight and optional Reefer/DG columns.
+        # Returns them with Block, Bay, Row and Tier, in the input order.
+        # Boxes with no slot left get empty addresses.
+        reefer = containers['Reefer'].to_numpy(bool) if 'Reefer' in containers else np.zeros(len(containers), bool)
+        dg = containers['DG'].to_numpy(bool) if 'DG' in containers else np.zeros(len(containers), bool)
+        groups = containers['Group'].to_numpy()
+        weights = containers['Weight'].to_numpy(float)
+        numbers = containers['Container'].to_numpy()
+        order = np.lexsort((-weights, pd.factorize(groups)[0]))
+
+        addresses = [None] * len(containers)
+        for i in order.tolist():
+            try:
+                addresses[i] = self.allocate(numbers[i], groups[i], weights[i], reefer[i], dg[i])
+            except AllocationError:
+                addresses[i] = (None, np.nan, np.nan, np.nan)
+        placed = containers.copy()
+        placed[['Block', 'Bay', 'Row', 'Tier']] = pd.DataFrame(addresses, index=containers.index)
+        return placed
+
+    def release(self, container):
+        # Removes a container; any boxes above it settle down one tier
+        if container not in self._where:
+            raise AllocationError(f"{container} is not in the yard")
+        box, stack, _ = self._where.pop(container)
+        height = self.height[stack]
+        tier = int(np.flatnonzero(self.stacks[stack, :height] == box)[0])
+        self.stacks[stack, tier:height - 1] = self.stacks[stack, tier + 1:height]
+        self.stacks[stack, height - 1] = -1
+        self.height[stack] = height - 1
+        if height > 1:
+            top = self._ids[self.stacks[stack, height - 2]]
+            _, _, klass = self._where[top]
+            self.top_class[stack] = klass
+            # A stack keeps one group, so its top group does not change
+        else:
+            self.top_group[stack] = -1
+            self.top_class[stack] = -1
+        self._refile(stack)
+
+    def heights(self, block):
+        # (bays x rows) stack heights of one block, for a top-down yard map
+        size = self.bays * self.rows
+        return self.height[block * size:(block + 1) * size].reshape(self.bays, self.rows)
+
+    def groups(self, block):
+        # (bays x rows) group names on top of each stack of a block, '' when empty
+        size = self.bays * self.rows
+        names = np.array([''] + list(self._groups), dtype=object)
+        return names[self.top_group[block * size:(block + 1) * size] + 1].reshape(self.bays, self.rows)
+
+    def utilisation(self):
+        # Fill by block and zone, as a table
+        frame = pd.DataFrame({
+            'Block': [f'B{b + 1:02d}' for b in self._block_list],
+            'Zone': pd.Series(self.zone).map(ZONE_NAMES),
+            'Slots': self.tiers,
+            'Used': self.height,
+        })
+        table = frame.groupby(['Block', 'Zone'], sort=True)[['Slots', 'Used']].sum().reset_index()
+        table['Fill %'] = (100 * table['Used'] / table['Slots']).round(1)
+        return table
+
+
+def synthetic_discharge(n, vessels=6, reefer_share=0.08, dg_share=0.03, seed=0):
+    # A vessel's import discharge, grouped by the destination it will leave for
+    rng = np.random.default_rng(seed)
+    kind = rng.random(n)
+    return pd.DataFrame({
+        'Container': [f'DEMU{i:06d}{i % 10}' for i in range(n)],
+        'Group': np.array([f'Dest {chr(65 + i)}' for i in range(vessels)])[rng.integers(vessels, size=n)],
+        'Weight': rng.gamma(4, 4, size=n).clip(2.5, 30.0).round(1),
+        'Reefer': kind < reefer_share,
+        'DG': (kind >= reefer_share) & (kind < reefer_share + dg_share),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m modules.yard_allocation', description='Allocate yard slots.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    demo = sub.add_parser('demo', help='allocate a synthetic discharge and time it')
+    demo.add_argument('-n', '--containers', type=int, default=20000)
+    demo.add_argument('-b', '--blocks', type=int, default=20)
+    demo.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    yard = Yard(blocks=args.blocks)
+    discharge = synthetic_discharge(args.containers, seed=args.seed)
+    start = time.perf_counter()
+    placed = yard.allocate_batch(discharge)
+    elapsed = time.perf_counter() - start
+    missed = placed['Block'].isna().sum()
+    print(f"{len(discharge)} containers into {args.blocks} blocks ({yard.capacity} slots): "
+          f"{elapsed * 1e3:.0f} ms, {elapsed / len(discharge) * 1e6:.1f} us per container, {missed} without a slot")
+
+    rng = np.random.default_rng(args.seed)
+    queries = discharge.sample(1000, random_state=args.seed)
+    start = time.perf_counter()
+    for row in queries.itertuples():
+        yard.best_slot(row.Group, row.Weight, row.Reefer, row.DG)
+    print(f"best_slot query: {(time.perf_counter() - start) / len(queries) * 1e6:.1f} us")
+
+    released = rng.choice(placed.loc[placed['Block'].notna(), 'Container'], size=1000, replace=False)
+    start = time.perf_counter()
+    for container in released:
+        yard.release(container)
+    print(f"release: {(time.perf_counter() - start) / len(released) * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""Yard block re-handle simulation.
+
+A block of ``bays x rows`` stacks, each up to ``tiers`` high, is held as one
+NumPy array of container ids (``stacks[stack, tier]``, -1 when empty) and a
+height per stack. Two more per-stack arrays hold the vessel and predicted
+pickup time of the container on top, so a stacking policy can score every
+stack at once.
+
+``simulate()`` replays a stream of arrivals and pickups against a block.
+A pickup digs out every container above the target, and each of those
+re-handles is put back in another stack by the same policy. Policies are
+plain functions, registered in ``POLICIES``:
+
+- ``random``: any stack with room
+- ``by_vessel``: on the lowest stack topped by a container for the same
+  vessel, otherwise an empty stack, otherwise any stack with room
+- ``by_pickup``: on top of the container with the closest predicted pickup
+  that is later than this one's, so it should not block. If there is none,
+  the stack whose top leaves latest.
+
+``workload()`` generates a realistic mix. Export boxes arrive over the days
+before their vessel and are picked up at loading. Import boxes are
+discharged together and leave with trucks after a random dwell, which is
+only known as a noisy prediction. The replay runs at several million moves
+a minute on one core:
+
+    result = yard_sim.simulate(yard_sim.workload(200_000), 'by_pickup')
+    result['rehandle_pct']
+
+See benchmarks/bench_yard.py for a policy comparison at volume.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+ARRIVE, PICKUP = 0, 1
+
+
+class Block:
+    def __init__(self, bays=40, rows=6, tiers=5):
+        self.bays, self.rows, self.tiers = bays, rows, tiers
+        n = bays * rows
+        self.stacks = np.full((n, tiers), -1, dtype=np.int32)
+        self.height = np.zeros(n, dtype=np.int64)
+        self.top_vessel = np.full(n, -1, dtype=np.int64)
+        self.top_pickup = np.full(n, np.inf)
+
+    @property
+    def capacity(self):
+        return self.stacks.size
+
+
+class Replay:
+    # One replay: the block, where every container is, and the policy
+
+    def __init__(self, block, containers, policy, seed):
+        self.block = block
+        self.vessel = containers['vessel'].to_numpy(np.int64)
+        self.predicted = containers['predicted_pickup'].to_numpy(float)
+        self.stack_of = np.full(len(containers), -1, dtype=np.int64)
+        self.tier_of = np.full(len(containers), -1, dtype=np.int64)
+        self.rng = np.random.default_rng(seed)
+        self.choose = policy
+        self.stored = self.peak = self.overflow = 0
+
+    def put(self, box, exclude=-1):
+        block = self.block
+        room = block.height < block.tiers
+        if exclude >= 0:
+            room[exclude] = False
+        if not room.any():
+            # Block full: the box goes to another block
+            self.overflow += 1
+            return False
+        stack = self.choose(self, box, room)
+        tier = block.height[stack]
+        block.stacks[stack, tier] = box
+        block.height[stack] = tier + 1
+        block.top_vessel[stack] = self.vessel[box]
+        block.top_pickup[stack] = self.predicted[box]
+        self.stack_of[box], self.tier_of[box] = stack, tier
+        self.stored += 1
+        self.peak = max(self.peak, self.stored)
+        return True
+
+    def _pop(self, stack):
+        block = self.block
+        tier = block.height[stack] - 1
+        box = block.stacks[stack, tier]
+        block.stacks[stack, tier] = -1
+        block.height[stack] = tier
+        if tier:
+            below = block.stacks[stack, tier - 1]
+            block.top_vessel[stack] = self.vessel[below]
+            block.top_pickup[stack] = self.predicted[below]
+        else:
+            block.top_vessel[stack] = -1
+            block.top_pickup[stack] = np.inf
+        self.stack_of[box] = self.tier_of[box] = -1
+        self.stored -= 1
+        return box
+
+    def pick(self, box):
+        # Returns the number of re-handles needed to reach the box
+        stack, tier = self.stack_of[box], self.tier_of[box]
+        if stack < 0:
+            return 0
+        rehandles = 0
+        while self.block.height[stack] - 1 > tier:
+            blocker = self._pop(stack)
+            self.put(blocker, exclude=stack)
+            rehandles += 1
+        self._pop(stack)
+        return rehandles
+
+
+# Stacking policies: (replay, box, room) -> stack index, where room marks the
+# stacks the box may go on. The Replay exposes the block and per-box
+# `vessel`, `predicted` and `rng`; any function of that shape can be passed
+# to simulate().
+
+def random_stack(replay, box, room):
+    candidates = np.flatnonzero(room)
+    return candidates[replay.rng.integers(len(candidates))]
+
+
+def by_vessel(replay, box, room):
+    block = replay.block
+    same = np.flatnonzero(room & (block.top_vessel == replay.vessel[box]))
+    if len(same):
+        return same[np.argmin(block.height[same])]
+    empty = np.flatnonzero(block.height == 0)
+    if len(empty):
+        return empty[0]
+    return random_stack(replay, box, room)
+
+
+def by_pickup(replay, box, room):
+    # Empty stacks have an infinite top pickup, so they are only chosen
+    # when no non-empty stack fits. Equal predictions do not fit: boxes
+    # for the same vessel leave in loading order, which is not known here.
+    slack = replay.block.top_pickup - replay.predicted[box]
+    candidates = np.flatnonzero(room & (slack > 0))
+    if len(candidates):
+        return candidates[np.argmin(slack[candidates])]
+    candidates = np.flatnonzero(room)
+    return candidates[np.argmax(slack[candidates])]
+
+
+POLICIES = {'random': random_stack, 'by_vessel': by_vessel, 'by_pickup': by_pickup}
+
+
+def workload(n, block=None, occupancy=0.6, import_share=0.5, boxes_per_vessel=60,
+             prediction_error=0.5, seed=0):
+    # n containers for a block, spread over a horizon that keeps the block
+    # about `occupancy` full. Times are in hours.
+    block = block or Block()
+    rng = np.random.default_rng(seed)
+    vessels = max(n // boxes_per_vessel, 1)
+    vessel = rng.integers(vessels, size=n)
+    imports = rng.random(n) < import_share
+
+    # Export: arrive 0.5-5 days before the vessel, loaded within 12 hours of it
+    # Import: discharged within 12 hours, collected after a lognormal dwell
+    dwell = np.where(imports, rng.lognormal(np.log(60), 0.6, size=n), rng.uniform(12, 120, size=n))
+    horizon = n * dwell.mean() / (occupancy * block.capacity)
+    vessel_time = np.sort(rng.uniform(0, horizon, size=vessels))[vessel]
+    handling = rng.uniform(0, 12, size=n)
+
+    arrival = np.where(imports, vessel_time + handling, vessel_time - dwell)
+    pickup = np.where(imports, arrival + dwell, vessel_time + handling)
+    # Exports know their vessel; an import's truck pickup is only predicted
+    noise = rng.lognormal(0, prediction_error, size=n)
+    predicted = np.where(imports, arrival + dwell * noise, vessel_time)
+    return pd.DataFrame({
+        'vessel': np.where(imports, vessels + vessel, vessel),
+        'import': imports,
+        'arrival': arrival,
+        'pickup': pickup,
+        'predicted_pickup': predicted,
+    })
+
+
+def events(containers):
+    # Arrival and pickup events in time order: (kind, container) arrays
+    n = len(containers)
+    times = np.r_[containers['arrival'].to_numpy(), containers['pickup'].to_numpy()]
+    kinds = np.r_[np.full(n, ARRIVE), np.full(n, PICKUP)]
+    boxes = np.r_[np.arange(n), np.arange(n)]
+    order = np.lexsort((kinds, times))
+    return kinds[order], boxes[order]
+
+
+def simulate(containers, policy='by_pickup', block=None, seed=0):
+    # policy: a name from POLICIES or a policy function
+    choose = policy if callable(policy) else POLICIES.get(policy)
+    if choose is None:
+        raise ValueError(f"Unknown policy '{policy}' (expected one of {', '.join(POLICIES)})")
+    block = block or Block()
+    run = Replay(block, containers, choose, seed)
+    kinds, boxes = events(containers)
+
+    start = time.perf_counter()
+    arrivals = pickups = rehandles = 0
+    for kind, box in zip(kinds.tolist(), boxes.tolist()):
+        if kind == ARRIVE:
+            arrivals += run.put(box)
+        elif run.stack_of[box] >= 0:
+            rehandles += run.pick(box)
+            pickups += 1
+    elapsed = time.perf_counter() - start
+
+    # A re-handle lifts the box off and sets it down again
+    moves = arrivals + pickups + 2 * rehandles
+    return {
+        'policy': choose.__name__ if callable(policy) else policy,
+        'containers': len(containers),
+        'pickups': pickups,
+        'rehandles': rehandles,
+        'rehandle_pct': round(100 * rehandles / max(pickups, 1), 2),
+        'overflow': run.overflow,
+        'peak_fill_pct': round(100 * run.peak / block.capacity, 1),
+        'moves': moves,
+        'seconds': round(elapsed, 3),
+        'moves_per_min': int(moves / elapsed * 60) if elapsed else 0,
+    }
+
+
+def compare(containers, policies=POLICIES, bays=40, rows=6, tiers=5, seed=0):
+    return pd.DataFrame([simulate(containers, policy, Block(bays, rows, tiers), seed) for policy in policies])